@@ -1,7 +1,7 @@
 import logging
 from collections import defaultdict, deque
 from collections.abc import Callable, Iterable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Deque, Optional, TypedDict, TypeVar, cast
 
@@ -28,6 +28,7 @@ from sentry.search.utils import parse_datetime_string
 from sentry.snuba import discover
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.referrer import Referrer
+from sentry.utils.iterators import chunked
 from sentry.utils.numbers import base32_encode, format_grouped_length
 from sentry.utils.sdk import set_measurement
 from sentry.utils.snuba import bulk_snql_query
@@ -35,6 +36,9 @@ from sentry.utils.validators import INVALID_ID_DETAILS, is_event_id
 
 logger: logging.Logger = logging.getLogger(__name__)
 MAX_TRACE_SIZE: int = 100
+# Number of transactions whose nodestore data is fetched with a single multi-get
+NODESTORE_BATCH_SIZE: int = 100
+NODESTORE_MAX_WORKERS: int = 20
 
 
 _T = TypeVar("_T")
@@ -159,6 +163,8 @@ class TraceEvent:
         light: bool = False,
         snuba_params: ParamsType | None = None,
         span_serialized: bool = False,
+        groups: Mapping[int, Group] | None = None,
+        nodestore_events: Mapping[str, Event | None] | None = None,
     ) -> None:
         self.event: SnubaTransaction = event
         self.errors: list[TraceError] = []
@@ -173,12 +179,19 @@ class TraceEvent:
         self._nodestore_event: Event | None = None
         self.fetched_nodestore: bool = span_serialized
         self.span_serialized = span_serialized
+        # Groups and nodestore events prefetched for the whole trace, when available
+        self._groups = groups
+        self._nodestore_events = nodestore_events
         if len(self.event["issue.ids"]) > 0:
             self.load_performance_issues(light, snuba_params)
 
     @property
     def nodestore_event(self) -> Event | None:
         if self._nodestore_event is None and not self.fetched_nodestore:
+            if self._nodestore_events is not None and self.event["id"] in self._nodestore_events:
+                self.fetched_nodestore = True
+                self._nodestore_event = self._nodestore_events[self.event["id"]]
+                return self._nodestore_event
             with sentry_sdk.start_span(op="nodestore", description="get_event_by_id"):
                 self.fetched_nodestore = True
                 self._nodestore_event = eventstore.backend.get_event_by_id(
@@ -189,7 +202,12 @@ class TraceEvent:
     def load_performance_issues(self, light: bool, snuba_params: ParamsType) -> None:
         """Doesn't get suspect spans, since we don't need that for the light view"""
         for group_id in self.event["issue.ids"]:
-            group = Group.objects.filter(id=group_id, project=self.event["project.id"]).first()
+            if self._groups is not None:
+                group = self._groups.get(group_id)
+                if group is not None and group.project_id != self.event["project.id"]:
+                    group = None
+            else:
+                group = Group.objects.filter(id=group_id, project=self.event["project.id"]).first()
             if group is None:
                 continue
 
@@ -361,6 +379,15 @@ class TraceEvent:
         return result
 
 
+def get_trace_groups(transactions: Sequence[SnubaTransaction]) -> dict[int, Group]:
+    """Fetches the groups of every performance issue in the trace with a single query"""
+    group_ids = {group_id for transaction in transactions for group_id in transaction["issue.ids"]}
+    if not group_ids:
+        return {}
+    with sentry_sdk.start_span(op="trace", description="get_trace_groups"):
+        return {group.id: group for group in Group.objects.filter(id__in=group_ids)}
+
+
 def find_timestamp_params(transactions: Sequence[SnubaTransaction]) -> dict[str, datetime | None]:
     min_timestamp = None
     max_timestamp = None
@@ -1095,25 +1122,29 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
                 child.generation = parent.generation + 1 if parent.generation is not None else None
                 parents.append(child)
 
-    # Concurrently fetches nodestore data to construct and return a dict mapping eventid of a txn
-    # to the associated nodestore event.
+    # Fetches nodestore data in concurrent multi-get batches to construct and return a dict mapping
+    # eventid of a txn to the associated nodestore event, or None when it's missing from nodestore.
     @staticmethod
     def nodestore_event_map(events: Sequence[SnubaTransaction]) -> dict[str, Event | None]:
-        map = {}
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            future_to_event = {
-                executor.submit(
-                    eventstore.backend.get_event_by_id, event["project.id"], event["id"]
-                ): event
-                for event in events
-            }
-
-            for future in as_completed(future_to_event):
-                event_id = future_to_event[future]["id"]
-                nodestore_event = future.result()
-                map[event_id] = nodestore_event
+        nodestore_events = {
+            event["id"]: Event(project_id=event["project.id"], event_id=event["id"])
+            for event in events
+        }
+        batches = list(chunked(nodestore_events.values(), NODESTORE_BATCH_SIZE))
+        with sentry_sdk.start_span(op="nodestore", description="bind_nodes"):
+            if len(batches) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(batches), NODESTORE_MAX_WORKERS)
+                ) as executor:
+                    list(executor.map(eventstore.backend.bind_nodes, batches))
+            else:
+                for batch in batches:
+                    eventstore.backend.bind_nodes(batch)
 
-        return map
+        return {
+            event_id: event if len(event.data) > 0 else None
+            for event_id, event in nodestore_events.items()
+        }
 
     def serialize(
         self,
@@ -1145,6 +1176,7 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
             )
             return results
         event_id_to_nodestore_event = self.nodestore_event_map(transactions)
+        groups = get_trace_groups(transactions)
         parent_map = self.construct_parent_map(transactions)
         error_map = self.construct_error_map(errors)
         parent_events: dict[str, TraceEvent] = {}
@@ -1158,7 +1190,14 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
         if roots:
             results_map[None] = []
         for root in roots:
-            root_event = TraceEvent(root, None, 0, snuba_params=params)
+            root_event = TraceEvent(
+                root,
+                None,
+                0,
+                snuba_params=params,
+                groups=groups,
+                nodestore_events=event_id_to_nodestore_event,
+            )
             parent_events[root["id"]] = root_event
             results_map[None].append(root_event)
             to_check.append(root)
@@ -1179,7 +1218,12 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
                         parent_map[parent_span_id] = siblings
 
                     previous_event = parent_events[current_event["id"]] = TraceEvent(
-                        current_event, None, 0, snuba_params=params
+                        current_event,
+                        None,
+                        0,
+                        snuba_params=params,
+                        groups=groups,
+                        nodestore_events=event_id_to_nodestore_event,
                     )
 
                     # Used to avoid removing the orphan from results entirely if we loop
@@ -1205,7 +1249,8 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
                     previous_event.fetched_nodestore = True
                     nodestore_event = event_id_to_nodestore_event[previous_event_id]
                     previous_event._nodestore_event = nodestore_event
-                    spans = nodestore_event.data.get("spans", [])
+                    if nodestore_event is not None:
+                        spans = nodestore_event.data.get("spans", [])
 
                 # Need to include the transaction as a span as well
                 #
@@ -1252,6 +1297,8 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
                             if previous_event.generation is not None
                             else None,
                             snuba_params=params,
+                            groups=groups,
+                            nodestore_events=event_id_to_nodestore_event,
                         )
                         # Add this event to its parent's children
                         previous_event.children.append(parent_events[child_event["id"]])
@@ -1331,13 +1378,14 @@ class OrganizationEventsTraceEndpoint(OrganizationEventsTraceEndpointBase):
         if detailed:
             raise ParseError("Cannot return a detailed response using Spans")
 
+        groups = get_trace_groups(transactions)
         with sentry_sdk.start_span(op="serialize", description="create parent map"):
             parent_to_children_event_map = defaultdict(list)
             serialized_transactions = []
             for transaction in transactions:
                 parent_id = transaction["trace.parent_transaction"]
                 serialized_transaction = TraceEvent(
-                    transaction, parent_id, -1, span_serialized=True
+                    transaction, parent_id, -1, span_serialized=True, groups=groups
                 )
                 if parent_id is None:
                     if transaction["trace.parent_span"]:
@@ -5,7 +5,7 @@ from collections import namedtuple
 from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import Any, Literal, NamedTuple, Union
 
 import sentry_sdk
@@ -1172,6 +1172,29 @@ QueryOp = Literal["AND", "OR"]
 QueryToken = Union[SearchFilter, QueryOp, ParenExpression]
 
 
+# Parse trees only depend on the query string, so they are shared between
+# calls. The visited output is not cached since it depends on the config,
+# params and builder, and on the current time for relative date filters.
+PARSE_TREE_CACHE_SIZE = 1000
+# Avoid holding on to the trees of unusually large queries
+MAX_CACHED_QUERY_LENGTH = 2000
+
+
+@lru_cache(maxsize=PARSE_TREE_CACHE_SIZE)
+def _parse_cached_search_tree(query: str) -> Node:
+    return event_search_grammar.parse(query)
+
+
+def parse_search_tree(query: str) -> Node:
+    """
+    Parses a query into its parse tree. Trees of commonly repeated queries are
+    cached, callers must treat the returned tree as read only.
+    """
+    if isinstance(query, str) and len(query) <= MAX_CACHED_QUERY_LENGTH:
+        return _parse_cached_search_tree(query)
+    return event_search_grammar.parse(query)
+
+
 @sentry_sdk.tracing.trace
 def parse_search_query(
     query, config=None, params=None, builder=None, config_overrides=None
@@ -1182,7 +1205,7 @@ def parse_search_query(
         config = default_config
 
     try:
-        tree = event_search_grammar.parse(query)
+        tree = parse_search_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
@@ -9,9 +9,12 @@ from urllib.parse import quote
 
 from django.core.exceptions import EmptyResultSet, ObjectDoesNotExist
 from django.db import connections
+from django.db.models import Q
 from django.db.models.functions import Lower
 
+from sentry.utils.cache import cache
 from sentry.utils.cursors import Cursor, CursorResult, build_cursor
+from sentry.utils.hashlib import md5_text
 from sentry.utils.pagination_factory import PaginatorLike
 
 quote_name = connections["default"].ops.quote_name
@@ -22,9 +25,16 @@ logger = logging.getLogger()
 MAX_LIMIT = 100
 MAX_HITS_LIMIT = 1000
 MAX_SNUBA_ELEMENTS = 10000
+HITS_CACHE_TTL = 60
 
 
-def count_hits(queryset, max_hits):
+def count_hits(queryset, max_hits, cache_ttl=None):
+    """
+    Count the rows of `queryset`, up to `max_hits`.
+
+    With a `cache_ttl` the count is cached for that many seconds, keyed by the SQL of the
+    count query, so any two querysets with the same filters share it.
+    """
     if not max_hits:
         return 0
     hits_query = queryset.values()[:max_hits].query
@@ -36,9 +46,24 @@ def count_hits(queryset, max_hits):
         h_sql, h_params = hits_query.sql_with_params()
     except EmptyResultSet:
         return 0
-    cursor = connections[queryset.using_replica().db].cursor()
+    db = queryset.using_replica().db
+
+    cache_key = None
+    if cache_ttl:
+        cache_key = "api.paginator.hits:{}".format(
+            md5_text(db, h_sql, repr(h_params)).hexdigest()
+        )
+        hits = cache.get(cache_key)
+        if hits is not None:
+            return hits
+
+    cursor = connections[db].cursor()
     cursor.execute(f"SELECT COUNT(*) FROM ({h_sql}) as t", h_params)
-    return cursor.fetchone()[0]
+    hits = cursor.fetchone()[0]
+
+    if cache_key is not None:
+        cache.set(cache_key, hits, cache_ttl)
+    return hits
 
 
 class BadPaginationError(Exception):
@@ -56,6 +81,9 @@ class MissingPaginationError(Exception):
 
 
 class BasePaginator:
+    # Seconds to cache hit counts for, they are not cached when None.
+    hits_cache_ttl: int | None = None
+
     def __init__(
         self, queryset, order_by=None, max_limit=MAX_LIMIT, on_results=None, post_query_filter=None
     ):
@@ -211,7 +239,7 @@ class BasePaginator:
         return cursor
 
     def count_hits(self, max_hits):
-        return count_hits(self.queryset, max_hits)
+        return count_hits(self.queryset, max_hits, cache_ttl=self.hits_cache_ttl)
 
 
 class Paginator(BasePaginator):
@@ -237,6 +265,94 @@ class DateTimePaginator(BasePaginator):
         )
 
 
+class KeysetPaginator(Paginator):
+    """
+    Paginates over an integer key with strict keyset cursors.
+
+    Rows are ordered by the key and then by `id`. Each cursor holds the key of the row
+    its page ends on as the value and that row's `id` as the offset. Every page is fetched
+    with a range condition rather than an OFFSET, so deep pages cost the same as the first.
+
+    Hit counts are cached for `hits_cache_ttl` seconds. Within that window `X-Hits` may
+    drift from the current number of rows by the rows created or deleted since it was
+    counted.
+    """
+
+    hits_cache_ttl = HITS_CACHE_TTL
+
+    def build_keyset_queryset(self, cursor):
+        assert self.key
+        asc = self._is_asc(cursor.is_prev)
+
+        order_by = [self.key] if self.key == "id" else [self.key, "id"]
+        queryset = self.queryset.order_by(*(key if asc else f"-{key}" for key in order_by))
+
+        if cursor.value or cursor.offset:
+            value = self.value_from_cursor(cursor)
+            op = "gt" if asc else "lt"
+            queryset = queryset.filter(
+                Q(**{f"{self.key}__{op}": value})
+                | Q(**{self.key: value, f"id__{op}": cursor.offset})
+            )
+
+        return queryset
+
+    def get_result(self, limit=100, cursor=None, count_hits=False, known_hits=None, max_hits=None):
+        if cursor is None:
+            cursor = Cursor(0, 0, 0)
+
+        limit = min(limit, self.max_limit)
+        has_position = bool(cursor.value or cursor.offset)
+
+        if max_hits is None:
+            max_hits = MAX_HITS_LIMIT
+        if count_hits:
+            hits = self.count_hits(max_hits)
+        elif known_hits is not None:
+            hits = known_hits
+        else:
+            hits = None
+
+        queryset = self.build_keyset_queryset(cursor)
+        results = list(queryset[: limit + 1])
+        has_more = len(results) > limit
+        results = results[:limit]
+
+        if cursor.is_prev:
+            results.reverse()
+            has_prev, has_next = has_more, True
+        else:
+            has_prev, has_next = has_position, has_more
+
+        if results:
+            prev_cursor = Cursor(self.get_item_key(results[0]), results[0].id, True, has_prev)
+            next_cursor = Cursor(self.get_item_key(results[-1]), results[-1].id, False, has_next)
+        elif cursor.is_prev:
+            # Nothing comes before the cursor, so the next page starts from the beginning.
+            prev_cursor = Cursor(cursor.value, cursor.offset, True, False)
+            next_cursor = Cursor(0, 0, False, has_next)
+        else:
+            # The previous page must include the row the cursor points at, so the id is moved
+            # one past it in the direction the previous page is fetched in.
+            prev_offset = cursor.offset - 1 if self._is_asc(True) else cursor.offset + 1
+            prev_cursor = Cursor(cursor.value, prev_offset, True, has_prev)
+            next_cursor = Cursor(cursor.value, cursor.offset, False, False)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        if self.post_query_filter:
+            results = self.post_query_filter(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=hits,
+            max_hits=max_hits if count_hits else None,
+        )
+
+
 # TODO(dcramer): previous cursors are too complex at the moment for many things
 # and are only useful for polling situations. The OffsetPaginator ignores them
 # entirely and uses standard paging
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Mapping, MutableMapping, Sequence
-from typing import Any, TypeVar
+import threading
+from collections.abc import Callable, Generator, Hashable, Mapping, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
 
 import sentry_sdk
 from django.contrib.auth.models import AnonymousUser
+from django.db import connections
 
+from sentry import options
 from sentry.utils.json import JSONData
 
 logger = logging.getLogger(__name__)
 
 K = TypeVar("K")
+T = TypeVar("T")
 
 registry: MutableMapping[Any, Any] = {}
 
+# Holds the results of the lookups run while serializing a response, see `run_lookups`.
+_lookup_results = threading.local()
+
 
 def register(type: Any) -> Callable[[type[K]], type[K]]:
     """A wrapper that adds the wrapped Serializer to the Serializer registry (see above) for the key `type`."""
@@ -63,7 +73,9 @@ def serialize(
                 pass
         else:
             return objects
-    with sentry_sdk.start_span(op="serialize", description=type(serializer).__name__) as span:
+    with _lookup_scope(), sentry_sdk.start_span(
+        op="serialize", description=type(serializer).__name__
+    ) as span:
         span.set_data("Object Count", len(objects))
 
         with sentry_sdk.start_span(op="serialize.get_attrs", description=type(serializer).__name__):
@@ -79,6 +91,76 @@ def serialize(
             return [serializer(o, attrs=attrs.get(o, {}), user=user, **kwargs) for o in objects]
 
 
+@dataclass(frozen=True)
+class Lookup(Generic[T]):
+    """
+    An independent query needed by a serializer's `get_attrs`.
+
+    Lookups with equal keys are run only once while serializing a response, so nested
+    serializers that need the same data share the result. The key must identify everything
+    the result depends on.
+    """
+
+    key: Hashable
+    func: Callable[[], T]
+
+
+@contextmanager
+def _lookup_scope() -> Generator[None, None, None]:
+    # Only the outermost call to `serialize` owns the results, nested serializers share them.
+    if getattr(_lookup_results, "results", None) is not None:
+        yield
+        return
+
+    _lookup_results.results = {}
+    try:
+        yield
+    finally:
+        _lookup_results.results = None
+
+
+def _run_lookup_in_thread(lookup: Lookup[T]) -> T:
+    try:
+        return lookup.func()
+    finally:
+        # Worker threads open their own database connections, close them before the
+        # thread is handed back to the pool.
+        connections.close_all()
+
+
+def run_lookups(lookups: Sequence[Lookup[Any]]) -> list[Any]:
+    """
+    Run the independent lookups of a serializer's `get_attrs` and return their results in order.
+
+    Up to `api.serializers.lookup-concurrency` lookups run concurrently, each on its own
+    database connection. Lookups that were already run for the response being serialized are
+    not run again.
+    """
+    results: dict[Hashable, Any] | None = getattr(_lookup_results, "results", None)
+    if results is None:
+        results = {}
+
+    pending: dict[Hashable, Lookup[Any]] = {}
+    for lookup in lookups:
+        if lookup.key not in results:
+            pending.setdefault(lookup.key, lookup)
+
+    max_workers = min(options.get("api.serializers.lookup-concurrency"), len(pending))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                key: executor.submit(_run_lookup_in_thread, lookup)
+                for key, lookup in pending.items()
+            }
+            for key, future in futures.items():
+                results[key] = future.result()
+    else:
+        for key, lookup in pending.items():
+            results[key] = lookup.func()
+
+    return [results[lookup.key] for lookup in lookups]
+
+
 class Serializer:
     """A Serializer class contains the logic to serialize a specific type of object."""
 
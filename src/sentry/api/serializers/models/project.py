@@ -12,7 +12,7 @@ from django.db.models.aggregates import Count
 from django.utils import timezone
 
 from sentry import features, options, projectoptions, release_health, roles
-from sentry.api.serializers import Serializer, register, serialize
+from sentry.api.serializers import Lookup, Serializer, register, run_lookups, serialize
 from sentry.api.serializers.models.plugin import PluginSerializer
 from sentry.api.serializers.models.team import get_org_roles
 from sentry.api.serializers.types import OrganizationSerializerResponse, SerializedAvatarFields
@@ -334,11 +334,39 @@ class ProjectSerializer(Serializer):
             project_ids = [o.id for o in item_list]
 
             if self.stats_period:
-                stats = self.get_stats(project_ids, "!event.type:transaction")
+                # The stats are independent queries, so they can run concurrently.
+                stats_key = (
+                    tuple(project_ids),
+                    self.stats_period,
+                    self.environment_id,
+                    self.dataset,
+                )
+                lookups = [
+                    Lookup(
+                        key=("project.stats", "!event.type:transaction", *stats_key),
+                        func=lambda: self.get_stats(project_ids, "!event.type:transaction"),
+                    )
+                ]
+                if self._expand("transaction_stats"):
+                    lookups.append(
+                        Lookup(
+                            key=("project.stats", "event.type:transaction", *stats_key),
+                            func=lambda: self.get_stats(project_ids, "event.type:transaction"),
+                        )
+                    )
+                if self._expand("session_stats"):
+                    lookups.append(
+                        Lookup(
+                            key=("project.session_stats", *stats_key),
+                            func=lambda: self.get_session_stats(project_ids),
+                        )
+                    )
+
+                stats, *other_stats = run_lookups(lookups)
                 if self._expand("transaction_stats"):
-                    transaction_stats = self.get_stats(project_ids, "event.type:transaction")
+                    transaction_stats = other_stats.pop(0)
                 if self._expand("session_stats"):
-                    session_stats = self.get_session_stats(project_ids)
+                    session_stats = other_stats.pop(0)
 
         with measure_span("options"):
             options = None
@@ -13,6 +13,7 @@ __all__ = [
 ]
 
 import abc
+from collections import defaultdict
 from collections.abc import Collection, Iterable, Mapping
 from dataclasses import dataclass
 from functools import cached_property
@@ -32,6 +33,7 @@ from sentry.models.organization import Organization
 from sentry.models.organizationmember import OrganizationMember
 from sentry.models.organizationmemberteam import OrganizationMemberTeam
 from sentry.models.project import Project
+from sentry.models.projectteam import ProjectTeam
 from sentry.models.team import Team, TeamStatus
 from sentry.models.user import User
 from sentry.roles import organization_roles
@@ -188,10 +190,57 @@ class Access(abc.ABC):
         """
         return self.has_any_project_scope(project, [scope])
 
+    def has_projects_scope(self, projects: Iterable[Project], scope: str) -> bool:
+        """
+        Return bool representing if a user should have access with the given scope to information
+        for every requested project.
+
+        The teams of all the projects are fetched with a single query, prefer this over multiple
+        calls to `has_project_scope`.
+
+        >>> access.has_projects_scope(projects, 'project:read')
+        """
+        projects = list(projects)
+        if not self.has_scope(scope):
+            self._prefetch_project_team_ids(projects)
+        return all(self.has_project_scope(project, scope) for project in projects)
+
     @abc.abstractmethod
     def has_any_project_scope(self, project: Project, scopes: Collection[str]) -> bool:
         pass
 
+    def _prefetch_project_team_ids(self, projects: Iterable[Project]) -> None:
+        """
+        Load the teams of the given projects ahead of `has_any_project_scope` calls, for access
+        types whose project scopes depend on team memberships.
+        """
+
+    @cached_property
+    def _project_team_ids(self) -> dict[int, frozenset[int]]:
+        return {}
+
+    def _get_project_team_ids(self, projects: Iterable[Project]) -> Mapping[int, frozenset[int]]:
+        """
+        Return the IDs of the teams of each project, keyed by project ID.
+
+        The relations are memoized for the lifetime of the access object, so only projects that
+        were not seen before are queried.
+        """
+        missing_project_ids = {
+            project.id for project in projects if project.id not in self._project_team_ids
+        }
+        if missing_project_ids:
+            team_ids: defaultdict[int, set[int]] = defaultdict(set)
+            for project_id, team_id in ProjectTeam.objects.filter(
+                project_id__in=missing_project_ids
+            ).values_list("project_id", "team_id"):
+                team_ids[project_id].add(team_id)
+
+            for project_id in missing_project_ids:
+                self._project_team_ids[project_id] = frozenset(team_ids[project_id])
+
+        return self._project_team_ids
+
 
 @dataclass
 class DbAccess(Access):
@@ -290,6 +339,16 @@ class DbAccess(Access):
         """
         return self.project_ids_with_team_membership
 
+    @cached_property
+    def _has_team_roles(self) -> bool:
+        return self._member is not None and features.has(
+            "organizations:team-roles", self._member.organization
+        )
+
+    def _prefetch_project_team_ids(self, projects: Iterable[Project]) -> None:
+        if self._member and self._has_team_roles:
+            self._get_project_team_ids(projects)
+
     def has_role_in_organization(
         self, role: str, organization: Organization, user_id: int | None
     ) -> bool:
@@ -346,12 +405,13 @@ class DbAccess(Access):
         if any(self.has_scope(scope) for scope in scopes):
             return True
 
-        if self._member and features.has("organizations:team-roles", self._member.organization):
+        if self._member and self._has_team_roles:
             with sentry_sdk.start_span(op="check_access_for_all_project_teams") as span:
+                project_team_ids = self._get_project_team_ids([project])[project.id]
                 memberships = [
-                    self._team_memberships[team]
-                    for team in project.teams.all()
-                    if team in self._team_memberships
+                    membership
+                    for team, membership in self._team_memberships.items()
+                    if team.id in project_team_ids
                 ]
                 span.set_tag("organization", self._member.organization.id)
                 span.set_tag("organization.slug", self._member.organization.slug)
@@ -407,6 +467,16 @@ class RpcBackedAccess(Access):
     def permissions(self) -> frozenset[str]:
         return frozenset(self.auth_state.permissions)
 
+    @cached_property
+    def _has_team_roles(self) -> bool:
+        return features.has(
+            "organizations:team-roles", self.rpc_user_organization_context.organization
+        )
+
+    def _prefetch_project_team_ids(self, projects: Iterable[Project]) -> None:
+        if self.rpc_user_organization_context.member and self._has_team_roles:
+            self._get_project_team_ids(projects)
+
     @property
     def sso_is_valid(self) -> bool:
         return self.auth_state.sso_state.is_valid
@@ -556,11 +626,9 @@ class RpcBackedAccess(Access):
         if any(self.has_scope(scope) for scope in scopes):
             return True
 
-        if self.rpc_user_organization_context.member and features.has(
-            "organizations:team-roles", self.rpc_user_organization_context.organization
-        ):
+        if self.rpc_user_organization_context.member and self._has_team_roles:
             with sentry_sdk.start_span(op="check_access_for_all_project_teams") as span:
-                project_teams_id = set(project.teams.values_list("id", flat=True))
+                project_teams_id = self._get_project_team_ids([project])[project.id]
                 orgmember_teams = self.rpc_user_organization_context.member.member_teams
                 span.set_tag("organization", self.rpc_user_organization_context.organization.id)
                 span.set_tag(
@@ -131,11 +131,25 @@ def create_encrypted_export_tarball(json_export: json.JSONData, encryptor: Encry
     risks breaking assumptions that the decryption side will make on the other end!
     """
 
+    return create_encrypted_export_tarball_from_bytes(
+        json.dumps(json_export).encode("utf-8"), encryptor
+    )
+
+
+def create_encrypted_export_tarball_from_bytes(
+    json_export: bytes, encryptor: Encryptor
+) -> io.BytesIO:
+    """
+    Identical to `create_encrypted_export_tarball`, but takes JSON data that has already been
+    serialized, so that callers which write their export incrementally never need to hold the
+    decoded models in memory.
+    """
+
     # Generate a new DEK (data encryption key), and use that DEK to encrypt the JSON being exported.
     pem = encryptor.get_public_key_pem()
     data_encryption_key = Fernet.generate_key()
     backup_encryptor = Fernet(data_encryption_key)
-    encrypted_json_export = backup_encryptor.encrypt(json.dumps(json_export).encode("utf-8"))
+    encrypted_json_export = backup_encryptor.encrypt(json_export)
 
     # Encrypt the newly minted DEK using asymmetric public key encryption.
     dek_encryption_key = serialization.load_pem_public_key(pem, default_backend())
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import io
-from typing import BinaryIO
+import shutil
+import tempfile
+from typing import BinaryIO, TextIO
 
-from sentry.backup.crypto import Encryptor, create_encrypted_export_tarball
+from sentry.backup.crypto import Encryptor, create_encrypted_export_tarball_from_bytes
 from sentry.backup.dependencies import (
     PrimaryKeyMap,
     dependencies,
@@ -39,6 +41,32 @@ class ExportingError(Exception):
         self.context = context
 
 
+class _JSONArrayWriter:
+    """
+    Incrementally writes a single top-level JSON array, one serialized model batch at a time.
+
+    The output is byte for byte what `json.dump` produces for the list of all the models, so the
+    export format is the same as when the whole export was held in memory.
+    """
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+        self.empty = True
+        self.out.write("[")
+
+    def write_batch(self, json_data: str) -> None:
+        # Each exporter returns its models as a JSON array rendered with its own `indent`, so the
+        # models of a single batch are re-encoded to keep the output compact.
+        for json_model in json.iter_array(json_data):
+            if not self.empty:
+                self.out.write(",")
+            self.out.write(json.dumps(json_model))
+            self.empty = False
+
+    def close(self) -> None:
+        self.out.write("]")
+
+
 def _export(
     dest: BinaryIO,
     scope: ExportScope,
@@ -66,7 +94,6 @@ def _export(
         printer.echo(errText, err=True)
         raise RuntimeError(errText)
 
-    json_export = []
     pk_map = PrimaryKeyMap()
     allowed_relocation_scopes = scope.value
     filters = []
@@ -93,55 +120,65 @@ def _export(
         else:
             raise ValueError("Filter arguments must only apply to `Organization` or `User` models")
 
-    # TODO(getsentry/team-ospo#190): Another optimization opportunity to use a generator with ijson # to print the JSON objects in a streaming manner.
-    for model in sorted_dependencies():
-        from sentry.db.models.base import BaseModel
-
-        if not issubclass(model, BaseModel):
-            continue
-
-        possible_relocation_scopes = model.get_possible_relocation_scopes()
-        includable = possible_relocation_scopes & allowed_relocation_scopes
-        if not includable or model._meta.proxy:
-            continue
-
-        model_name = get_model_name(model)
-        model_relations = dependencies().get(model_name)
-        if not model_relations:
-            continue
-
-        dep_models = {get_model_name(d) for d in model_relations.get_dependencies_for_relocation()}
-        export_by_model = ImportExportService.get_exporter_for_model(model)
-        result = export_by_model(
-            model_name=str(model_name),
-            scope=RpcExportScope.into_rpc(scope),
-            from_pk=0,
-            filter_by=[RpcFilter.into_rpc(f) for f in filters],
-            pk_map=RpcPrimaryKeyMap.into_rpc(pk_map.partition(dep_models)),
-            indent=indent,
-        )
-
-        if isinstance(result, RpcExportError):
-            printer.echo(result.pretty(), err=True)
-            raise ExportingError(result)
-
-        pk_map.extend(result.mapped_pks.from_rpc())
-
-        # TODO(getsentry/team-ospo#190): Since the structure of this data is very predictable (an
-        # array of serialized model objects), we could probably avoid re-ingesting the JSON string
-        # as a future optimization.
-        for json_model in json.loads(result.json_data):
-            json_export.append(json_model)
-
-    # If no `encryptor` argument was passed in, this is an unencrypted export, so we can just dump
-    # the JSON into the `dest` file and exit early.
-    if encryptor is None:
-        dest_wrapper = io.TextIOWrapper(dest, encoding="utf-8", newline="")
-        json.dump(json_export, dest_wrapper)
-        dest_wrapper.detach()
-        return
-
-    dest.write(create_encrypted_export_tarball(json_export, encryptor).getvalue())
+    # Models are streamed into a temporary file one batch at a time, so that we only ever hold a
+    # single model's worth of exported JSON in memory. Nothing is written to `dest` until every
+    # model has been exported, so a failed export leaves it untouched.
+    with tempfile.TemporaryFile() as buffer:
+        out = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+        try:
+            writer = _JSONArrayWriter(out)
+            for model in sorted_dependencies():
+                from sentry.db.models.base import BaseModel
+
+                if not issubclass(model, BaseModel):
+                    continue
+
+                possible_relocation_scopes = model.get_possible_relocation_scopes()
+                includable = possible_relocation_scopes & allowed_relocation_scopes
+                if not includable or model._meta.proxy:
+                    continue
+
+                model_name = get_model_name(model)
+                model_relations = dependencies().get(model_name)
+                if not model_relations:
+                    continue
+
+                dep_models = {
+                    get_model_name(d) for d in model_relations.get_dependencies_for_relocation()
+                }
+                export_by_model = ImportExportService.get_exporter_for_model(model)
+                result = export_by_model(
+                    model_name=str(model_name),
+                    scope=RpcExportScope.into_rpc(scope),
+                    from_pk=0,
+                    filter_by=[RpcFilter.into_rpc(f) for f in filters],
+                    pk_map=RpcPrimaryKeyMap.into_rpc(pk_map.partition(dep_models)),
+                    indent=indent,
+                )
+
+                if isinstance(result, RpcExportError):
+                    printer.echo(result.pretty(), err=True)
+                    raise ExportingError(result)
+
+                pk_map.extend(result.mapped_pks.from_rpc())
+                writer.write_batch(result.json_data)
+
+            writer.close()
+        finally:
+            # Keep the temporary file open, it is closed when leaving the `with` block.
+            out.flush()
+            out.detach()
+
+        buffer.seek(0)
+
+        # If no `encryptor` argument was passed in, this is an unencrypted export, so we can just
+        # copy the JSON into the `dest` file. Otherwise, wrap it in an encrypted tarball, which
+        # encrypts the whole JSON as a single token.
+        if encryptor is None:
+            shutil.copyfileobj(buffer, dest)
+        else:
+            tarball = create_encrypted_export_tarball_from_bytes(buffer.read(), encryptor)
+            dest.write(tarball.getvalue())
 
 
 def export_in_user_scope(
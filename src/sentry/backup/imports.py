@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import BinaryIO
+from typing import Any, BinaryIO
 from uuid import uuid4
 
 from django.core import serializers
+from django.core.serializers.base import DeserializedObject
 from django.db import DatabaseError, connections, router, transaction
 from django.db.models.base import Model
 
@@ -71,6 +72,26 @@ class ImportingError(Exception):
         self.context = context
 
 
+def _iter_json_models(content: str | bytes) -> Iterator[dict[str, Any]]:
+    """
+    Lazily parse the serialized models in an export, one at a time, removing any fields that we have
+    marked for deletion in `DELETED_FIELDS` along the way.
+    """
+
+    shimmed_models = set(DELETED_FIELDS.keys())
+    for json_model in json.iter_array(content):
+        if json_model["model"] in shimmed_models:
+            for field in DELETED_FIELDS[json_model["model"]]:
+                json_model["fields"].pop(field, None)
+
+        yield json_model
+
+
+def _deserialize_json_models(content: str | bytes) -> Iterator[DeserializedObject]:
+    for json_model in _iter_json_models(content):
+        yield from serializers.deserialize("python", [json_model])
+
+
 def _clear_model_tables_before_import():
     reversed = reversed_dependencies()
 
@@ -145,29 +166,15 @@ def _import(
     # workaround for now to enable forward progress.
     deferred_org_auth_tokens = None
 
-    # TODO(getsentry#team-ospo/190): Reading the entire export into memory as a string is quite
-    # wasteful - in the future, we should explore chunking strategies to enable a smaller memory
-    # footprint when processing super large (>100MB) exports.
+    # TODO(getsentry#team-ospo/190): The encrypted export is a single Fernet token, so the decrypted
+    # JSON string still has to be held in memory in its entirety. We avoid decoding all of it at once
+    # though: models are parsed one at a time as they are consumed (see `_iter_json_models`).
     content = (
         decrypt_encrypted_tarball(src, decryptor)
         if decryptor is not None
         else src.read().decode("utf-8")
     )
 
-    if len(DELETED_FIELDS) > 0:
-        # Parse the content JSON and remove and fields that we have marked for deletion in the
-        # function.
-        shimmed_models = set(DELETED_FIELDS.keys())
-        content_as_json = json.loads(content)  # type: ignore
-        for json_model in content_as_json:
-            if json_model["model"] in shimmed_models:
-                fields_to_remove = DELETED_FIELDS[json_model["model"]]
-                for field in fields_to_remove:
-                    json_model["fields"].pop(field, None)
-
-        # Return the content to byte form, as that is what the Django deserializer expects.
-        content = json.dumps(content_as_json)
-
     filters = []
     if filter_by is not None:
         filters.append(filter_by)
@@ -187,11 +194,10 @@ def _import(
             user_filter: Filter[int] = Filter(model=User, field="pk")
             filters.append(user_filter)
 
-            # TODO(getsentry#team-ospo/190): It turns out that Django's "streaming" JSON
-            # deserializer does no such thing, and actually loads the entire JSON into memory! If we
-            # don't want to choke on large imports, we'll need use a truly "chunkable" JSON
-            # importing library like ijson for this.
-            for obj in serializers.deserialize("json", content):
+            # Django's "streaming" JSON deserializer actually loads the entire JSON into memory, so
+            # we parse the models one by one instead, and hand each of them to the (truly lazy)
+            # Python deserializer.
+            for obj in _deserialize_json_models(content):
                 o = obj.object
                 model_name = get_model_name(o)
                 if model_name == user_model_name:
@@ -216,7 +222,7 @@ def _import(
                     break
         elif filter_by.model == User:
             seen_first_user_model = False
-            for obj in serializers.deserialize("json", content):
+            for obj in _deserialize_json_models(content):
                 o = obj.object
                 model_name = get_model_name(o)
                 if model_name == user_model_name:
@@ -243,10 +249,9 @@ def _import(
     # with N model kinds into N json blobs with 1 model kind each.
     def yield_json_models(content) -> Iterator[tuple[NormalizedModelName, str]]:
         # TODO(getsentry#team-ospo/190): Better error handling for unparsable JSON.
-        models = json.loads(content)
         last_seen_model_name: NormalizedModelName | None = None
         batch: list[type[Model]] = []
-        for model in models:
+        for model in _iter_json_models(content):
             model_name = NormalizedModelName(model["model"])
             if last_seen_model_name != model_name:
                 if last_seen_model_name is not None and len(batch) > 0:
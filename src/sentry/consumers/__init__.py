@@ -61,6 +61,21 @@ def multiprocessing_options(
     ]
 
 
+def query_subscription_options(default_max_batch_size: int = 100) -> list[click.Option]:
+    """Return a list of query subscription results consumer options."""
+    options = multiprocessing_options(default_max_batch_size=default_max_batch_size)
+    options.append(
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["serial", "batched"]),
+            default="serial",
+            help="The mode to process subscription updates in. Batched loads alert rules and "
+            "their state once per batch of updates.",
+        )
+    )
+    return options
+
+
 def ingest_replay_recordings_options() -> list[click.Option]:
     """Return a list of ingest-replay-recordings options."""
     options = multiprocessing_options(default_max_batch_size=10)
@@ -70,6 +85,8 @@ def ingest_replay_recordings_options() -> list[click.Option]:
 
 def ingest_replay_recordings_buffered_options() -> list[click.Option]:
     """Return a list of ingest-replay-recordings-buffered options."""
+    from sentry.replays.consumers.recording_buffered import DEFAULT_MAX_UPLOAD_WORKERS
+
     options = [
         click.Option(
             ["--max-buffer-message-count", "max_buffer_message_count"],
@@ -86,6 +103,11 @@ def ingest_replay_recordings_buffered_options() -> list[click.Option]:
             type=int,
             default=1,
         ),
+        click.Option(
+            ["--max-upload-workers", "max_upload_workers"],
+            type=int,
+            default=DEFAULT_MAX_UPLOAD_WORKERS,
+        ),
     ]
     return options
 
@@ -223,20 +245,20 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "events-subscription-results": {
         "topic": Topic.EVENTS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(default_max_batch_size=100),
         "static_args": {"dataset": "events"},
     },
     "transactions-subscription-results": {
         "topic": Topic.TRANSACTIONS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(default_max_batch_size=100),
         "static_args": {"dataset": "transactions"},
     },
     "generic-metrics-subscription-results": {
         "topic": Topic.GENERIC_METRICS_SUBSCRIPTIONS_RESULTS,
         "validate_schema": True,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(default_max_batch_size=100),
         "static_args": {"dataset": "generic_metrics"},
     },
     "sessions-subscription-results": {
@@ -250,7 +272,7 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "metrics-subscription-results": {
         "topic": Topic.METRICS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(default_max_batch_size=100),
         "static_args": {"dataset": "metrics"},
     },
     "ingest-events": {
@@ -2,15 +2,18 @@ import codecs
 import csv
 import logging
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha1
 
 import sentry_sdk
 from celery import current_task
 from celery.exceptions import MaxRetriesExceededError
 from django.core.files.base import ContentFile
-from django.db import IntegrityError, router
+from django.db import IntegrityError, connections, router
 from django.utils import timezone
 
+from sentry import options
 from sentry.models.files.file import File
 from sentry.models.files.fileblob import FileBlob
 from sentry.models.files.fileblobindex import FileBlobIndex
@@ -120,11 +123,9 @@ def assemble_download(
 
                 rows = []
 
-                for _ in range(MAX_FRAGMENTS_PER_BATCH):
-                    # the number of rows to export in the next batch fragment
-                    fragment_row_count = min(batch_size, max(export_limit - next_offset, 1))
-
-                    rows = process_rows(processor, data_export, fragment_row_count, next_offset)
+                for rows in iter_batch_fragments(
+                    processor, data_export, batch_size, offset, export_limit
+                ):
                     writer.writerows(rows)
 
                     fragment_offset += len(rows)
@@ -228,6 +229,73 @@ def get_processor(data_export, environment_id):
         raise
 
 
+def iter_batch_fragments(processor, data_export, batch_size, offset, export_limit):
+    """
+    Yields the rows of up to MAX_FRAGMENTS_PER_BATCH consecutive fragments starting at
+    `offset`, in order. The caller stops consuming once a fragment comes back short or the
+    batch is large enough.
+
+    Discover fragments are fetched from snuba concurrently, assuming every fragment before
+    them is full. Fragments fetched past the end of the results are discarded.
+    """
+
+    def get_fragment_row_count(fragment_offset):
+        # the number of rows to export in the batch fragment
+        return min(batch_size, max(export_limit - fragment_offset, 1))
+
+    max_concurrency = options.get("data-export.max-concurrent-fragments")
+    if data_export.query_type != ExportQueryType.DISCOVER or max_concurrency <= 1:
+        # the offset of each fragment depends on the number of rows actually returned
+        next_offset = offset
+        for _ in range(MAX_FRAGMENTS_PER_BATCH):
+            rows = process_rows(
+                processor, data_export, get_fragment_row_count(next_offset), next_offset
+            )
+            yield rows
+            next_offset += len(rows)
+        return
+
+    fragment_offsets = [
+        offset + i * batch_size
+        for i in range(MAX_FRAGMENTS_PER_BATCH)
+        if i == 0 or offset + i * batch_size < export_limit
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        remaining_offsets = iter(fragment_offsets)
+        pending = deque()
+
+        def submit_next():
+            fragment_offset = next(remaining_offsets, None)
+            if fragment_offset is not None:
+                pending.append(
+                    pool.submit(
+                        _fetch_discover_in_thread,
+                        processor,
+                        get_fragment_row_count(fragment_offset),
+                        fragment_offset,
+                    )
+                )
+
+        for _ in range(max_concurrency):
+            submit_next()
+
+        try:
+            while pending:
+                future = pending.popleft()
+                submit_next()
+                try:
+                    # snuba results are fetched concurrently but the fields are processed in
+                    # order on this thread as they may need the database
+                    yield processor.handle_fields(future.result())
+                except ExportError as error:
+                    _record_export_error(error)
+                    raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 def process_rows(processor, data_export, batch_size, offset):
     try:
         if data_export.query_type == ExportQueryType.ISSUES_BY_TAG:
@@ -238,13 +306,17 @@ def process_rows(processor, data_export, batch_size, offset):
             raise ExportError(f"No processor found for this query type: {data_export.query_type}")
         return rows
     except ExportError as error:
-        error_str = str(error)
-        metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
-        logger.info("dataexport.error: %s", error_str)
-        capture_exception(error)
+        _record_export_error(error)
         raise
 
 
+def _record_export_error(error):
+    error_str = str(error)
+    metrics.incr("dataexport.error", tags={"error": error_str}, sample_rate=1.0)
+    logger.info("dataexport.error: %s", error_str)
+    capture_exception(error)
+
+
 @handle_snuba_errors(logger)
 def process_issues_by_tag(processor, limit, offset):
     return processor.get_serialized_data(limit=limit, offset=offset)
@@ -256,6 +328,20 @@ def process_discover(processor, limit, offset):
     return processor.handle_fields(raw_data_unicode)
 
 
+@handle_snuba_errors(logger)
+def fetch_discover(processor, limit, offset):
+    return processor.data_fn(limit=limit, offset=offset)["data"]
+
+
+def _fetch_discover_in_thread(processor, limit, offset):
+    try:
+        return fetch_discover(processor, limit, offset)
+    finally:
+        # Worker threads open their own database connections, close them before the
+        # thread is handed back to the pool.
+        connections.close_all()
+
+
 class ExportDataFileTooBig(Exception):
     pass
 
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import os
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
-from sentry import eventstore, eventstream, models, nodestore
+from sentry import eventstore, eventstream, models, nodestore, options
 from sentry.eventstore.models import Event
 from sentry.models.rulefirehistory import RuleFireHistory
+from sentry.utils.cache import cache
+from sentry.utils.hashlib import md5_text
+from sentry.utils.iterators import chunked
 
 from ..base import BaseDeletionTask, BaseRelation, ModelDeletionTask, ModelRelation
 
@@ -51,20 +56,56 @@ class EventDataDeletionTask(BaseDeletionTask):
     # Number of events fetched from eventstore per chunk() call.
     DEFAULT_CHUNK_SIZE = 10000
 
+    # Number of event ids per EventAttachment/UserReport delete statement.
+    CHILD_DELETE_BATCH_SIZE = 1000
+
+    # How long the keyset cursor of an interrupted deletion is kept around.
+    CHECKPOINT_TTL = 60 * 60 * 24
+
     def __init__(self, manager, groups, **kwargs):
         self.groups = groups
-        self.last_event = None
         super().__init__(manager, **kwargs)
+        # ``(timestamp, event_id)`` of the oldest event processed so far.
+        self.last_event = self._load_checkpoint()
+
+    def _get_checkpoint_key(self) -> str | None:
+        # Without a transaction id there is no way to tell a retry apart from
+        # an unrelated deletion of the same groups.
+        if self.transaction_id is None or not self.groups:
+            return None
+        group_ids = ",".join(str(group_id) for group_id in sorted(g.id for g in self.groups))
+        digest = md5_text(group_ids).hexdigest()
+        return f"deletions:group-event-data:{self.transaction_id}:{digest}"
+
+    def _load_checkpoint(self) -> tuple[str, str] | None:
+        key = self._get_checkpoint_key()
+        if key is None:
+            return None
+        checkpoint = cache.get(key)
+        if checkpoint is None:
+            return None
+        return checkpoint["timestamp"], checkpoint["event_id"]
+
+    def _save_checkpoint(self) -> None:
+        key = self._get_checkpoint_key()
+        if key is None:
+            return
+        if self.last_event is None:
+            cache.delete(key)
+        else:
+            timestamp, event_id = self.last_event
+            cache.set(key, {"timestamp": timestamp, "event_id": event_id}, self.CHECKPOINT_TTL)
 
     def chunk(self):
         conditions = []
         if self.last_event is not None:
+            timestamp, event_id = self.last_event
             conditions.extend(
                 [
-                    ["timestamp", "<=", self.last_event.timestamp],
+                    ["timestamp", "<=", timestamp],
                     [
-                        ["timestamp", "<", self.last_event.timestamp],
-                        ["event_id", "<", self.last_event.event_id],
+                        ["timestamp", "<", timestamp],
+                        ["event_id", "<", event_id],
                     ],
                 ]
             )
@@ -92,26 +133,48 @@ class EventDataDeletionTask(BaseDeletionTask):
             for project_id, group_ids in project_groups.items():
                 eventstream_state = eventstream.backend.start_delete_groups(project_id, group_ids)
                 eventstream.backend.end_delete_groups(eventstream_state)
+            self.last_event = None
+            self._save_checkpoint()
             return False
 
-        self.last_event = events[-1]
-
-        # Remove from nodestore
         node_ids = [Event.generate_node_id(event.project_id, event.event_id) for event in events]
-        nodestore.backend.delete_multi(node_ids)
+        event_ids = [event.event_id for event in events]
+
+        max_concurrency = options.get("deletions.nodestore.max-concurrent-batches")
+        if max_concurrency > 1:
+            # Keep nodestore deletes in flight while the database rows are removed.
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [
+                    executor.submit(nodestore.backend.delete_multi, batch)
+                    for batch in self._nodestore_batches(node_ids)
+                ]
+                self._delete_event_children(event_ids, project_ids)
+                for future in futures:
+                    future.result()
+        else:
+            for batch in self._nodestore_batches(node_ids):
+                nodestore.backend.delete_multi(batch)
+            self._delete_event_children(event_ids, project_ids)
+
+        # Only advance the cursor once everything up to it is gone, so that a
+        # restarted deletion never skips events.
+        self.last_event = (events[-1].timestamp, events[-1].event_id)
+        self._save_checkpoint()
 
+        return True
+
+    def _nodestore_batches(self, node_ids: Sequence[str]):
+        return chunked(node_ids, max(options.get("deletions.nodestore.batch-size"), 1))
+
+    def _delete_event_children(self, event_ids: Sequence[str], project_ids: Sequence[int]) -> None:
         # Remove EventAttachment and UserReport *again* as those may not have a
         # group ID, therefore there may be dangling ones after "regular" model
         # deletion.
-        event_ids = [event.event_id for event in events]
-        models.EventAttachment.objects.filter(
-            event_id__in=event_ids, project_id__in=project_ids
-        ).delete()
-        models.UserReport.objects.filter(
-            event_id__in=event_ids, project_id__in=project_ids
-        ).delete()
-
-        return True
+        for batch in chunked(event_ids, self.CHILD_DELETE_BATCH_SIZE):
+            models.EventAttachment.objects.filter(
+                event_id__in=batch, project_id__in=project_ids
+            ).delete()
+            models.UserReport.objects.filter(event_id__in=batch, project_id__in=project_ids).delete()
 
 
 class GroupDeletionTask(ModelDeletionTask):
@@ -1,8 +1,9 @@
 import logging
 import time
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, TypeVar
 
 import rb
 from rb.clients import LocalClient
@@ -10,6 +11,7 @@ from redis.exceptions import ResponseError
 
 from sentry.digests import Record, ScheduleEntry
 from sentry.digests.backends.base import Backend, InvalidState
+from sentry.utils import metrics
 from sentry.utils.locking.backends.redis import RedisLockBackend
 from sentry.utils.locking.lock import Lock
 from sentry.utils.locking.manager import LockManager
@@ -20,6 +22,8 @@ logger = logging.getLogger("sentry.digests")
 
 script = load_script("digests/digests.lua")
 
+T = TypeVar("T")
+
 
 class RedisBackend(Backend):
     """
@@ -88,6 +92,11 @@ class RedisBackend(Backend):
         # too early.
         self.ttl = options.pop("ttl", 60 * 60)
 
+        # The maximum number of cluster hosts that are scheduled (or maintained)
+        # concurrently. Each host is processed by a single script call, so this
+        # mainly helps clusters with many hosts keep up with the schedule.
+        self.schedule_concurrency = options.pop("schedule_concurrency", 1)
+
         super().__init__(**options)
 
     def validate(self) -> None:
@@ -143,6 +152,34 @@ class RedisBackend(Backend):
             )
         )
 
+    def __map_partitions(
+        self, func: Callable[[int], T], error_message: str
+    ) -> list[tuple[int, T | None]]:
+        """
+        Calls ``func`` for every host of the cluster, processing up to
+        ``schedule_concurrency`` hosts at a time. Errors are logged and
+        reported as a ``None`` result, so one failing host doesn't prevent the
+        remaining hosts from being processed.
+        """
+
+        def run(host: int) -> tuple[int, T | None]:
+            start = time.monotonic()
+            try:
+                return host, func(host)
+            except Exception as error:
+                logger.exception(error_message, host, error)
+                return host, None
+            finally:
+                metrics.timing("digests.partition.duration", time.monotonic() - start)
+
+        hosts = list(self.cluster.hosts)
+        if self.schedule_concurrency > 1 and len(hosts) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.schedule_concurrency, len(hosts))
+            ) as executor:
+                return list(executor.map(run, hosts))
+        return [run(host) for host in hosts]
+
     def __schedule_partition(
         self, host: int, deadline: float, timestamp: float
     ) -> Iterable[tuple[bytes, float]]:
@@ -156,16 +193,13 @@ class RedisBackend(Backend):
         if timestamp is None:
             timestamp = time.time()
 
-        for host in self.cluster.hosts:
-            try:
-                for key, timestamp in self.__schedule_partition(host, deadline, timestamp):
-                    yield ScheduleEntry(key.decode("utf-8"), float(timestamp))
-            except Exception as error:
-                logger.exception(
-                    "Failed to perform scheduling for partition %s due to error: %s",
-                    host,
-                    error,
-                )
+        partitions = self.__map_partitions(
+            lambda host: self.__schedule_partition(host, deadline, timestamp),
+            "Failed to perform scheduling for partition %s due to error: %s",
+        )
+        for _, entries in partitions:
+            for key, entry_timestamp in entries or ():
+                yield ScheduleEntry(key.decode("utf-8"), float(entry_timestamp))
 
     def __maintenance_partition(self, host: int, deadline: float, timestamp: float) -> Any:
         return script(
@@ -178,15 +212,10 @@ class RedisBackend(Backend):
         if timestamp is None:
             timestamp = time.time()
 
-        for host in self.cluster.hosts:
-            try:
-                self.__maintenance_partition(host, deadline, timestamp)
-            except Exception as error:
-                logger.exception(
-                    "Failed to perform maintenance on digest partition %s due to error: %s",
-                    host,
-                    error,
-                )
+        self.__map_partitions(
+            lambda host: self.__maintenance_partition(host, deadline, timestamp),
+            "Failed to perform maintenance on digest partition %s due to error: %s",
+        )
 
     @contextmanager
     def digest(
@@ -36,6 +36,7 @@ from sentry.dynamic_sampling.tasks.helpers.boost_low_volume_projects import (
 )
 from sentry.dynamic_sampling.tasks.helpers.boost_low_volume_transactions import (
     set_transactions_resampling_rates,
+    set_transactions_resampling_rates_many,
 )
 from sentry.dynamic_sampling.tasks.logging import log_sample_rate_source, log_skipped_job
 from sentry.dynamic_sampling.tasks.task_context import DynamicSamplingLogState, TaskContext
@@ -53,6 +54,8 @@ from sentry.snuba.metrics.naming_layer.mri import TransactionMRI
 from sentry.snuba.referrer import Referrer
 from sentry.tasks.base import instrumented_task
 from sentry.tasks.relay import schedule_invalidate_project_config
+from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 from sentry.utils.snuba import raw_snql_query
 
 
@@ -103,6 +106,10 @@ def boost_low_volume_transactions(context: TaskContext) -> None:
         options.get("dynamic-sampling.prioritise_transactions.num_explicit_small_transactions")
     )
 
+    projects_per_task = max(
+        1, int(options.get("dynamic-sampling.prioritise_transactions.projects_per_task"))
+    )
+
     get_totals_name = "GetTransactionTotals"
     get_volumes_small = "GetTransactionVolumes(small)"
     get_volumes_big = "GetTransactionVolumes(big)"
@@ -134,10 +141,23 @@ def boost_low_volume_transactions(context: TaskContext) -> None:
             name=get_volumes_big,
         )
 
-        for project_transactions in transactions_zip(
-            totals_it, big_transactions_it, small_transactions_it
+        num_tasks = 0
+        for projects_transactions in chunked(
+            transactions_zip(totals_it, big_transactions_it, small_transactions_it),
+            projects_per_task,
         ):
-            boost_low_volume_transactions_of_project.delay(project_transactions)
+            if projects_per_task > 1:
+                boost_low_volume_transactions_of_projects.delay(projects_transactions)
+            else:
+                boost_low_volume_transactions_of_project.delay(projects_transactions[0])
+            num_tasks += 1
+
+        metrics.incr(
+            "dynamic_sampling.boost_low_volume_transactions.scheduled_tasks",
+            amount=num_tasks,
+            tags={"batched": projects_per_task > 1},
+            sample_rate=1.0,
+        )
 
 
 @instrumented_task(
@@ -151,6 +171,79 @@ def boost_low_volume_transactions(context: TaskContext) -> None:
 )
 @dynamic_sampling_task
 def boost_low_volume_transactions_of_project(project_transactions: ProjectTransactions) -> None:
+    rebalanced_transactions = rebalance_transactions_of_project(project_transactions)
+    if rebalanced_transactions is None:
+        return
+
+    org_id = project_transactions["org_id"]
+    project_id = project_transactions["project_id"]
+    named_rates, implicit_rate = rebalanced_transactions
+    set_transactions_resampling_rates(
+        org_id=org_id,
+        proj_id=project_id,
+        named_rates=named_rates,
+        default_rate=implicit_rate,
+        ttl_ms=DEFAULT_REDIS_CACHE_KEY_TTL,
+    )
+
+    schedule_invalidate_project_config(
+        project_id=project_id, trigger="dynamic_sampling_boost_low_volume_transactions"
+    )
+
+
+@instrumented_task(
+    name="sentry.dynamic_sampling.boost_low_volume_transactions_of_projects",
+    queue="dynamicsampling",
+    default_retry_delay=5,
+    max_retries=5,
+    soft_time_limit=25 * 60,
+    time_limit=25 * 60 + 5,
+    silo_mode=SiloMode.REGION,
+)
+@dynamic_sampling_task
+def boost_low_volume_transactions_of_projects(
+    projects_transactions: Sequence[ProjectTransactions],
+) -> None:
+    """
+    Rebalances the transactions of a batch of projects and stores all their resampling rates with
+    a single pipelined call.
+    """
+    metrics.distribution(
+        "dynamic_sampling.boost_low_volume_transactions.projects_per_task",
+        len(projects_transactions),
+    )
+
+    resampling_rates = []
+    for project_transactions in projects_transactions:
+        rebalanced_transactions = rebalance_transactions_of_project(project_transactions)
+        if rebalanced_transactions is None:
+            continue
+
+        named_rates, implicit_rate = rebalanced_transactions
+        resampling_rates.append(
+            (
+                project_transactions["org_id"],
+                project_transactions["project_id"],
+                named_rates,
+                implicit_rate,
+            )
+        )
+
+    set_transactions_resampling_rates_many(resampling_rates, ttl_ms=DEFAULT_REDIS_CACHE_KEY_TTL)
+
+    for _, project_id, _, _ in resampling_rates:
+        schedule_invalidate_project_config(
+            project_id=project_id, trigger="dynamic_sampling_boost_low_volume_transactions"
+        )
+
+
+def rebalance_transactions_of_project(
+    project_transactions: ProjectTransactions,
+) -> tuple[list[RebalancedItem], float] | None:
+    """
+    Runs the transactions rebalancing model for a project, returning the rebalanced named
+    transactions and the implicit rate, or None in case the project must not be rebalanced.
+    """
     org_id = project_transactions["org_id"]
     project_id = project_transactions["project_id"]
     total_num_transactions = project_transactions.get("total_num_transactions")
@@ -168,7 +261,7 @@ def boost_low_volume_transactions_of_project(project_transactions: ProjectTransa
     # If the org doesn't have dynamic sampling, we want to early return to avoid unnecessary work.
     if not has_dynamic_sampling(organization):
         log_skipped_job(org_id, "boost_low_volume_transactions")
-        return
+        return None
 
     # We try to use the sample rate that was individually computed for each project, but if we don't find it, we will
     # resort to the blended sample rate of the org.
@@ -195,15 +288,16 @@ def boost_low_volume_transactions_of_project(project_transactions: ProjectTransa
             "Sample rate of project not found when trying to adjust the sample rates of "
             "its transactions"
         )
-        return
+        return None
 
     if sample_rate == 1.0:
-        return
+        return None
 
     intensity = options.get("dynamic-sampling.prioritise_transactions.rebalance_intensity", 1.0)
 
     model = model_factory(ModelType.TRANSACTIONS_REBALANCING)
-    rebalanced_transactions = guarded_run(
+    # In case the result of the model is None, it means that an error occurred.
+    return guarded_run(
         model,
         TransactionsRebalancingInput(
             classes=transactions,
@@ -213,23 +307,6 @@ def boost_low_volume_transactions_of_project(project_transactions: ProjectTransa
             intensity=intensity,
         ),
     )
-    # In case the result of the model is None, it means that an error occurred, thus we want to early return.
-    if rebalanced_transactions is None:
-        return
-
-    # Only after checking the nullability of rebalanced_transactions, we want to unpack the tuple.
-    named_rates, implicit_rate = rebalanced_transactions
-    set_transactions_resampling_rates(
-        org_id=org_id,
-        proj_id=project_id,
-        named_rates=named_rates,
-        default_rate=implicit_rate,
-        ttl_ms=DEFAULT_REDIS_CACHE_KEY_TTL,
-    )
-
-    schedule_invalidate_project_config(
-        project_id=project_id, trigger="dynamic_sampling_boost_low_volume_transactions"
-    )
 
 
 def is_same_project(left: ProjectIdentity | None, right: ProjectIdentity | None) -> bool:
@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
 import sentry_sdk
 
@@ -29,10 +29,25 @@ def get_transactions_resampling_rates(
 def set_transactions_resampling_rates(
     org_id: int, proj_id: int, named_rates: list[RebalancedItem], default_rate: float, ttl_ms: int
 ) -> None:
+    set_transactions_resampling_rates_many([(org_id, proj_id, named_rates, default_rate)], ttl_ms)
+
+
+def set_transactions_resampling_rates_many(
+    resampling_rates: Sequence[tuple[int, int, list[RebalancedItem], float]], ttl_ms: int
+) -> None:
+    """
+    Stores the resampling rates of many projects with a single pipelined call.
+
+    Each element of `resampling_rates` is a tuple of (org_id, proj_id, named_rates, default_rate).
+    """
+    if not resampling_rates:
+        return
+
     redis_client = get_redis_client_for_ds()
-    cache_key = _get_cache_key(org_id=org_id, proj_id=proj_id)
-    named_rates_dict = {rate.id: rate.new_sample_rate for rate in named_rates}
-    val = [named_rates_dict, default_rate]
-    val_str = json.dumps(val)
-    redis_client.set(cache_key, val_str)
-    redis_client.pexpire(cache_key, ttl_ms)
+    with redis_client.pipeline(transaction=False) as pipeline:
+        for org_id, proj_id, named_rates, default_rate in resampling_rates:
+            cache_key = _get_cache_key(org_id=org_id, proj_id=proj_id)
+            named_rates_dict = {rate.id: rate.new_sample_rate for rate in named_rates}
+            val = [named_rates_dict, default_rate]
+            pipeline.set(cache_key, json.dumps(val), px=ttl_ms)
+        pipeline.execute()
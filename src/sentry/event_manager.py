@@ -564,6 +564,7 @@ class EventManager:
         _increment_release_associated_counts_many(jobs, projects)
         _get_or_create_group_release_many(jobs, projects)
         _tsdb_record_all_metrics(jobs)
+        _incr_group_hourly_counts(jobs)
 
         UserReport.objects.filter(project_id=project.id, event_id=job["event"].event_id).update(
             group_id=group_info.group.id, environment_id=job["environment"].id
@@ -1107,6 +1108,22 @@ def _tsdb_record_all_metrics(jobs: Sequence[Job]) -> None:
             tsdb.backend.record_frequency_multi(frequencies, timestamp=event.datetime)
 
 
+@metrics.wraps("save_event.incr_group_hourly_counts")
+def _incr_group_hourly_counts(jobs: Sequence[Job]) -> None:
+    """
+    Count events of groups archived until escalating, so that escalation checks
+    in post-processing can read a counter instead of querying Snuba.
+    """
+    from sentry.issues.escalating import incr_group_hourly_counts, should_count_group_hourly_events
+
+    incr_group_hourly_counts(
+        (group_info.group.id, job["event"].datetime)
+        for job in jobs
+        for group_info in job["groups"]
+        if should_count_group_hourly_events(group_info.group)
+    )
+
+
 @metrics.wraps("save_event.nodestore_save_many")
 def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
     inserted_time = datetime.now(timezone.utc).timestamp()
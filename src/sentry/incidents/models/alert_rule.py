@@ -110,6 +110,42 @@ class AlertRuleManager(BaseManager["AlertRule"]):
 
         return alert_rule
 
+    def get_for_subscriptions(self, subscriptions):
+        """
+        Bulk version of `get_for_subscription`. Returns a dict mapping subscription ids to their
+        AlertRule. Subscriptions without an AlertRule are omitted.
+        """
+        cache_keys = {
+            subscription.id: self.__build_subscription_cache_key(subscription.id)
+            for subscription in subscriptions
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        alert_rules = {
+            subscription_id: cached[cache_key]
+            for subscription_id, cache_key in cache_keys.items()
+            if cached.get(cache_key) is not None
+        }
+
+        missing = [
+            subscription for subscription in subscriptions if subscription.id not in alert_rules
+        ]
+        if missing:
+            rules_by_snuba_query = {
+                alert_rule.snuba_query_id: alert_rule
+                for alert_rule in AlertRule.objects.filter(
+                    snuba_query_id__in={subscription.snuba_query_id for subscription in missing}
+                )
+            }
+            to_cache = {}
+            for subscription in missing:
+                alert_rule = rules_by_snuba_query.get(subscription.snuba_query_id)
+                if alert_rule is not None:
+                    alert_rules[subscription.id] = alert_rule
+                    to_cache[cache_keys[subscription.id]] = alert_rule
+            cache.set_many(to_cache, 3600)
+
+        return alert_rules
+
     @classmethod
     def clear_subscription_cache(cls, instance, **kwargs):
         cache.delete(cls.__build_subscription_cache_key(instance.id))
@@ -365,6 +401,40 @@ class AlertRuleTriggerManager(BaseManager["AlertRuleTrigger"]):
             cache.set(cache_key, triggers, 3600)
         return triggers
 
+    def get_for_alert_rules(self, alert_rules):
+        """
+        Bulk version of `get_for_alert_rule`. Returns a dict mapping alert rule ids to their
+        AlertRuleTriggers.
+        """
+        cache_keys = {
+            alert_rule.id: self._build_trigger_cache_key(alert_rule.id)
+            for alert_rule in alert_rules
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        triggers = {
+            alert_rule_id: cached[cache_key]
+            for alert_rule_id, cache_key in cache_keys.items()
+            if cached.get(cache_key) is not None
+        }
+
+        missing_ids = [
+            alert_rule_id for alert_rule_id in cache_keys if alert_rule_id not in triggers
+        ]
+        if missing_ids:
+            for alert_rule_id in missing_ids:
+                triggers[alert_rule_id] = []
+            for trigger in AlertRuleTrigger.objects.filter(alert_rule_id__in=missing_ids):
+                triggers[trigger.alert_rule_id].append(trigger)
+            cache.set_many(
+                {
+                    cache_keys[alert_rule_id]: triggers[alert_rule_id]
+                    for alert_rule_id in missing_ids
+                },
+                3600,
+            )
+
+        return triggers
+
     @classmethod
     def clear_trigger_cache(cls, instance, **kwargs):
         cache.delete(cls._build_trigger_cache_key(instance.alert_rule_id))
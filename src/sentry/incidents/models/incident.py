@@ -95,6 +95,53 @@ class IncidentManager(BaseManager["Incident"]):
 
         return incident
 
+    def get_active_incidents(self, alert_rule_projects):
+        """
+        Bulk version of `get_active_incident`. Accepts `(alert_rule_id, project_id)` pairs and
+        returns a dict mapping each of them to its active incident, or None.
+        """
+        cache_keys = {
+            (alert_rule_id, project_id): self._build_active_incident_cache_key(
+                alert_rule_id, project_id
+            )
+            for alert_rule_id, project_id in alert_rule_projects
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        incidents = {
+            key: cached[cache_key] or None
+            for key, cache_key in cache_keys.items()
+            if cached.get(cache_key) is not None
+        }
+
+        missing = [key for key in cache_keys if key not in incidents]
+        if missing:
+            found = {}
+            incident_projects = (
+                IncidentProject.objects.filter(
+                    incident__type=IncidentType.ALERT_TRIGGERED.value,
+                    incident__alert_rule_id__in={alert_rule_id for alert_rule_id, _ in missing},
+                    project_id__in={project_id for _, project_id in missing},
+                )
+                .exclude(incident__status=IncidentStatus.CLOSED.value)
+                .select_related("incident")
+                .order_by("-incident__date_added")
+            )
+            for incident_project in incident_projects:
+                found.setdefault(
+                    (incident_project.incident.alert_rule_id, incident_project.project_id),
+                    incident_project.incident,
+                )
+
+            to_cache = {}
+            for key in missing:
+                incident = found.get(key)
+                incidents[key] = incident
+                # Store False rather than None so that we can have a negative cache as well.
+                to_cache[cache_keys[key]] = incident if incident is not None else False
+            cache.set_many(to_cache)
+
+        return incidents
+
     @classmethod
     def clear_active_incident_cache(cls, instance, **kwargs):
         for project in instance.projects.all():
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 import operator
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
 from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import TypeVar, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from django.conf import settings
 from django.db import router, transaction
@@ -48,10 +49,15 @@ from sentry.snuba.entity_subscription import (
     get_entity_key_from_query_builder,
     get_entity_subscription_from_snuba_query,
 )
-from sentry.snuba.models import QuerySubscription
+from sentry.snuba.models import QuerySubscription, SnubaQuery
 from sentry.snuba.tasks import build_query_builder
 from sentry.utils import metrics, redis
+from sentry.utils.cache import cache
 from sentry.utils.dates import to_datetime
+from sentry.utils.hashlib import md5_text
+
+if TYPE_CHECKING:
+    from sentry.search.events.builder import QueryBuilder
 
 logger = logging.getLogger(__name__)
 REDIS_TTL = int(timedelta(days=7).total_seconds())
@@ -66,6 +72,13 @@ ALERT_RULE_TRIGGER_STAT_KEYS = ("alert_triggered", "resolve_triggered")
 # ToDo(ahmed): This is still experimental. If we decide that it makes sense to keep this
 #  functionality, then maybe we should move this to constants
 CRASH_RATE_ALERT_MINIMUM_THRESHOLD: int | None = None
+COMPARISON_VALUE_CACHE_KEY = "incidents:comparison-value:{}:{}:{}"
+# Comparison values are shared between the subscriptions of a snuba query that are updated at the
+# same time, so they only need to outlive a single subscription interval.
+COMPARISON_VALUE_CACHE_MIN_TTL = 60
+# Datasets whose comparison queries can be grouped by project, answering the comparison query for
+# every subscription of a snuba query at once.
+GROUPED_COMPARISON_DATASETS = {Dataset.Events.value, Dataset.Transactions.value}
 
 T = TypeVar("T")
 
@@ -84,23 +97,77 @@ class SubscriptionProcessor:
         AlertRuleThresholdType.BELOW: (operator.lt, operator.gt),
     }
 
+    # When set, `process_update` leaves writing the alert rule stats to the caller, which can then
+    # write the stats of many processors at once via `flush_alert_rule_stats`.
+    defer_stats_update = False
+
     def __init__(self, subscription: QuerySubscription) -> None:
         self.subscription = subscription
         try:
-            self.alert_rule = AlertRule.objects.get_for_subscription(subscription)
+            alert_rule = AlertRule.objects.get_for_subscription(subscription)
         except AlertRule.DoesNotExist:
             return
 
-        self.triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        self.triggers.sort(key=lambda trigger: trigger.alert_threshold)
+        triggers = AlertRuleTrigger.objects.get_for_alert_rule(alert_rule)
+        self._set_alert_rule_state(
+            alert_rule, triggers, get_alert_rule_stats(alert_rule, self.subscription, triggers)
+        )
 
-        (
-            self.last_update,
-            self.trigger_alert_counts,
-            self.trigger_resolve_counts,
-        ) = get_alert_rule_stats(self.alert_rule, self.subscription, self.triggers)
+    def _set_alert_rule_state(
+        self,
+        alert_rule: AlertRule,
+        triggers: list[AlertRuleTrigger],
+        stats: tuple[datetime, dict[int, int], dict[int, int]],
+    ) -> None:
+        self.alert_rule = alert_rule
+        self.triggers = sorted(triggers, key=lambda trigger: trigger.alert_threshold)
+        self.last_update, self.trigger_alert_counts, self.trigger_resolve_counts = stats
         self.orig_trigger_alert_counts = deepcopy(self.trigger_alert_counts)
         self.orig_trigger_resolve_counts = deepcopy(self.trigger_resolve_counts)
+        self.stats_dirty = False
+
+    @classmethod
+    def for_subscriptions(
+        cls, subscriptions: Sequence[QuerySubscription]
+    ) -> dict[int, SubscriptionProcessor]:
+        """
+        Builds processors for many subscriptions at once. Alert rules, triggers, active incidents
+        and alert rule stats are loaded in bulk, rather than separately for every subscription.
+        """
+        alert_rules = AlertRule.objects.get_for_subscriptions(subscriptions)
+        triggers = AlertRuleTrigger.objects.get_for_alert_rules(
+            list({alert_rule.id: alert_rule for alert_rule in alert_rules.values()}.values())
+        )
+        with_rules = [
+            (subscription, alert_rules[subscription.id])
+            for subscription in subscriptions
+            if subscription.id in alert_rules
+        ]
+        active_incidents = Incident.objects.get_active_incidents(
+            {(alert_rule.id, subscription.project_id) for subscription, alert_rule in with_rules}
+        )
+        stats = get_many_alert_rule_stats(
+            [
+                (alert_rule, subscription, triggers[alert_rule.id])
+                for subscription, alert_rule in with_rules
+            ]
+        )
+
+        processors = {}
+        for subscription in subscriptions:
+            processor = cls.__new__(cls)
+            processor.subscription = subscription
+            processor.defer_stats_update = True
+            processors[subscription.id] = processor
+
+        for (subscription, alert_rule), subscription_stats in zip(with_rules, stats):
+            processor = processors[subscription.id]
+            processor._set_alert_rule_state(
+                alert_rule, triggers[alert_rule.id], subscription_stats
+            )
+            processor.active_incident = active_incidents[(alert_rule.id, subscription.project_id)]
+
+        return processors
 
     @property
     def active_incident(self) -> Incident:
@@ -186,43 +253,12 @@ class SubscriptionProcessor:
     ) -> float | None:
         # For comparison alerts run a query over the comparison period and use it to calculate the
         # % change.
-        delta = timedelta(seconds=self.alert_rule.comparison_delta)
-        end = subscription_update["timestamp"] - delta
-        snuba_query = self.subscription.snuba_query
-        start = end - timedelta(seconds=snuba_query.time_window)
-
-        entity_subscription = get_entity_subscription_from_snuba_query(
-            snuba_query,
-            self.subscription.project.organization_id,
+        comparison_aggregates = fetch_comparison_aggregates(
+            self.alert_rule, [self.subscription], subscription_update["timestamp"]
         )
-        try:
-            project_ids = [self.subscription.project_id]
-            query_builder = build_query_builder(
-                entity_subscription,
-                snuba_query.query,
-                project_ids,
-                snuba_query.environment,
-                params={
-                    "organization_id": self.subscription.project.organization.id,
-                    "project_id": project_ids,
-                    "start": start,
-                    "end": end,
-                },
-            )
-            time_col = ENTITY_TIME_COLUMNS[get_entity_key_from_query_builder(query_builder)]
-            query_builder.add_conditions(
-                [
-                    Condition(Column(time_col), Op.GTE, start),
-                    Condition(Column(time_col), Op.LT, end),
-                ]
-            )
-            query_builder.limit = Limit(1)
-            results = query_builder.run_query(referrer="subscription_processor.comparison_query")
-            comparison_aggregate = list(results["data"][0].values())[0]
-
-        except Exception:
-            logger.exception("Failed to run comparison query")
+        if self.subscription.id not in comparison_aggregates:
             return None
+        comparison_aggregate = comparison_aggregates[self.subscription.id]
 
         if not comparison_aggregate:
             metrics.incr("incidents.alert_rules.skipping_update_comparison_value_invalid")
@@ -534,7 +570,10 @@ class SubscriptionProcessor:
         # is killed here. The trade-off is that we might process an update twice. Mostly
         # this will have no effect, but if someone manages to close a triggered incident
         # before the next one then we might alert twice.
-        self.update_alert_rule_stats()
+        if self.defer_stats_update:
+            self.stats_dirty = True
+        else:
+            self.update_alert_rule_stats()
 
     def calculate_event_date_from_update_date(self, update_date: datetime) -> datetime:
         """
@@ -779,6 +818,11 @@ class SubscriptionProcessor:
         Updates stats about the alert rule, if they're changed.
         :return:
         """
+        pipeline = get_redis_client().pipeline()
+        self._queue_alert_rule_stats_update(pipeline)
+        pipeline.execute()
+
+    def _queue_alert_rule_stats_update(self, pipeline: Any) -> None:
         updated_trigger_alert_counts = {
             trigger_id: alert_count
             for trigger_id, alert_count in self.trigger_alert_counts.items()
@@ -790,7 +834,8 @@ class SubscriptionProcessor:
             if alert_count != self.orig_trigger_resolve_counts[trigger_id]
         }
 
-        update_alert_rule_stats(
+        queue_alert_rule_stats_update(
+            pipeline,
             self.alert_rule,
             self.subscription,
             self.last_update,
@@ -799,6 +844,256 @@ class SubscriptionProcessor:
         )
 
 
+def process_subscription_updates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]
+) -> None:
+    """
+    Processes a batch of subscription updates, in order. Everything the processors need is
+    loaded up front for the whole batch, and the resulting alert rule stats are written at the end
+    in a single pipeline.
+    """
+    processors = SubscriptionProcessor.for_subscriptions(
+        list({subscription.id: subscription for _, subscription in updates}.values())
+    )
+    _prefetch_comparison_aggregates(updates, processors)
+
+    try:
+        for subscription_update, subscription in updates:
+            try:
+                with metrics.timer("incidents.subscription_procesor.process_update"):
+                    processors[subscription.id].process_update(subscription_update)
+            except Exception:
+                logger.exception(
+                    "Failed to process subscription update",
+                    extra={"subscription_id": subscription.id},
+                )
+    finally:
+        flush_alert_rule_stats(processors.values())
+
+
+def _prefetch_comparison_aggregates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+    processors: Mapping[int, SubscriptionProcessor],
+) -> None:
+    # Group the comparison alert updates of a batch by rule and timestamp, so that their comparison
+    # values can be fetched and cached together.
+    groups: dict[tuple[int, datetime], list[QuerySubscription]] = defaultdict(list)
+    alert_rules: dict[int, AlertRule] = {}
+    for subscription_update, subscription in updates:
+        alert_rule = getattr(processors[subscription.id], "alert_rule", None)
+        if (
+            alert_rule is None
+            or not alert_rule.comparison_delta
+            or subscription.snuba_query.dataset
+            in (Dataset.Sessions.value, Dataset.Metrics.value)
+        ):
+            continue
+        alert_rules[alert_rule.id] = alert_rule
+        group = groups[(alert_rule.id, subscription_update["timestamp"])]
+        if subscription not in group:
+            group.append(subscription)
+
+    for (alert_rule_id, timestamp), subscriptions in groups.items():
+        fetch_comparison_aggregates(alert_rules[alert_rule_id], subscriptions, timestamp)
+
+
+def flush_alert_rule_stats(processors: Iterable[SubscriptionProcessor]) -> None:
+    """
+    Writes the alert rule stats of all processors with deferred, pending stat updates in a single
+    Redis pipeline.
+    """
+    pipeline = get_redis_client().pipeline()
+    pending = False
+    for processor in processors:
+        if getattr(processor, "stats_dirty", False):
+            processor._queue_alert_rule_stats_update(pipeline)
+            processor.stats_dirty = False
+            pending = True
+    if pending:
+        pipeline.execute()
+
+
+def get_comparison_window(
+    alert_rule: AlertRule, snuba_query: SnubaQuery, timestamp: datetime
+) -> tuple[datetime, datetime]:
+    end = timestamp - timedelta(seconds=alert_rule.comparison_delta)
+    start = end - timedelta(seconds=snuba_query.time_window)
+    return start, end
+
+
+def build_comparison_value_cache_key(
+    subscription_id: int, snuba_query: SnubaQuery, end: datetime
+) -> str:
+    # Editing the alert rule may change the query behind a subscription, which must not be answered
+    # with values computed for the previous query.
+    query_hash = md5_text(
+        snuba_query.aggregate,
+        snuba_query.query,
+        str(snuba_query.environment_id),
+        str(snuba_query.time_window),
+    ).hexdigest()
+    # Updates of the same subscription arrive with slightly different timestamps, so the end of
+    # the comparison window is aligned to the resolution of the query for them to share an entry.
+    end_bucket = int(end.timestamp())
+    if snuba_query.resolution:
+        end_bucket -= end_bucket % snuba_query.resolution
+    return COMPARISON_VALUE_CACHE_KEY.format(subscription_id, query_hash, end_bucket)
+
+
+def fetch_comparison_aggregates(
+    alert_rule: AlertRule, subscriptions: Sequence[QuerySubscription], timestamp: datetime
+) -> dict[int, float | None]:
+    """
+    Fetches the aggregate over the comparison period of `alert_rule` for each of the passed
+    subscriptions, keyed by subscription id. Subscriptions whose query failed are omitted.
+
+    Results are cached per subscription and comparison window. When the comparison value of a
+    subscription isn't cached yet, it is fetched together with every other active subscription of
+    the same snuba query in a single query grouped by project, so that the updates of the other
+    projects of a multi-project alert rule don't need to query Snuba again.
+    """
+    if not subscriptions:
+        return {}
+
+    snuba_query = subscriptions[0].snuba_query
+    start, end = get_comparison_window(alert_rule, snuba_query, timestamp)
+    cache_keys = {
+        subscription.id: build_comparison_value_cache_key(subscription.id, snuba_query, end)
+        for subscription in subscriptions
+    }
+    cached = cache.get_many(list(cache_keys.values()))
+    comparison_aggregates = {
+        subscription_id: cached[key]["value"]
+        for subscription_id, key in cache_keys.items()
+        if key in cached
+    }
+    missing = [
+        subscription
+        for subscription in subscriptions
+        if subscription.id not in comparison_aggregates
+    ]
+    if not missing:
+        return comparison_aggregates
+
+    if snuba_query.dataset in GROUPED_COMPARISON_DATASETS:
+        missing_ids = {subscription.id for subscription in missing}
+        missing.extend(
+            subscription
+            for subscription in QuerySubscription.objects.filter(
+                snuba_query_id=snuba_query.id, status=QuerySubscription.Status.ACTIVE.value
+            ).exclude(id__in=missing_ids)
+            if build_comparison_value_cache_key(subscription.id, snuba_query, end) not in cached
+        )
+
+    fetched: dict[int, float | None] = {}
+    if snuba_query.dataset in GROUPED_COMPARISON_DATASETS and len(missing) > 1:
+        try:
+            fetched = _run_grouped_comparison_query(snuba_query, missing, start, end)
+        except Exception:
+            logger.exception("Failed to run comparison query")
+            return comparison_aggregates
+    else:
+        # Other datasets can't group by project, so each subscription is queried on its own.
+        for subscription in missing:
+            try:
+                fetched[subscription.id] = _run_comparison_query(
+                    snuba_query, subscription, start, end
+                )
+            except Exception:
+                logger.exception("Failed to run comparison query")
+
+    cache.set_many(
+        {
+            build_comparison_value_cache_key(subscription_id, snuba_query, end): {"value": value}
+            for subscription_id, value in fetched.items()
+        },
+        max(snuba_query.resolution, COMPARISON_VALUE_CACHE_MIN_TTL),
+    )
+    for subscription_id in cache_keys:
+        if subscription_id in fetched:
+            comparison_aggregates[subscription_id] = fetched[subscription_id]
+    return comparison_aggregates
+
+
+def _build_comparison_query_builder(
+    snuba_query: SnubaQuery,
+    organization_id: int,
+    project_ids: list[int],
+    start: datetime,
+    end: datetime,
+) -> QueryBuilder:
+    entity_subscription = get_entity_subscription_from_snuba_query(snuba_query, organization_id)
+    query_builder = build_query_builder(
+        entity_subscription,
+        snuba_query.query,
+        project_ids,
+        snuba_query.environment,
+        params={
+            "organization_id": organization_id,
+            "project_id": project_ids,
+            "start": start,
+            "end": end,
+        },
+    )
+    time_col = ENTITY_TIME_COLUMNS[get_entity_key_from_query_builder(query_builder)]
+    query_builder.add_conditions(
+        [
+            Condition(Column(time_col), Op.GTE, start),
+            Condition(Column(time_col), Op.LT, end),
+        ]
+    )
+    return query_builder
+
+
+def _run_comparison_query(
+    snuba_query: SnubaQuery, subscription: QuerySubscription, start: datetime, end: datetime
+) -> float | None:
+    query_builder = _build_comparison_query_builder(
+        snuba_query,
+        subscription.project.organization_id,
+        [subscription.project_id],
+        start,
+        end,
+    )
+    query_builder.limit = Limit(1)
+    results = query_builder.run_query(referrer="subscription_processor.comparison_query")
+    return list(results["data"][0].values())[0]
+
+
+def _run_grouped_comparison_query(
+    snuba_query: SnubaQuery,
+    subscriptions: Sequence[QuerySubscription],
+    start: datetime,
+    end: datetime,
+) -> dict[int, float | None]:
+    subscriptions_by_project = {
+        subscription.project_id: subscription for subscription in subscriptions
+    }
+    project_ids = list(subscriptions_by_project)
+    query_builder = _build_comparison_query_builder(
+        snuba_query,
+        subscriptions[0].project.organization_id,
+        project_ids,
+        start,
+        end,
+    )
+    project_col = Column("project_id")
+    query_builder.columns.append(project_col)
+    query_builder.groupby.append(project_col)
+    query_builder.limit = Limit(len(project_ids))
+    results = query_builder.run_query(referrer="subscription_processor.comparison_query")
+
+    # Projects without any data in the comparison period don't produce a row.
+    comparison_aggregates: dict[int, float | None] = {
+        subscription.id: None for subscription in subscriptions
+    }
+    for row in results["data"]:
+        subscription = subscriptions_by_project.get(row.pop("project_id"))
+        if subscription is not None:
+            comparison_aggregates[subscription.id] = list(row.values())[0]
+    return comparison_aggregates
+
+
 def build_alert_rule_stat_keys(alert_rule: AlertRule, subscription: QuerySubscription) -> list[str]:
     """
     Builds keys for fetching stats about alert rules
@@ -844,7 +1139,7 @@ def partition(iterable: Sequence[T], n: int) -> Sequence[Sequence[T]]:
 
 def get_alert_rule_stats(
     alert_rule: AlertRule, subscription: QuerySubscription, triggers: list[AlertRuleTrigger]
-) -> tuple[datetime, dict[str, int], dict[str, int]]:
+) -> tuple[datetime, dict[int, int], dict[int, int]]:
     """
     Fetches stats about the alert rule, specific to the current subscription
     :return: A tuple containing the stats about the alert rule and subscription.
@@ -859,6 +1154,34 @@ def get_alert_rule_stats(
     alert_rule_keys = build_alert_rule_stat_keys(alert_rule, subscription)
     trigger_keys = build_trigger_stat_keys(alert_rule, subscription, triggers)
     results = get_redis_client().mget(alert_rule_keys + trigger_keys)
+    return _parse_alert_rule_stats(results, triggers)
+
+
+def get_many_alert_rule_stats(
+    items: Sequence[tuple[AlertRule, QuerySubscription, list[AlertRuleTrigger]]]
+) -> list[tuple[datetime, dict[int, int], dict[int, int]]]:
+    """
+    Bulk version of `get_alert_rule_stats`, fetching the stats of many alert rule and subscription
+    pairs in a single Redis pipeline.
+    """
+    if not items:
+        return []
+
+    pipeline = get_redis_client().pipeline()
+    for alert_rule, subscription, triggers in items:
+        pipeline.mget(
+            build_alert_rule_stat_keys(alert_rule, subscription)
+            + build_trigger_stat_keys(alert_rule, subscription, triggers)
+        )
+    return [
+        _parse_alert_rule_stats(results, triggers)
+        for results, (_, _, triggers) in zip(pipeline.execute(), items)
+    ]
+
+
+def _parse_alert_rule_stats(
+    results: Sequence[Any], triggers: list[AlertRuleTrigger]
+) -> tuple[datetime, dict[int, int], dict[int, int]]:
     results = tuple(0 if result is None else int(result) for result in results)
     last_update = to_datetime(results[0])
     trigger_results = results[1:]
@@ -885,7 +1208,20 @@ def update_alert_rule_stats(
     Updates stats about the alert rule, subscription and triggers if they've changed.
     """
     pipeline = get_redis_client().pipeline()
+    queue_alert_rule_stats_update(
+        pipeline, alert_rule, subscription, last_update, alert_counts, resolve_counts
+    )
+    pipeline.execute()
 
+
+def queue_alert_rule_stats_update(
+    pipeline: Any,
+    alert_rule: AlertRule,
+    subscription: QuerySubscription,
+    last_update: datetime,
+    alert_counts: dict[int, int],
+    resolve_counts: dict[int, int],
+) -> None:
     counts_with_stat_keys = zip(ALERT_RULE_TRIGGER_STAT_KEYS, (alert_counts, resolve_counts))
     for stat_key, trigger_counts in counts_with_stat_keys:
         for trigger_id, alert_count in trigger_counts.items():
@@ -899,7 +1235,6 @@ def update_alert_rule_stats(
 
     last_update_key = build_alert_rule_stat_keys(alert_rule, subscription)[0]
     pipeline.set(last_update_key, int(last_update.timestamp()), ex=REDIS_TTL)
-    pipeline.execute()
 
 
 def get_redis_client() -> RetryingRedisCluster:
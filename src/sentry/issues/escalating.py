@@ -6,13 +6,16 @@ from __future__ import annotations
 
 import logging
 import math
-from collections import defaultdict
-from collections.abc import Mapping, Sequence
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime, timedelta
 from typing import Any, TypedDict
 
 import jsonschema
+from django.conf import settings
 from django.db.models.signals import post_save
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
 from snuba_sdk import (
     Column,
     Condition,
@@ -47,7 +50,9 @@ from sentry.snuba.metrics import MetricField, MetricGroupByField, MetricsQuery,
 from sentry.snuba.metrics.naming_layer.mri import ErrorsMRI
 from sentry.types.activity import ActivityType
 from sentry.types.group import GroupSubStatus
+from sentry.utils import metrics
 from sentry.utils.cache import cache
+from sentry.utils.redis import redis_clusters
 from sentry.utils.snuba import raw_snql_query
 
 logger = logging.getLogger(__name__)
@@ -61,6 +66,10 @@ ONE_WEEK_DURATION = 7
 IS_ESCALATING_REFERRER = "sentry.issues.escalating.is_escalating"
 GROUP_HOURLY_COUNT_TTL = 60
 HOUR = 3600  # 3600 seconds
+# Counters outlive their hour so late reads of the previous hour still find them
+GROUP_HOURLY_COUNTER_TTL = 2 * HOUR
+# How often the Redis counters are reconciled with Snuba
+GROUP_HOURLY_COUNT_RECONCILE_INTERVAL = 10 * 60
 
 ELEMENTS_PER_SNUBA_PAGE = 10000  # This is the maximum value for Snuba
 ELEMENTS_PER_SNUBA_METRICS_QUERY = math.floor(
@@ -401,8 +410,54 @@ def _extract_organization_and_project_and_group_ids(
     return group_ids_by_organization
 
 
-def get_group_hourly_count(group: Group) -> int:
-    """Return the number of events a group has had today in the last hour"""
+def _get_hourly_counter_keys(group_id: int, hour: int) -> tuple[str, str]:
+    """Return the keys of a group's event counter and Snuba reconciliation offset for an hour.
+
+    Both keys share a hash tag so they can be read with a single MGET on a cluster.
+    """
+    prefix = f"escalating:hourly-count:{{{group_id}}}:{hour}"
+    return prefix, f"{prefix}:offset"
+
+
+def _get_redis_client() -> RedisCluster | StrictRedis:
+    return redis_clusters.get(settings.SENTRY_ESCALATION_THRESHOLDS_REDIS_CLUSTER)
+
+
+def should_count_group_hourly_events(group: Group) -> bool:
+    """Whether the save path should keep an hourly event counter for the group.
+
+    Only groups archived until escalating ever have `is_escalating` called on them.
+    """
+    return (
+        group.status == GroupStatus.IGNORED
+        and group.substatus == GroupSubStatus.UNTIL_ESCALATING
+        and group.issue_category == GroupCategory.ERROR
+        and options.get("issues.escalating.hourly-counters")
+    )
+
+
+def incr_group_hourly_counts(events: Iterable[tuple[int, datetime]]) -> None:
+    """Increment the hourly event counters for `(group_id, event_datetime)` pairs.
+
+    All increments are aggregated and sent in a single Redis pipeline.
+    """
+    counts: Counter[tuple[int, int]] = Counter(
+        (group_id, int(event_datetime.timestamp() // HOUR)) for group_id, event_datetime in events
+    )
+    if not counts:
+        return
+
+    client = _get_redis_client()
+    with client.pipeline(transaction=False) as p:
+        for (group_id, hour), count in counts.items():
+            counter_key, _ = _get_hourly_counter_keys(group_id, hour)
+            p.incrby(counter_key, count)
+            p.expire(counter_key, GROUP_HOURLY_COUNTER_TTL)
+        p.execute()
+
+
+def _query_group_hourly_count(group: Group) -> int:
+    """Query Snuba for the number of events a group has had in the current hour"""
     key = f"hourly-group-count:{group.project.id}:{group.id}"
     hourly_count = cache.get(key)
 
@@ -437,6 +492,32 @@ def get_group_hourly_count(group: Group) -> int:
     return int(hourly_count)
 
 
+def get_group_hourly_count(group: Group) -> int:
+    """Return the number of events a group has had today in the last hour
+
+    When hourly counters are enabled, the count is read from the Redis counter incremented
+    by the save path. The counter only starts once the group is archived, so it is reconciled
+    against Snuba at most once per reconciliation interval. A single worker wins the right to
+    reconcile, every other worker keeps reading the counter in the meantime.
+    """
+    if not should_count_group_hourly_events(group):
+        return _query_group_hourly_count(group)
+
+    counter_key, offset_key = _get_hourly_counter_keys(group.id, int(time.time() // HOUR))
+    client = _get_redis_client()
+    count, offset = client.mget([counter_key, offset_key])
+    count = int(count or 0)
+
+    if offset is None and client.set(
+        offset_key, 0, nx=True, ex=GROUP_HOURLY_COUNT_RECONCILE_INTERVAL
+    ):
+        metrics.incr("issues.escalating.hourly_count.reconcile")
+        offset = max(0, _query_group_hourly_count(group) - count)
+        client.set(offset_key, offset, ex=GROUP_HOURLY_COUNT_RECONCILE_INTERVAL)
+
+    return count + int(offset or 0)
+
+
 def is_escalating(group: Group) -> tuple[bool, int | None]:
     """
     Return whether the group is escalating and the daily forecast if it exists.
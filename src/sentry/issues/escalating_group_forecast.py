@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TypedDict, cast
@@ -49,6 +50,21 @@ class EscalatingGroupForecast:
             ttl=timedelta(GROUP_FORECAST_TTL),
         )
 
+    @classmethod
+    def save_many(cls, forecasts: Sequence[EscalatingGroupForecast]) -> None:
+        """Saves the forecasts of many groups with a single nodestore write."""
+        if not forecasts:
+            return
+        nodestore.backend.set_multi(
+            {
+                cls.build_storage_identifier(forecast.project_id, forecast.group_id): (
+                    forecast.to_dict()
+                )
+                for forecast in forecasts
+            },
+            ttl=timedelta(GROUP_FORECAST_TTL),
+        )
+
     @classmethod
     def _should_fetch_escalating(cls, group_id: int) -> bool:
         group = Group.objects.get(id=group_id)
@@ -8,10 +8,13 @@ Validation is located at
 
 import math
 import statistics
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TypedDict
 
+INTERVAL_FORMAT = "%Y-%m-%dT%H:%M:%S%f%z"
+
 
 class IssueForecast(TypedDict):
     forecasted_date: str
@@ -67,7 +70,7 @@ def generate_issue_forecast(
     # output list of dictionaries
     output: list[IssueForecast] = []
 
-    input_dates = [datetime.strptime(x, "%Y-%m-%dT%H:%M:%S%f%z") for x in data["intervals"]]
+    input_dates = [datetime.strptime(x, INTERVAL_FORMAT) for x in data["intervals"]]
     output_dates = [start_time + timedelta(days=x) for x in range(14)]
 
     ts_data = data["data"]
@@ -88,6 +91,118 @@ def generate_issue_forecast(
             )
         return output
 
+    limit_v1, baseline = _calculate_limits(ts_data, alg_params)
+
+    for output_ts in output_dates:
+        # Calculate weights (based on day of week)
+        weights = [(1 + (input_ts.weekday() == output_ts.weekday())) for input_ts in input_dates]
+
+        # Calculate weighted avg
+        numerator = sum([datum * weight for datum, weight in zip(ts_data, weights)])
+        wavg_limit = numerator / sum(weights)
+
+        # second ceiling calculation
+        limit_v2 = wavg_limit + baseline
+
+        # final limit is max of the two calculations
+        forecast: IssueForecast = {
+            "forecasted_date": output_ts.strftime("%Y-%m-%d"),
+            "forecasted_value": int(max(limit_v1, limit_v2)),
+        }
+        output.append(forecast)
+
+    return output
+
+
+def generate_issue_forecasts(
+    group_counts: Mapping[int, GroupCount],
+    start_time: datetime,
+    alg_params: ThresholdVariables = standard_version,
+) -> dict[int, list[IssueForecast]]:
+    """
+    Batch version of `generate_issue_forecast`, calculating the forecasts of many groups at once.
+
+    Work that doesn't depend on the group is only done once for the batch: the interval strings
+    (which are the same hourly buckets for most groups) are parsed once, and the output dates are
+    formatted once. The day of week weighted averages are derived from per-weekday sums built in a
+    single pass over each timeseries, rather than re-weighting the timeseries for every forecasted
+    day. The results are identical to calling `generate_issue_forecast` for every group.
+    :param group_counts: Dict of group id to Snuba query results - hourly data over past 7 days
+    :param start_time: datetime indicating the first hour to calc spike protection for
+    :param alg_params: Threshold Variables dataclass with different ceiling versions
+    :return output: Dict of group id to its list of spike protection values
+    """
+    output_days = [
+        (output_ts.strftime("%Y-%m-%d"), output_ts.weekday())
+        for output_ts in (start_time + timedelta(days=x) for x in range(14))
+    ]
+    interval_weekdays: dict[str, int] = {}
+
+    output: dict[int, list[IssueForecast]] = {}
+    for group_id, data in group_counts.items():
+        input_weekdays = []
+        for interval in data["intervals"]:
+            weekday = interval_weekdays.get(interval)
+            if weekday is None:
+                weekday = interval_weekdays[interval] = datetime.strptime(
+                    interval, INTERVAL_FORMAT
+                ).weekday()
+            input_weekdays.append(weekday)
+        output[group_id] = _generate_forecast_from_weekdays(
+            data["data"], input_weekdays, output_days, alg_params
+        )
+    return output
+
+
+def _generate_forecast_from_weekdays(
+    ts_data: Sequence[int],
+    input_weekdays: Sequence[int],
+    output_days: Sequence[tuple[str, int]],
+    alg_params: ThresholdVariables,
+) -> list[IssueForecast]:
+    if len(ts_data) == 0 or len(input_weekdays) == 0:
+        return []
+
+    if len(ts_data) < 168:
+        ts_max = max(ts_data)
+        return [
+            {"forecasted_date": output_date, "forecasted_value": ts_max * 10}
+            for output_date, _ in output_days
+        ]
+
+    limit_v1, baseline = _calculate_limits(ts_data, alg_params)
+
+    # A datum's weight is doubled when it falls on the forecasted day of week, so the weighted
+    # sum is the total plus the sum of the data on that day of week.
+    ts_total = 0
+    weekday_totals = [0] * 7
+    weekday_counts = [0] * 7
+    for datum, weekday in zip(ts_data, input_weekdays):
+        ts_total += datum
+        weekday_totals[weekday] += datum
+    for weekday in input_weekdays:
+        weekday_counts[weekday] += 1
+
+    output: list[IssueForecast] = []
+    for output_date, output_weekday in output_days:
+        wavg_limit = (ts_total + weekday_totals[output_weekday]) / (
+            len(input_weekdays) + weekday_counts[output_weekday]
+        )
+        limit_v2 = wavg_limit + baseline
+        output.append(
+            {"forecasted_date": output_date, "forecasted_value": int(max(limit_v1, limit_v2))}
+        )
+    return output
+
+
+def _calculate_limits(
+    ts_data: Sequence[int], alg_params: ThresholdVariables
+) -> tuple[float, float]:
+    """
+    Returns the bursty limit and the baseline of the weighted average limit of a timeseries.
+    """
+    ts_max = max(ts_data)
+
     # gather stats from the timeseries - average, standard dev
     ts_avg = statistics.mean(ts_data)
     ts_std_dev = statistics.stdev(ts_data)
@@ -116,22 +231,4 @@ def generate_issue_forecast(
     # Default upper limit is the truncated multiplier * avg value
     baseline = ts_multiplier * ts_avg
 
-    for output_ts in output_dates:
-        # Calculate weights (based on day of week)
-        weights = [(1 + (input_ts.weekday() == output_ts.weekday())) for input_ts in input_dates]
-
-        # Calculate weighted avg
-        numerator = sum([datum * weight for datum, weight in zip(ts_data, weights)])
-        wavg_limit = numerator / sum(weights)
-
-        # second ceiling calculation
-        limit_v2 = wavg_limit + baseline
-
-        # final limit is max of the two calculations
-        forecast: IssueForecast = {
-            "forecasted_date": output_ts.strftime("%Y-%m-%d"),
-            "forecasted_value": int(max(limit_v1, limit_v2)),
-        }
-        output.append(forecast)
-
-    return output
+    return limit_v1, baseline
@@ -13,13 +13,17 @@ from sentry.issues.escalating import (
     query_groups_past_counts,
 )
 from sentry.issues.escalating_group_forecast import EscalatingGroupForecast
-from sentry.issues.escalating_issues_alg import generate_issue_forecast, standard_version
+from sentry.issues.escalating_issues_alg import generate_issue_forecasts, standard_version
 from sentry.models.group import Group
 from sentry.silo import SiloMode
 from sentry.tasks.base import instrumented_task
+from sentry.utils.iterators import chunked
 
 logger = logging.getLogger(__name__)
 
+# Number of forecasts written to nodestore at once
+FORECAST_SAVE_BATCH_SIZE = 100
+
 
 def save_forecast_per_group(
     until_escalating_groups: Sequence[Group], group_counts: ParsedGroupsCount
@@ -32,21 +36,30 @@ def save_forecast_per_group(
     """
     time = datetime.now()
     group_dict = {group.id: group for group in until_escalating_groups}
-    for group_id, group_count in group_counts.items():
-        group = group_dict.get(group_id)
-        if group:
-            forecasts = generate_issue_forecast(group_count, time, standard_version)
-            forecasts_list = [forecast["forecasted_value"] for forecast in forecasts]
+    forecasts_by_group = generate_issue_forecasts(
+        {
+            group_id: group_count
+            for group_id, group_count in group_counts.items()
+            if group_id in group_dict
+        },
+        time,
+        standard_version,
+    )
+
+    escalating_group_forecasts = []
+    for group_id, forecasts in forecasts_by_group.items():
+        forecasts_list = [forecast["forecasted_value"] for forecast in forecasts]
+        escalating_group_forecasts.append(
+            EscalatingGroupForecast(group_dict[group_id].project_id, group_id, forecasts_list, time)
+        )
+        logger.info(
+            "save_forecast_per_group",
+            extra={"group_id": group_id, "group_counts": group_counts[group_id]},
+        )
 
-            escalating_group_forecast = EscalatingGroupForecast(
-                group.project.id, group_id, forecasts_list, time
-            )
-            escalating_group_forecast.save()
+    for batch in chunked(escalating_group_forecasts, FORECAST_SAVE_BATCH_SIZE):
+        EscalatingGroupForecast.save_many(batch)
 
-            logger.info(
-                "save_forecast_per_group",
-                extra={"group_id": group_id, "group_counts": group_count},
-            )
     analytics.record("issue_forecasts.saved", num_groups=len(group_counts.keys()))
 
 
@@ -3,8 +3,9 @@ from __future__ import annotations
 import logging
 import uuid
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Literal
 
@@ -22,6 +23,7 @@ from sentry_sdk.tracing import Span, Transaction
 from sentry import quotas, ratelimits
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.killswitches import killswitch_matches_context
+from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.monitors.clock_dispatch import try_monitor_tasks_trigger
 from sentry.monitors.constants import PermitCheckInStatus
@@ -56,20 +58,45 @@ CHECKIN_QUOTA_LIMIT = 6
 CHECKIN_QUOTA_WINDOW = 60
 
 
+@dataclass
+class CheckinGroupPrefetch:
+    """
+    Data looked up in bulk for a whole batch of check-ins, scoped to a single
+    check-in group (see `CheckinItem.processing_key`).
+    """
+
+    ratelimited: Sequence[bool | None] = field(default_factory=list)
+    """
+    The result of the rate limit check for each check-in of the group, in
+    order. None for check-ins which were not counted in bulk, as they are
+    dropped before being rate limited.
+    """
+
+    monitor_environment: MonitorEnvironment | None = None
+    """
+    The monitor environment (with its monitor selected) the group belongs
+    to, when it already exists. This is only valid for the first check-in of
+    the group, as processing a check-in updates the monitor environment.
+    """
+
+
 def _ensure_monitor_with_config(
     project: Project,
     monitor_slug: str,
     config: Mapping | None,
     quotas_outcome: PermitCheckInStatus,
+    existing_monitor: Monitor | None = None,
 ):
-    try:
-        monitor = Monitor.objects.get(
-            slug=monitor_slug,
-            project_id=project.id,
-            organization_id=project.organization_id,
-        )
-    except Monitor.DoesNotExist:
-        monitor = None
+    monitor = existing_monitor
+    if monitor is None:
+        try:
+            monitor = Monitor.objects.get(
+                slug=monitor_slug,
+                project_id=project.id,
+                organization_id=project.organization_id,
+            )
+        except Monitor.DoesNotExist:
+            monitor = None
 
     if not config:
         return monitor
@@ -150,22 +177,40 @@ def check_killswitch(
     return is_blocked
 
 
-def check_ratelimit(metric_kwargs: Mapping, item: CheckinItem):
-    """
-    Enforce check-in rate limits. Returns True if rate limit is enforced.
-    """
+def _get_ratelimit_key(item: CheckinItem) -> str:
     # Use the kafka message timestamp as part of the key to ensure we do not
     # rate-limit during backlog processing.
     ts = item.ts.replace(second=0, microsecond=0)
 
-    ratelimit_key = f"{item.processing_key}:{ts}"
+    return f"monitor-checkins:{item.processing_key}:{ts}"
+
 
-    is_blocked = ratelimits.backend.is_limited(
-        f"monitor-checkins:{ratelimit_key}",
+def bulk_check_ratelimits(items: Sequence[CheckinItem]) -> list[bool]:
+    """
+    Computes the check-in rate limits for a list of check-ins using a single
+    round trip. Check-ins are counted in the order they are given.
+    """
+    return ratelimits.backend.bulk_is_limited(
+        [_get_ratelimit_key(item) for item in items],
         limit=CHECKIN_QUOTA_LIMIT,
         window=CHECKIN_QUOTA_WINDOW,
     )
 
+
+def check_ratelimit(metric_kwargs: Mapping, item: CheckinItem, is_blocked: bool | None = None):
+    """
+    Enforce check-in rate limits. Returns True if rate limit is enforced.
+
+    When `is_blocked` is provided the rate limit was already computed in bulk
+    (see `bulk_check_ratelimits`) and is only enforced here.
+    """
+    if is_blocked is None:
+        is_blocked = ratelimits.backend.is_limited(
+            _get_ratelimit_key(item),
+            limit=CHECKIN_QUOTA_LIMIT,
+            window=CHECKIN_QUOTA_WINDOW,
+        )
+
     if is_blocked:
         metrics.incr(
             "monitors.checkin.dropped.ratelimited",
@@ -335,7 +380,12 @@ def update_existing_check_in(
     existing_check_in.update(**updated_checkin)
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span):
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    ratelimited: bool | None = None,
+    prefetched_monitor_environment: MonitorEnvironment | None = None,
+):
     params = item.payload
 
     start_time = to_datetime(float(item.message["start_time"]))
@@ -367,7 +417,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
         )
         return
 
-    if check_ratelimit(metric_kwargs, item):
+    if check_ratelimit(metric_kwargs, item, ratelimited):
         track_outcome(
             org_id=project.organization_id,
             project_id=project.id,
@@ -464,6 +514,11 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
             monitor_slug,
             monitor_config,
             quotas_outcome,
+            existing_monitor=(
+                prefetched_monitor_environment.monitor
+                if prefetched_monitor_environment is not None
+                else None
+            ),
         )
     except MonitorLimitsExceeded:
         metrics.incr(
@@ -550,9 +605,15 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
     # 02
     # Retrieve or upsert monitor environment for this check-in
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        if (
+            prefetched_monitor_environment is not None
+            and prefetched_monitor_environment.monitor_id == monitor.id
+        ):
+            monitor_environment = prefetched_monitor_environment
+        else:
+            monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
     except MonitorEnvironmentLimitsExceeded:
         metrics.incr(
             "monitors.checkin.result",
@@ -780,7 +841,11 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
 _checkin_worker = ThreadPoolExecutor()
 
 
-def process_checkin(item: CheckinItem):
+def process_checkin(
+    item: CheckinItem,
+    ratelimited: bool | None = None,
+    prefetched_monitor_environment: MonitorEnvironment | None = None,
+):
     """
     Process an individual check-in
     """
@@ -789,18 +854,142 @@ def process_checkin(item: CheckinItem):
             op="_process_checkin",
             name="monitors.monitor_consumer",
         ) as txn:
-            _process_checkin(item, txn)
+            _process_checkin(item, txn, ratelimited, prefetched_monitor_environment)
     except Exception:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin_group(items: list[CheckinItem]):
+def process_checkin_group(items: list[CheckinItem], prefetch: CheckinGroupPrefetch | None = None):
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
     """
-    for item in items:
-        process_checkin(item)
+    for idx, item in enumerate(items):
+        if prefetch is None:
+            process_checkin(item)
+            continue
+
+        process_checkin(
+            item,
+            ratelimited=prefetch.ratelimited[idx],
+            prefetched_monitor_environment=prefetch.monitor_environment if idx == 0 else None,
+        )
+
+
+def _prefetch_monitor_environments(
+    checkin_mapping: Mapping[str, list[CheckinItem]]
+) -> dict[str, MonitorEnvironment]:
+    """
+    Looks up the existing monitor environments of every check-in group using
+    a fixed number of queries. Groups whose monitor or environment does not
+    exist yet are absent from the result and go through the regular upsert
+    path.
+    """
+    group_keys: dict[str, tuple[int, str, str]] = {}
+    for processing_key, items in checkin_mapping.items():
+        item = items[0]
+        environment = item.payload.get("environment") or "production"
+        group_keys[processing_key] = (
+            int(item.message["project_id"]),
+            item.valid_monitor_slug,
+            environment,
+        )
+
+    if not group_keys:
+        return {}
+
+    projects = Project.objects.get_many_from_cache({key[0] for key in group_keys.values()})
+    organization_ids = {project.id: project.organization_id for project in projects}
+
+    environment_ids = {
+        (organization_id, name): environment_id
+        for organization_id, name, environment_id in Environment.objects.filter(
+            organization_id__in=set(organization_ids.values()),
+            name__in={key[2] for key in group_keys.values()},
+        ).values_list("organization_id", "name", "id")
+    }
+
+    monitor_environments = {
+        (
+            monitor_env.monitor.project_id,
+            monitor_env.monitor.organization_id,
+            monitor_env.monitor.slug,
+            monitor_env.environment_id,
+        ): monitor_env
+        for monitor_env in MonitorEnvironment.objects.select_related("monitor").filter(
+            monitor__organization_id__in=set(organization_ids.values()),
+            monitor__project_id__in=set(organization_ids.keys()),
+            monitor__slug__in={key[1] for key in group_keys.values()},
+            environment_id__in=set(environment_ids.values()),
+        )
+    }
+
+    result = {}
+    for processing_key, (project_id, slug, environment) in group_keys.items():
+        organization_id = organization_ids.get(project_id)
+        environment_id = environment_ids.get((organization_id, environment))
+        monitor_env = monitor_environments.get((project_id, organization_id, slug, environment_id))
+        if monitor_env is not None:
+            result[processing_key] = monitor_env
+
+    return result
+
+
+def _get_killswitched_projects(items: Sequence[CheckinItem]) -> set[int]:
+    """
+    Returns the ids of the projects whose check-ins are dropped before being
+    rate limited, either because of the organization killswitch or because the
+    project does not exist.
+    """
+    killswitched_projects = set()
+    for project_id in {int(item.message["project_id"]) for item in items}:
+        try:
+            project = Project.objects.get_from_cache(id=project_id)
+        except Project.DoesNotExist:
+            killswitched_projects.add(project_id)
+            continue
+
+        if killswitch_matches_context(
+            "crons.organization.disable-check-in", {"organization_id": project.organization_id}
+        ):
+            killswitched_projects.add(project_id)
+
+    return killswitched_projects
+
+
+def _prefetch_checkin_groups(
+    checkin_mapping: Mapping[str, list[CheckinItem]]
+) -> dict[str, CheckinGroupPrefetch]:
+    """
+    Resolves rate limits and existing monitor environments for all check-in
+    groups of a batch in bulk.
+    """
+    all_items = [item for items in checkin_mapping.values() for item in items]
+    # Check-ins dropped by the killswitch are never rate limited, so they must
+    # not use any of the quota.
+    killswitched_projects = _get_killswitched_projects(all_items)
+    counted_items = [
+        item for item in all_items if int(item.message["project_id"]) not in killswitched_projects
+    ]
+    ratelimited: dict[int, bool | None] = dict(
+        zip(map(id, counted_items), bulk_check_ratelimits(counted_items))
+    )
+
+    try:
+        monitor_environments = _prefetch_monitor_environments(checkin_mapping)
+    except Exception:
+        # Prefetching is only an optimization, each check-in will look up
+        # its monitor environment on its own.
+        logger.exception("Failed to prefetch monitor environments")
+        monitor_environments = {}
+
+    return {
+        processing_key: CheckinGroupPrefetch(
+            ratelimited=[ratelimited.get(id(item)) for item in items],
+            monitor_environment=monitor_environments.get(processing_key),
+        )
+        for processing_key, items in checkin_mapping.items()
+    }
 
 
 def process_batch(message: Message[ValuesBatch[KafkaPayload]]):
@@ -811,6 +1000,9 @@ def process_batch(message: Message[ValuesBatch[KafkaPayload]]):
 
     By batching we're able to process check-ins in parallel while guaranteeing
     that no check-ins are processed out of order per monitor environment.
+
+    Rate limits and existing monitor environments are resolved for the whole
+    batch up front, so each group does not need to look them up on its own.
     """
     batch = message.payload
 
@@ -850,9 +1042,12 @@ def process_batch(message: Message[ValuesBatch[KafkaPayload]]):
 
     # Submit check-in groups for processing
     with sentry_sdk.start_transaction(op="process_batch", name="monitors.monitor_consumer"):
+        with metrics.timer("monitors.checkin.batch_prefetch"):
+            prefetch = _prefetch_checkin_groups(checkin_mapping)
+
         futures = [
-            _checkin_worker.submit(process_checkin_group, group)
-            for group in checkin_mapping.values()
+            _checkin_worker.submit(process_checkin_group, group, prefetch[processing_key])
+            for processing_key, group in checkin_mapping.items()
         ]
         wait(futures)
 
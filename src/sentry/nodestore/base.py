@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from threading import local
 from typing import Any
@@ -70,6 +71,7 @@ class NodeStorage(local, Service):
         "get_multi",
         "set",
         "set_bytes",
+        "set_multi",
         "set_subkeys",
         "cleanup",
         "validate",
@@ -236,6 +238,29 @@ class NodeStorage(local, Service):
         """
         return self.set_subkeys(item_id, {None: data}, ttl=ttl)
 
+    def set_multi(self, items: Mapping[str, dict[str, Any]], ttl: timedelta | None = None) -> None:
+        """
+        Set the values of multiple nodes. Like `set`, this deletes existing
+        subkeys of the nodes.
+
+        Note: This is not guaranteed to be atomic and may result in a partial
+        write.
+
+        >>> nodestore.set_multi({'key1': {'foo': 'bar'}, 'key2': {'foo': 'baz'}})
+        """
+        with sentry_sdk.start_span(op="nodestore.set_multi") as span:
+            span.set_tag("num_ids", len(items))
+            self._set_bytes_multi(
+                {item_id: self._encode({None: data}) for item_id, data in items.items()},
+                ttl=ttl,
+            )
+            # set cache only after encoding and write to nodestore has succeeded
+            self._set_cache_items({item_id: data for item_id, data in items.items() if data})
+
+    def _set_bytes_multi(self, items: dict[str, bytes], ttl: timedelta | None = None) -> None:
+        for item_id, data in items.items():
+            self._set_bytes(item_id, data, ttl=ttl)
+
     def set_subkeys(
         self, item_id: str, data: dict[str | None, dict[str, str]], ttl: timedelta | None = None
     ) -> None:
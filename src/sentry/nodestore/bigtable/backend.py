@@ -72,6 +72,11 @@ class BigtableNodeStorage(NodeStorage):
     def _set_bytes(self, id: str, data: Any, ttl: timedelta | None = None) -> None:
         self.store.set(id, data, ttl)
 
+    def _set_bytes_multi(self, items: dict[str, bytes], ttl: timedelta | None = None) -> None:
+        with sentry_sdk.start_span(op="nodestore.bigtable.set_multi") as span:
+            span.set_tag("num_ids", len(items))
+            self.store.set_many(list(items.items()), ttl)
+
     def delete(self, id: str) -> None:
         if self.skip_deletes:
             return
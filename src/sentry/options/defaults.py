@@ -724,6 +724,14 @@ register(
 )
 
 
+# Count events of groups archived until escalating in Redis instead of querying Snuba
+register(
+    "issues.escalating.hourly-counters",
+    default=False,
+    type=Bool,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Killswitch for issue priority
 register(
     "issues.priority.enabled",
@@ -830,6 +838,8 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Number of independent serializer lookups that are run concurrently
+register("api.serializers.lookup-concurrency", default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 # Switch for more performant project counter incr
 register(
@@ -1098,6 +1108,9 @@ register(
 # Brownout duration to be stored in ISO8601 format for durations (See https://en.wikipedia.org/wiki/ISO_8601#Durations)
 register("api.deprecation.brownout-duration", default="PT1M", flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Seconds for which the prepared queries of a metrics queries plan are cached, 0 disables the cache.
+register("ddm.metrics-api.query-plan-cache-ttl", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # Option to disable misbehaving use case IDs
 register("sentry-metrics.indexer.disabled-namespaces", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
 
@@ -1134,6 +1147,13 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# An option to enable the local and shared caches of reverse resolved strings in the caching indexer
+register(
+    "sentry-metrics.indexer.reverse-resolve-cache",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Option to control sampling percentage of schema validation on the generic metrics pipeline
 # based on namespace.
 register(
@@ -1625,6 +1645,13 @@ register(
     default=0.8,
     flags=FLAG_MODIFIABLE_RATE | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Number of projects rebalanced by a single boost low volume transactions task. With 1, every
+# project is rebalanced by its own task.
+register(
+    "dynamic-sampling.prioritise_transactions.projects_per_task",
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # === Hybrid cloud subsystem options ===
 # UI rollout
@@ -1655,6 +1682,14 @@ register(
     default=4,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Number of outbox shards drained concurrently by a single drain_outbox_shards task.
+# 1 drains shards one after another.
+register(
+    "hybridcloud.outbox.drain.worker_threads",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 # == End hybrid cloud subsystem
 
 # Decides whether an incoming transaction triggers an update of the clustering rule applied to it.
@@ -2063,6 +2098,31 @@ register(
     flags=FLAG_SCALAR | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# max number of discover export fragments fetched from snuba concurrently
+# within a single data export batch. 1 fetches fragments sequentially.
+register(
+    "data-export.max-concurrent-fragments",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of nodestore ids removed per delete_multi call during group deletion.
+register(
+    "deletions.nodestore.batch-size",
+    type=Int,
+    default=1000,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of nodestore delete batches in flight while deleting the
+# event data of a group. 1 deletes batches inline.
+register(
+    "deletions.nodestore.max-concurrent-batches",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # max number of profiles to use for computing
 # the aggregated flamegraph.
 register(
@@ -2116,6 +2176,23 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# number of frames above which a profile is symbolicated in chunks sent
+# concurrently to symbolicator. 0 disables chunking.
+register(
+    "profiling.symbolicate.frames-chunk-size",
+    type=Int,
+    default=10000,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# max number of concurrent symbolicator requests for a single profile
+register(
+    "profiling.symbolicate.max-concurrent-requests",
+    type=Int,
+    default=4,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Enable sending a post update signal after we update groups using a queryset update
 register(
     "groups.enable-post-update-signal",
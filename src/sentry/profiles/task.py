@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timezone
 from functools import lru_cache
@@ -232,7 +233,18 @@ def _symbolicate_profile(profile: Profile, project: Project) -> bool:
 
                 set_measurement(f"profile.frames.sent.{platform}", len(frames_sent))
 
-                modules, stacktraces, success = run_symbolicate(
+                # In the original format every sample carries its own copy of its frames.
+                # Only send each distinct frame once.
+                sample_frame_indices = None
+                if "version" not in profile:
+                    raw_stacktraces, sample_frame_indices = _dedupe_sample_frames(
+                        raw_stacktraces
+                    )
+                    set_measurement(
+                        f"profile.frames.unique.{platform}", len(raw_stacktraces[0]["frames"])
+                    )
+
+                modules, stacktraces, success = run_symbolicate_chunked(
                     project=project,
                     profile=profile,
                     modules=raw_modules,
@@ -240,6 +252,9 @@ def _symbolicate_profile(profile: Profile, project: Project) -> bool:
                     platform=platform,
                 )
 
+                if success and sample_frame_indices is not None:
+                    stacktraces = _expand_sample_frames(stacktraces, sample_frame_indices)
+
                 assert len(images[platform]) == len(modules)
                 for raw_image, complete_image in zip(images[platform], modules):
                     _merge_image(raw_image, complete_image, None, profile)
@@ -434,6 +449,59 @@ def _prepare_frames_from_profile(
         return (modules, stacktraces, frames_sent)
 
 
+def _dedupe_sample_frames(stacktraces: list[Any]) -> tuple[list[Any], list[list[int]]]:
+    """
+    Collapses the per-sample stacktraces of the original profile format into
+    a single stacktrace of unique frames.
+
+    Returns the deduplicated stacktrace along with, for each sample, the
+    indices of its frames in the deduplicated stacktrace.
+    """
+    unique_frames: list[Any] = []
+    unique_frame_indices: dict[str, int] = {}
+    sample_frame_indices: list[list[int]] = []
+
+    for stacktrace in stacktraces:
+        frame_indices = []
+        for frame in stacktrace["frames"]:
+            # Symbolicator only adjusts the instruction address of frames
+            # which are not the leaf of a stacktrace. Since frames no longer
+            # keep their position once deduplicated, this has to be explicit.
+            frame = {"adjust_instruction_addr": True, **frame}
+            key = json.dumps(frame, sort_keys=True)
+
+            idx = unique_frame_indices.get(key)
+            if idx is None:
+                idx = unique_frame_indices[key] = len(unique_frames)
+                unique_frames.append(frame)
+            frame_indices.append(idx)
+        sample_frame_indices.append(frame_indices)
+
+    return [{"frames": unique_frames}], sample_frame_indices
+
+
+def _expand_sample_frames(
+    stacktraces: list[Any], sample_frame_indices: list[list[int]]
+) -> list[Any]:
+    """
+    Rebuilds the per-sample stacktraces from a symbolicated stacktrace of
+    unique frames (see `_dedupe_sample_frames`).
+    """
+    symbolicated_frames = stacktraces[0]["frames"]
+    index_map = get_frame_index_map(symbolicated_frames)
+
+    return [
+        {
+            "frames": [
+                symbolicated_frames[symbolicated_idx]
+                for idx in frame_indices
+                for symbolicated_idx in index_map.get(idx, ())
+            ]
+        }
+        for frame_indices in sample_frame_indices
+    ]
+
+
 def symbolicate(
     symbolicator: Symbolicator,
     profile: Profile,
@@ -529,6 +597,88 @@ def run_symbolicate(
     return modules, stacktraces, False
 
 
+@metrics.wraps("process_profile.symbolicate.chunked_request")
+def run_symbolicate_chunked(
+    project: Project,
+    profile: Profile,
+    modules: list[Any],
+    stacktraces: list[Any],
+    platform: str,
+) -> tuple[list[Any], list[Any], bool]:
+    """
+    Symbolicates a single large stacktrace by splitting its frames into
+    chunks which are sent to Symbolicator concurrently.
+
+    The results are merged back so they look like the response to a single
+    request, with `original_index` pointing into the complete list of frames.
+    """
+    chunk_size = options.get("profiling.symbolicate.frames-chunk-size")
+
+    if chunk_size <= 0 or len(stacktraces) != 1 or len(stacktraces[0]["frames"]) <= chunk_size:
+        return run_symbolicate(
+            project=project,
+            profile=profile,
+            modules=modules,
+            stacktraces=stacktraces,
+            platform=platform,
+        )
+
+    frames = stacktraces[0]["frames"]
+    chunks = []
+    for offset in range(0, len(frames), chunk_size):
+        chunk_frames = frames[offset : offset + chunk_size]
+        if offset > 0 and "instruction_addr" in chunk_frames[0]:
+            # The first frame of a chunk would otherwise be treated as the
+            # leaf of a stacktrace by Symbolicator.
+            chunk_frames[0] = {"adjust_instruction_addr": True, **chunk_frames[0]}
+        chunks.append((offset, chunk_frames))
+
+    metrics.distribution("process_profile.symbolicate.chunks", len(chunks), sample_rate=1.0)
+
+    max_workers = min(len(chunks), options.get("profiling.symbolicate.max-concurrent-requests"))
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+        futures = [
+            pool.submit(
+                run_symbolicate,
+                project=project,
+                profile=profile,
+                modules=modules,
+                stacktraces=[{"frames": chunk_frames}],
+                platform=platform,
+            )
+            for _, chunk_frames in chunks
+        ]
+        results = [future.result() for future in futures]
+
+    if not all(success for _, _, success in results):
+        return modules, stacktraces, False
+
+    symbolicated_frames = []
+    for (offset, _), (_, chunk_stacktraces, _) in zip(chunks, results):
+        for idx, frame in enumerate(chunk_stacktraces[0]["frames"]):
+            frame["original_index"] = frame.get("original_index", idx) + offset
+            symbolicated_frames.append(frame)
+
+    return (
+        _merge_symbolicated_modules([chunk_modules for chunk_modules, _, _ in results]),
+        [{"frames": symbolicated_frames}],
+        True,
+    )
+
+
+def _merge_symbolicated_modules(results: list[list[Any]]) -> list[Any]:
+    """
+    Merges the modules returned for every chunk of a chunked symbolication.
+    A module is only reported as unused when no chunk made use of it.
+    """
+    merged = list(results[0])
+    for modules in results[1:]:
+        for idx, module in enumerate(modules):
+            if merged[idx].get("debug_status") == "unused":
+                merged[idx] = module
+    return merged
+
+
 @metrics.wraps("process_profile.symbolicate.process")
 def _process_symbolicator_results(
     profile: Profile,
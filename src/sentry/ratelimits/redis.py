@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from time import time
 from typing import TYPE_CHECKING, Any
 
@@ -90,6 +91,35 @@ class RedisRateLimiter(RateLimiter):
             return 0
         return int(current_count)
 
+    def bulk_is_limited(
+        self, keys: Sequence[str], limit: int, window: int | None = None
+    ) -> list[bool]:
+        """
+        Does a rate limit check for all keys using a single redis pipeline.
+        """
+        if not keys:
+            return []
+
+        request_time = time()
+        if window is None or window == 0:
+            window = self.window
+
+        expiration = window - int(request_time % window)
+        try:
+            pipe = self.client.pipeline()
+            for key in keys:
+                redis_key = self._construct_redis_key(
+                    key, window=window, request_time=request_time
+                )
+                pipe.incr(redis_key)
+                pipe.expire(redis_key, expiration)
+            pipeline_result = pipe.execute()
+        except RedisError:
+            logger.exception("Failed to retrieve current value from redis")
+            return [False] * len(keys)
+
+        return [result > limit for result in pipeline_result[::2]]
+
     def is_limited_with_value(
         self, key: str, limit: int, project: Project | None = None, window: int | None = None
     ) -> tuple[bool, int, int]:
@@ -19,6 +19,13 @@ This option limits the amount of time a message will wait in the buffer before b
 this value exceeds the Kafka commit interval then the Kafka offsets will not be committed until the
 buffer has been flushed and fully committed.
 
+**max_upload_workers:**
+
+This option limits the number of threads uploading recording segments at a given time. The upload
+pool is shared for the lifetime of the consumer. Each worker uploads its share of the buffer over a
+single storage client. While the buffer is being uploaded no new messages are consumed which
+applies backpressure to the Kafka consumer.
+
 # Errors
 
 All deterministic errors must be handled otherwise the consumer will deadlock and progress will
@@ -38,10 +45,11 @@ insofar as it impacts the throughput of the consumer.
 
 from __future__ import annotations
 
+import functools
 import logging
 import time
 from collections.abc import Mapping
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, TypedDict
 
 import sentry_sdk
@@ -63,8 +71,10 @@ from sentry.replays.lib.storage import (
 )
 from sentry.replays.usecases.ingest import decompress, process_headers, track_initial_segment_event
 from sentry.replays.usecases.ingest.dom_index import (
+    CUSTOM_EVENT_TYPE,
     ReplayActionsEvent,
     emit_replay_actions,
+    iter_rrweb_events,
     parse_replay_actions,
 )
 from sentry.utils import json, metrics
@@ -73,6 +83,8 @@ logger = logging.getLogger(__name__)
 
 RECORDINGS_CODEC = get_codec("ingest-replay-recordings")
 
+DEFAULT_MAX_UPLOAD_WORKERS = 32
+
 
 def cast_payload_bytes(x: Any) -> bytes:
     """
@@ -113,10 +125,13 @@ class RecordingBufferedStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         max_buffer_message_count: int,
         max_buffer_size_in_bytes: int,
         max_buffer_time_in_seconds: int,
+        max_upload_workers: int = DEFAULT_MAX_UPLOAD_WORKERS,
     ) -> None:
         self.max_buffer_message_count = max_buffer_message_count
         self.max_buffer_size_in_bytes = max_buffer_size_in_bytes
         self.max_buffer_time_in_seconds = max_buffer_time_in_seconds
+        self.max_upload_workers = max_upload_workers
+        self.upload_pool = ThreadPoolExecutor(max_workers=max_upload_workers)
 
     def create_with_partitions(
         self,
@@ -130,11 +145,18 @@ class RecordingBufferedStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
                 self.max_buffer_time_in_seconds,
             ),
             next_step=RunTask(
-                function=process_commit,
+                function=functools.partial(
+                    process_commit,
+                    upload_pool=self.upload_pool,
+                    max_upload_workers=self.max_upload_workers,
+                ),
                 next_step=CommitOffsets(commit),
             ),
         )
 
+    def shutdown(self) -> None:
+        self.upload_pool.shutdown()
+
 
 class UploadEvent(TypedDict):
     key: str
@@ -273,18 +295,19 @@ def process_message(buffer: RecordingBuffer, message: bytes) -> None:
             decompressed_segment = decompress(recording_data)
 
         with sentry_sdk.start_span(op="replays.consumer.recording.json_loads_segment"):
-            parsed_recording_data = json.loads(decompressed_segment)
             parsed_replay_event = (
                 json.loads(cast_payload_bytes(decoded_message["replay_event"]))
                 if decoded_message.get("replay_event")
                 else None
             )
 
+        # Only custom events are inspected by the DOM index. The segment is streamed so the
+        # remaining events are never held in memory at the same time.
         replay_actions = parse_replay_actions(
             decoded_message["project_id"],
             decoded_message["replay_id"],
             decoded_message["retention_days"],
-            parsed_recording_data,
+            iter_rrweb_events(decompressed_segment, event_types=(CUSTOM_EVENT_TYPE,)),
             parsed_replay_event,
         )
 
@@ -318,23 +341,49 @@ def process_message(buffer: RecordingBuffer, message: bytes) -> None:
 
 
 def process_commit(
-    message: Message[tuple[list[UploadEvent], list[InitialSegmentEvent], list[ReplayActionsEvent]]]
+    message: Message[tuple[list[UploadEvent], list[InitialSegmentEvent], list[ReplayActionsEvent]]],
+    upload_pool: ThreadPoolExecutor | None = None,
+    max_upload_workers: int = DEFAULT_MAX_UPLOAD_WORKERS,
 ) -> None:
     # High I/O section.
     with sentry_sdk.start_span(op="replays.consumer.recording.commit_buffer"):
         upload_events, initial_segment_events, replay_action_events = message.payload
-        commit_uploads(upload_events)
+        commit_uploads(upload_events, upload_pool, max_upload_workers)
         commit_initial_segments(initial_segment_events)
         commit_replay_actions(replay_action_events)
 
 
-def commit_uploads(upload_events: list[UploadEvent]) -> None:
-    with sentry_sdk.start_span(op="replays.consumer.recording.upload_segments"):
-        # This will run to completion taking potentially an infinite amount of time. However,
-        # that outcome is unlikely. In the event of an indefinite backlog the process can be
-        # restarted.
-        with ThreadPoolExecutor(max_workers=len(upload_events)) as pool:
-            futures = [pool.submit(_do_upload, upload) for upload in upload_events]
+def commit_uploads(
+    upload_events: list[UploadEvent],
+    upload_pool: ThreadPoolExecutor | None = None,
+    max_upload_workers: int = DEFAULT_MAX_UPLOAD_WORKERS,
+) -> None:
+    if not upload_events:
+        return None
+
+    # The upload events are split evenly between the workers. Each worker uploads its share over a
+    # single storage client rather than opening a connection per segment.
+    num_chunks = min(len(upload_events), max_upload_workers)
+    chunks = [upload_events[i::num_chunks] for i in range(num_chunks)]
+
+    metrics.distribution("replays.consumer.recording.upload_batch_size", len(upload_events))
+    metrics.gauge("replays.consumer.recording.upload_in_flight", len(chunks))
+
+    try:
+        with sentry_sdk.start_span(op="replays.consumer.recording.upload_segments"):
+            with metrics.timer("replays.consumer.recording.upload_segments"):
+                # This will run to completion taking potentially an infinite amount of time.
+                # However, that outcome is unlikely. In the event of an indefinite backlog the
+                # process can be restarted.
+                if upload_pool is None:
+                    with ThreadPoolExecutor(max_workers=num_chunks) as pool:
+                        futures = [pool.submit(_do_upload_many, chunk) for chunk in chunks]
+                else:
+                    futures = [upload_pool.submit(_do_upload_many, chunk) for chunk in chunks]
+                    wait(futures)
+    finally:
+        # Nothing is in flight between batches.
+        metrics.gauge("replays.consumer.recording.upload_in_flight", 0)
 
     has_errors = False
 
@@ -369,9 +418,9 @@ def commit_replay_actions(replay_action_events: list[ReplayActionsEvent]) -> Non
         emit_replay_actions(actions)
 
 
-def _do_upload(upload_event: UploadEvent) -> None:
+def _do_upload_many(upload_events: list[UploadEvent]) -> None:
     with sentry_sdk.start_span(op="replays.consumer.recording.upload_segment"):
         # If an error occurs this will retry up to five times by default.
         #
         # Refer to `src.sentry.filestore.gcs.GCS_RETRIES`.
-        storage_kv.set(upload_event["key"], upload_event["value"])
+        storage_kv.set_many([(event["key"], event["value"]) for event in upload_events])
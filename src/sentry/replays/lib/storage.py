@@ -8,8 +8,10 @@ proper steps are taken to migrate your data.
 import dataclasses
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
 from io import BytesIO
+from typing import Any
 
 from django.conf import settings
 from django.db.utils import IntegrityError
@@ -199,6 +201,20 @@ class SimpleStorageBlob:
     @metrics.wraps("replays.lib.storage.SimpleStorageBlob.set")
     def set(self, key: str, value: bytes) -> None:
         storage = get_storage(self._make_storage_options())
+        self._save(storage, key, value)
+
+    @metrics.wraps("replays.lib.storage.SimpleStorageBlob.set_many")
+    def set_many(self, items: Sequence[tuple[str, bytes]]) -> None:
+        """Set many blobs in remote storage.
+
+        The storage backend (and its client connection) is resolved once and reused for every
+        item rather than once per item.
+        """
+        storage = get_storage(self._make_storage_options())
+        for key, value in items:
+            self._save(storage, key, value)
+
+    def _save(self, storage: Any, key: str, value: bytes) -> None:
         try:
             storage.save(key, BytesIO(value))
         except TooManyRequests:
@@ -4,7 +4,7 @@ import logging
 import random
 import time
 import uuid
-from collections.abc import Generator
+from collections.abc import Container, Generator, Iterable
 from hashlib import md5
 from typing import Any, Literal, TypedDict
 
@@ -19,6 +19,10 @@ logger = logging.getLogger("sentry.replays")
 
 EVENT_LIMIT = 20
 
+# RRWeb event types. Only custom events carry the breadcrumbs, performance spans and options the
+# DOM index is interested in.
+CUSTOM_EVENT_TYPE = 5
+
 replay_publisher: KafkaPublisher | None = None
 
 ReplayActionsEventPayloadClick = TypedDict(
@@ -82,7 +86,7 @@ def parse_replay_actions(
     project_id: int,
     replay_id: str,
     retention_days: int,
-    segment_data: list[dict[str, Any]],
+    segment_data: Iterable[dict[str, Any]],
     replay_event: dict[str, Any] | None,
 ) -> ReplayActionsEvent | None:
     """Parse RRWeb payload to ReplayActionsEvent."""
@@ -145,10 +149,24 @@ def log_canvas_size(
             )
 
 
+def iter_rrweb_events(
+    segment: bytes, event_types: Container[int]
+) -> Generator[dict[str, Any], None, None]:
+    """Lazily yield the events of a decompressed RRWeb segment matching "event_types".
+
+    The segment is never parsed as a whole. Events are decoded one at a time and every event
+    which is not of a requested type (typically large DOM snapshots and mutations) is dropped
+    as soon as it has been read.
+    """
+    for event in json.iter_array(segment):
+        if isinstance(event, dict) and event.get("type") in event_types:
+            yield event
+
+
 def get_user_actions(
     project_id: int,
     replay_id: str,
-    events: list[dict[str, Any]],
+    events: Iterable[dict[str, Any]],
     replay_event: dict[str, Any] | None,
 ) -> list[ReplayActionsEventPayloadClick]:
     """Return a list of ReplayActionsEventPayloadClick types.
@@ -303,9 +321,9 @@ def _should_report_rage_click_issue(project_id: int) -> bool:
     return all([_project_has_feature_enabled(), _project_has_option_enabled()])
 
 
-def _iter_custom_events(events: list[dict[str, Any]]) -> Generator[dict[str, Any], None, None]:
+def _iter_custom_events(events: Iterable[dict[str, Any]]) -> Generator[dict[str, Any], None, None]:
     for event in events:
-        if event.get("type") == 5:
+        if event.get("type") == CUSTOM_EVENT_TYPE:
             yield event
 
 
@@ -92,12 +92,25 @@ class EventFrequencyForm(forms.Form):
         return cleaned_data
 
 
+class FrequencyQueryCache:
+    """
+    Shares the results of frequency queries between the conditions evaluated for
+    an event. Intervals are anchored to the time the cache was created, so rules
+    asking for the same interval of the same group are answered by one query.
+    """
+
+    def __init__(self) -> None:
+        self.now = timezone.now()
+        self.results: dict[tuple[Any, ...], int] = {}
+
+
 class BaseEventFrequencyCondition(EventCondition, abc.ABC):
     intervals = standard_intervals
     form_cls = EventFrequencyForm
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.tsdb = kwargs.pop("tsdb", tsdb)
+        self.query_cache: FrequencyQueryCache | None = kwargs.pop("query_cache", None)
         self.form_fields = {
             "value": {"type": "number", "placeholder": 100},
             "interval": {
@@ -170,7 +183,13 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         raise NotImplementedError
 
     def query(self, event: GroupEvent, start: datetime, end: datetime, environment_id: str) -> int:
+        cache_key = (self.id, event.group_id, environment_id, start, end)
+        if self.query_cache is not None and cache_key in self.query_cache.results:
+            return self.query_cache.results[cache_key]
+
         query_result = self.query_hook(event, start, end, environment_id)
+        if self.query_cache is not None:
+            self.query_cache.results[cache_key] = query_result
         metrics.incr(
             "rules.conditions.queried_snuba",
             tags={
@@ -188,7 +207,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
 
     def get_rate(self, event: GroupEvent, interval: str, environment_id: str) -> int:
         _, duration = self.intervals[interval]
-        end = timezone.now()
+        end = self.query_cache.now if self.query_cache is not None else timezone.now()
         # For conditions with interval >= 1 hour we don't need to worry about read your writes
         # consistency. Disable it so that we can scale to more nodes.
         option_override_cm: contextlib.AbstractContextManager[object] = contextlib.nullcontext()
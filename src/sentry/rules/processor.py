@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass
 from datetime import timedelta
 from random import randrange
 from typing import Any
@@ -19,6 +20,10 @@ from sentry.models.rulesnooze import RuleSnooze
 from sentry.rules import EventState, history, rules
 from sentry.rules.actions.base import instantiate_action
 from sentry.rules.conditions.base import EventCondition
+from sentry.rules.conditions.event_frequency import (
+    BaseEventFrequencyCondition,
+    FrequencyQueryCache,
+)
 from sentry.rules.filters.base import EventFilter
 from sentry.types.rules import RuleFuture
 from sentry.utils.hashlib import hash_values
@@ -44,6 +49,47 @@ def is_condition_slow(condition: Mapping[str, str]) -> bool:
     return False
 
 
+@dataclass(frozen=True)
+class CompiledRule:
+    """
+    The conditions and filters of a rule, split up and ordered for evaluation.
+    """
+
+    condition_match: str
+    filter_match: str
+    frequency: int
+    filter_list: Sequence[Mapping[str, Any]]
+    # Sorted so that the most expensive conditions run last
+    condition_list: Sequence[Mapping[str, Any]]
+    has_slow_conditions: bool
+
+
+def compile_rule(
+    rule: Rule, get_rule_type: Callable[[Mapping[str, Any]], str | None]
+) -> CompiledRule:
+    """
+    Splits the conditions of `rule` into filters and conditions, ordering the
+    conditions so that the slow ones are evaluated last.
+    """
+    condition_list = []
+    filter_list = []
+    for rule_cond in rule.data.get("conditions", ()):
+        if get_rule_type(rule_cond) == "condition/event":
+            condition_list.append(rule_cond)
+        else:
+            filter_list.append(rule_cond)
+    condition_list.sort(key=lambda condition: is_condition_slow(condition))
+
+    return CompiledRule(
+        condition_match=rule.data.get("action_match") or Rule.DEFAULT_CONDITION_MATCH,
+        filter_match=rule.data.get("filter_match") or Rule.DEFAULT_FILTER_MATCH,
+        frequency=rule.data.get("frequency") or Rule.DEFAULT_FREQUENCY,
+        filter_list=tuple(filter_list),
+        condition_list=tuple(condition_list),
+        has_slow_conditions=any(is_condition_slow(condition) for condition in condition_list),
+    )
+
+
 class RuleProcessor:
     logger = logging.getLogger("sentry.rules")
 
@@ -69,6 +115,8 @@ class RuleProcessor:
         self.grouped_futures: MutableMapping[
             str, tuple[Callable[[GroupEvent, Sequence[RuleFuture]], None], list[RuleFuture]]
         ] = {}
+        # Shared by the frequency conditions of all rules evaluated for the event
+        self.frequency_query_cache = FrequencyQueryCache()
 
     def get_rules(self) -> Sequence[Rule]:
         """Get all of the rules for this project from the DB (or cache)."""
@@ -144,7 +192,15 @@ class RuleProcessor:
             self.logger.warning("Unregistered condition %r", condition["id"])
             return None
 
-        condition_inst = condition_cls(self.project, data=condition, rule=rule)
+        if issubclass(condition_cls, BaseEventFrequencyCondition):
+            condition_inst = condition_cls(
+                self.project,
+                data=condition,
+                rule=rule,
+                query_cache=self.frequency_query_cache,
+            )
+        else:
+            condition_inst = condition_cls(self.project, data=condition, rule=rule)
         if not isinstance(condition_inst, (EventCondition, EventFilter)):
             self.logger.warning("Unregistered condition %r", condition["id"])
             return None
@@ -181,68 +237,83 @@ class RuleProcessor:
         :param rule: `Rule` object
         :return: void
         """
-        logging_details = {
-            "rule_id": rule.id,
-            "group_id": self.group.id,
-            "event_id": self.event.event_id,
-            "project_id": self.project.id,
-            "is_new": self.is_new,
-            "is_regression": self.is_regression,
-            "has_reappeared": self.has_reappeared,
-            "has_escalated": self.has_escalated,
-            "new_group_environment": self.is_new_group_environment,
-        }
-
-        condition_match = rule.data.get("action_match") or Rule.DEFAULT_CONDITION_MATCH
-        filter_match = rule.data.get("filter_match") or Rule.DEFAULT_FILTER_MATCH
-        rule_condition_list = rule.data.get("conditions", ())
-        frequency = rule.data.get("frequency") or Rule.DEFAULT_FREQUENCY
+        compiled = self.get_applicable_rule(rule, status)
+        if compiled is None:
+            return
+
+        if self.predicates_pass(rule, compiled, self.get_state()):
+            self.fire_rule(rule, status, compiled)
+
+    def get_applicable_rule(self, rule: Rule, status: GroupRuleStatus) -> CompiledRule | None:
+        """
+        Returns the compiled rule if it applies to this event's environment and
+        hasn't fired within its frequency, otherwise None.
+        """
+        compiled = compile_rule(rule, self.get_rule_type)
         try:
             environment = self.event.get_environment()
         except Environment.DoesNotExist:
-            return
+            return None
 
         if rule.environment_id is not None and environment.id != rule.environment_id:
-            return
+            return None
 
-        now = timezone.now()
-        freq_offset = now - timedelta(minutes=frequency)
+        freq_offset = timezone.now() - timedelta(minutes=compiled.frequency)
         if status.last_active and status.last_active > freq_offset:
-            return
+            return None
 
-        state = self.get_state()
+        return compiled
 
-        condition_list = []
-        filter_list = []
-        for rule_cond in rule_condition_list:
-            if self.get_rule_type(rule_cond) == "condition/event":
-                condition_list.append(rule_cond)
-            else:
-                filter_list.append(rule_cond)
-
-        # Sort `condition_list` so that most expensive conditions run last.
-        condition_list.sort(key=lambda condition: is_condition_slow(condition))
+    def predicates_pass(
+        self,
+        rule: Rule,
+        compiled: CompiledRule,
+        state: EventState,
+        filters: bool = True,
+        conditions: bool = True,
+    ) -> bool:
+        """
+        Evaluates the filters and/or conditions of the rule. Predicates are
+        evaluated lazily, so expensive conditions only run when the cheaper ones
+        don't decide the match.
+        """
+        predicates = []
+        if filters:
+            predicates.append((compiled.filter_list, compiled.filter_match, "filter"))
+        if conditions:
+            predicates.append((compiled.condition_list, compiled.condition_match, "condition"))
 
-        for predicate_list, match, name in (
-            (filter_list, filter_match, "filter"),
-            (condition_list, condition_match, "condition"),
-        ):
+        for predicate_list, match, name in predicates:
             if not predicate_list:
                 continue
             predicate_iter = (self.condition_matches(f, state, rule) for f in predicate_list)
             predicate_func = get_match_function(match)
             if predicate_func:
                 if not predicate_func(predicate_iter):
-                    return
+                    return False
             else:
                 self.logger.error(
                     f"Unsupported {name}_match {match!r} for rule {rule.id}",
-                    filter_match,
+                    compiled.filter_match,
                     rule.id,
-                    extra={**logging_details},
+                    extra={
+                        "rule_id": rule.id,
+                        "group_id": self.group.id,
+                        "event_id": self.event.event_id,
+                        "project_id": self.project.id,
+                        "is_new": self.is_new,
+                        "is_regression": self.is_regression,
+                        "has_reappeared": self.has_reappeared,
+                        "has_escalated": self.has_escalated,
+                        "new_group_environment": self.is_new_group_environment,
+                    },
                 )
-                return
+                return False
+        return True
 
+    def fire_rule(self, rule: Rule, status: GroupRuleStatus, compiled: CompiledRule) -> None:
+        now = timezone.now()
+        freq_offset = now - timedelta(minutes=compiled.frequency)
         updated = (
             GroupRuleStatus.objects.filter(id=status.id)
             .exclude(last_active__gt=freq_offset)
@@ -300,13 +371,34 @@ class RuleProcessor:
             return {}.values()
 
         self.grouped_futures.clear()
+        self.frequency_query_cache = FrequencyQueryCache()
         rules = self.get_rules()
         snoozed_rules = RuleSnooze.objects.filter(rule__in=rules, user_id=None).values_list(
             "rule", flat=True
         )
         rule_statuses = self.bulk_get_rule_status(rules)
+        state = self.get_state()
+
+        # Rules are evaluated in two passes: every rule is first checked against
+        # its filters and cheap conditions, and only the rules that are still
+        # candidates afterwards go on to evaluate their slow conditions. This keeps
+        # the expensive lookups to the smallest possible set of rules.
+        slow_rules: list[tuple[Rule, GroupRuleStatus, CompiledRule]] = []
         for rule in rules:
-            if rule.id not in snoozed_rules:
-                self.apply_rule(rule, rule_statuses[rule.id])
+            if rule.id in snoozed_rules:
+                continue
+            status = rule_statuses[rule.id]
+            compiled = self.get_applicable_rule(rule, status)
+            if compiled is None:
+                continue
+            if compiled.has_slow_conditions:
+                if self.predicates_pass(rule, compiled, state, conditions=False):
+                    slow_rules.append((rule, status, compiled))
+            elif self.predicates_pass(rule, compiled, state):
+                self.fire_rule(rule, status, compiled)
+
+        for rule, status, compiled in slow_rules:
+            if self.predicates_pass(rule, compiled, state, filters=False):
+                self.fire_rule(rule, status, compiled)
 
         return self.grouped_futures.values()
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
 from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timedelta
 
+from cachetools import LRUCache
 from django.conf import settings
 from django.core.cache import caches
 
@@ -33,6 +35,7 @@ _INDEXER_CACHE_RESOLVE_CACHE_REPLENISHMENT_METRIC = (
 _INDEXER_CACHE_DOUBLE_WRITE_METRIC = "sentry_metrics.indexer.memcache.double-write"
 _INDEXER_CACHE_DOUBLE_READ_METRIC = "sentry_metrics.indexer.memcache.new-schema-read"
 _INDEXER_CACHE_STALE_KEYS_METRIC = "sentry_metrics.indexer.memcache.stale-keys"
+_INDEXER_CACHE_REVERSE_RESOLVE_METRIC = "sentry_metrics.indexer.memcache.reverse-resolve"
 
 # only used to compare to the older version of the PGIndexer
 _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
@@ -40,9 +43,14 @@ _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
 
 NAMESPACED_WRITE_FEAT_FLAG = "sentry-metrics.indexer.write-new-cache-namespace"
 NAMESPACED_READ_FEAT_FLAG = "sentry-metrics.indexer.read-new-cache-namespace"
+REVERSE_RESOLVE_CACHE_FEAT_FLAG = "sentry-metrics.indexer.reverse-resolve-cache"
 
 BULK_RECORD_CACHE_NAMESPACE = "br"
 RESOLVE_CACHE_NAMESPACE = "res"
+REVERSE_RESOLVE_CACHE_NAMESPACE = "rev"
+
+# Maximum number of reverse resolved strings that are kept in memory by each process.
+REVERSE_RESOLVE_LOCAL_CACHE_SIZE = 10000
 
 
 class StringIndexerCache:
@@ -189,6 +197,31 @@ class StringIndexerCache:
                 namespaced_cache_key_values, timeout=self.randomized_ttl, version=self.version
             )
 
+    def _make_reverse_cache_key(self, use_case_id: UseCaseID, org_id: int, id: int) -> str:
+        return (
+            f"indexer:{self.partition_key}:{REVERSE_RESOLVE_CACHE_NAMESPACE}:org:id:"
+            f"{use_case_id.value}:{org_id}:{id}"
+        )
+
+    def get_many_reverse(
+        self, use_case_id: UseCaseID, org_id: int, ids: Iterable[int]
+    ) -> MutableMapping[int, str]:
+        """
+        Returns the cached strings of the given ids, ids which are not cached are omitted.
+        """
+        cache_keys = {self._make_reverse_cache_key(use_case_id, org_id, id): id for id in ids}
+        results = self.cache.get_many(cache_keys.keys(), version=self.version)
+        return {cache_keys[key]: value for key, value in results.items() if value is not None}
+
+    def set_many_reverse(
+        self, use_case_id: UseCaseID, org_id: int, id_values: Mapping[int, str]
+    ) -> None:
+        cache_key_values = {
+            self._make_reverse_cache_key(use_case_id, org_id, id): string
+            for id, string in id_values.items()
+        }
+        self.cache.set_many(cache_key_values, timeout=self.randomized_ttl, version=self.version)
+
     def delete(self, namespace: str, key: str) -> None:
         self.cache.delete(self._make_cache_key(key), version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
@@ -209,6 +242,12 @@ class CachingIndexer(StringIndexer):
     def __init__(self, cache: StringIndexerCache, indexer: StringIndexer) -> None:
         self.cache = cache
         self.indexer = indexer
+        # Reverse resolved strings never change for a given id, so they are also kept in a
+        # process-local cache in front of the shared one.
+        self._reverse_resolve_cache: LRUCache[tuple[str, int, int], str] = LRUCache(
+            maxsize=REVERSE_RESOLVE_LOCAL_CACHE_SIZE
+        )
+        self._reverse_resolve_lock = threading.Lock()
 
     def bulk_record(
         self, strings: Mapping[UseCaseID, Mapping[OrgId, set[str]]]
@@ -298,12 +337,60 @@ class CachingIndexer(StringIndexer):
 
     @metric_path_key_compatible_rev_resolve
     def reverse_resolve(self, use_case_id: UseCaseID, org_id: int, id: int) -> str | None:
-        return self.indexer.reverse_resolve(use_case_id, org_id, id)
+        if not options.get(REVERSE_RESOLVE_CACHE_FEAT_FLAG):
+            return self.indexer.reverse_resolve(use_case_id, org_id, id)
+
+        return self.bulk_reverse_resolve(use_case_id, org_id, [id]).get(id)
 
     def bulk_reverse_resolve(
         self, use_case_id: UseCaseID, org_id: int, ids: Collection[int]
     ) -> Mapping[int, str]:
-        return self.indexer.bulk_reverse_resolve(use_case_id, org_id, ids)
+        if not options.get(REVERSE_RESOLVE_CACHE_FEAT_FLAG):
+            return self.indexer.bulk_reverse_resolve(use_case_id, org_id, ids)
+
+        results: dict[int, str] = {}
+        missing_ids = set()
+        with self._reverse_resolve_lock:
+            for id in ids:
+                string = self._reverse_resolve_cache.get((use_case_id.value, org_id, id))
+                if string is None:
+                    missing_ids.add(id)
+                else:
+                    results[id] = string
+
+        metrics.incr(
+            _INDEXER_CACHE_REVERSE_RESOLVE_METRIC,
+            tags={"cache_hit": "local", "use_case": use_case_id.value},
+            amount=len(results),
+        )
+        if not missing_ids:
+            return results
+
+        fetched_results = self.cache.get_many_reverse(use_case_id, org_id, missing_ids)
+        metrics.incr(
+            _INDEXER_CACHE_REVERSE_RESOLVE_METRIC,
+            tags={"cache_hit": "true", "use_case": use_case_id.value},
+            amount=len(fetched_results),
+        )
+
+        db_ids = missing_ids - fetched_results.keys()
+        if db_ids:
+            metrics.incr(
+                _INDEXER_CACHE_REVERSE_RESOLVE_METRIC,
+                tags={"cache_hit": "false", "use_case": use_case_id.value},
+                amount=len(db_ids),
+            )
+            db_results = self.indexer.bulk_reverse_resolve(use_case_id, org_id, db_ids)
+            if db_results:
+                self.cache.set_many_reverse(use_case_id, org_id, db_results)
+                fetched_results.update(db_results)
+
+        with self._reverse_resolve_lock:
+            for id, string in fetched_results.items():
+                self._reverse_resolve_cache[(use_case_id.value, org_id, id)] = string
+
+        results.update(fetched_results)
+        return results
 
     def resolve_shared_org(self, string: str) -> int | None:
         raise NotImplementedError(
@@ -1,10 +1,11 @@
 from collections.abc import Sequence
+from dataclasses import replace
 from datetime import datetime
 from typing import cast
 
 from snuba_sdk import MetricsQuery, MetricsScope, Rollup
 
-from sentry import features
+from sentry import features, options
 from sentry.models.environment import Environment
 from sentry.models.organization import Organization
 from sentry.models.project import Project
@@ -15,10 +16,133 @@ from sentry.sentry_metrics.querying.data_v2.preparation.base import (
     IntermediateQuery,
     run_preparation_steps,
 )
+from sentry.sentry_metrics.querying.data_v2.preparation.metric_ids_resolution import (
+    MetricIdsResolutionStep,
+)
 from sentry.sentry_metrics.querying.data_v2.preparation.units_normalization import (
     UnitNormalizationStep,
 )
 from sentry.sentry_metrics.querying.types import QueryType
+from sentry.utils.cache import cache
+from sentry.utils.hashlib import md5_text
+
+QUERY_PLAN_CACHE_KEY_PREFIX = "ddm.metrics-api.query-plan"
+
+
+def _get_query_plan_cache_key(
+    metrics_queries_plan: MetricsQueriesPlan,
+    interval: int,
+    organization: Organization,
+    projects: Sequence[Project],
+    environments: Sequence[Environment],
+    unit_normalization: bool,
+) -> str:
+    hashed = md5_text(
+        repr(
+            (
+                [
+                    (formula.mql, formula.order and formula.order.value, formula.limit)
+                    for formula in metrics_queries_plan.get_replaced_formulas()
+                ],
+                sorted(project.id for project in projects),
+                sorted(environment.id for environment in environments),
+                interval,
+                unit_normalization,
+            )
+        )
+    ).hexdigest()
+    return f"{QUERY_PLAN_CACHE_KEY_PREFIX}:{organization.id}:{hashed}"
+
+
+def _prepare_intermediate_queries(
+    metrics_queries_plan: MetricsQueriesPlan,
+    base_query: MetricsQuery,
+    interval: int,
+    organization: Organization,
+    projects: Sequence[Project],
+    environments: Sequence[Environment],
+    unit_normalization: bool,
+) -> list[IntermediateQuery]:
+    intermediate_queries = []
+    # We parse the query plan and obtain a series of queries.
+    parser = QueryParser(
+        projects=projects, environments=environments, metrics_queries_plan=metrics_queries_plan
+    )
+    for query_expression, query_order, query_limit in parser.generate_queries():
+        intermediate_queries.append(
+            IntermediateQuery(
+                metrics_query=base_query.set_query(query_expression).set_rollup(
+                    Rollup(interval=interval)
+                ),
+                order=query_order,
+                limit=query_limit,
+            )
+        )
+
+    preparation_steps = [MetricIdsResolutionStep(organization)]
+    if unit_normalization:
+        preparation_steps.append(UnitNormalizationStep())
+
+    # We run a series of preparation steps which operate on the entire list of queries.
+    return run_preparation_steps(intermediate_queries, *preparation_steps)
+
+
+def _get_intermediate_queries(
+    metrics_queries_plan: MetricsQueriesPlan,
+    base_query: MetricsQuery,
+    interval: int,
+    organization: Organization,
+    projects: Sequence[Project],
+    environments: Sequence[Environment],
+) -> list[IntermediateQuery]:
+    """
+    Returns the prepared queries of the plan, reusing a previously prepared version of the same plan
+    when the query plan cache is enabled.
+
+    Only the time range and scope of the queries change between requests with the same plan, thus
+    the cached queries are bound to the `base_query` before being returned.
+    """
+    unit_normalization = features.has(
+        "organizations:ddm-metrics-api-unit-normalization", organization=organization, actor=None
+    )
+
+    cache_ttl = options.get("ddm.metrics-api.query-plan-cache-ttl")
+    if not cache_ttl:
+        return _prepare_intermediate_queries(
+            metrics_queries_plan,
+            base_query,
+            interval,
+            organization,
+            projects,
+            environments,
+            unit_normalization,
+        )
+
+    cache_key = _get_query_plan_cache_key(
+        metrics_queries_plan, interval, organization, projects, environments, unit_normalization
+    )
+    intermediate_queries = cache.get(cache_key)
+    if intermediate_queries is None:
+        intermediate_queries = _prepare_intermediate_queries(
+            metrics_queries_plan,
+            base_query,
+            interval,
+            organization,
+            projects,
+            environments,
+            unit_normalization,
+        )
+        cache.set(cache_key, intermediate_queries, cache_ttl)
+
+    return [
+        replace(
+            intermediate_query,
+            metrics_query=base_query.set_query(intermediate_query.metrics_query.query).set_rollup(
+                Rollup(interval=interval)
+            ),
+        )
+        for intermediate_query in intermediate_queries
+    ]
 
 
 def run_metrics_queries_plan(
@@ -47,30 +171,10 @@ def run_metrics_queries_plan(
         ),
     )
 
-    intermediate_queries = []
-    # We parse the query plan and obtain a series of queries.
-    parser = QueryParser(
-        projects=projects, environments=environments, metrics_queries_plan=metrics_queries_plan
+    # We parse and prepare the queries of the plan, which might come from the query plan cache.
+    intermediate_queries = _get_intermediate_queries(
+        metrics_queries_plan, base_query, interval, organization, projects, environments
     )
-    for query_expression, query_order, query_limit in parser.generate_queries():
-        intermediate_queries.append(
-            IntermediateQuery(
-                metrics_query=base_query.set_query(query_expression).set_rollup(
-                    Rollup(interval=interval)
-                ),
-                order=query_order,
-                limit=query_limit,
-            )
-        )
-
-    preparation_steps = []
-    if features.has(
-        "organizations:ddm-metrics-api-unit-normalization", organization=organization, actor=None
-    ):
-        preparation_steps.append(UnitNormalizationStep())
-
-    # We run a series of preparation steps which operate on the entire list of queries.
-    intermediate_queries = run_preparation_steps(intermediate_queries, *preparation_steps)
 
     # We prepare the executor, that will be responsible for scheduling the execution of multiple queries.
     executor = QueryExecutor(organization=organization, projects=projects, referrer=referrer)
@@ -0,0 +1,30 @@
+from dataclasses import replace
+
+from sentry.models.organization import Organization
+from sentry.sentry_metrics.querying.data_v2.preparation.base import (
+    IntermediateQuery,
+    PreparationStep,
+)
+from sentry.sentry_metrics.querying.visitors import MetricIdsResolutionVisitor
+
+
+class MetricIdsResolutionStep(PreparationStep):
+    def __init__(self, organization: Organization):
+        self._organization = organization
+
+    def run(self, intermediate_queries: list[IntermediateQuery]) -> list[IntermediateQuery]:
+        resolved_intermediate_queries = []
+
+        for intermediate_query in intermediate_queries:
+            # We resolve the metric ids upfront, so that they are part of the prepared queries.
+            resolved_query = MetricIdsResolutionVisitor(self._organization.id).visit(
+                intermediate_query.metrics_query.query
+            )
+            resolved_intermediate_queries.append(
+                replace(
+                    intermediate_query,
+                    metrics_query=intermediate_query.metrics_query.set_query(resolved_query),
+                )
+            )
+
+        return resolved_intermediate_queries
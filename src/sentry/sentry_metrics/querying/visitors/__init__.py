@@ -6,6 +6,7 @@ from .query_condition import (
 )
 from .query_expression import (
     EnvironmentsInjectionVisitor,
+    MetricIdsResolutionVisitor,
     QueriedMetricsVisitor,
     QueryConditionsCompositeVisitor,
     QueryValidationV2Visitor,
@@ -30,4 +31,5 @@ __all__ = [
     "QueriedMetricsVisitor",
     "UsedGroupBysVisitor",
     "UnitsNormalizationV2Visitor",
+    "MetricIdsResolutionVisitor",
 ]
@@ -20,6 +20,7 @@ from sentry.sentry_metrics.querying.visitors.base import (
     QueryConditionVisitor,
     QueryExpressionVisitor,
 )
+from sentry.sentry_metrics.utils import resolve_weak, string_to_use_case_id
 from sentry.snuba.metrics import parse_mri
 
 
@@ -211,6 +212,35 @@ class QueryConditionsCompositeVisitor(QueryExpressionVisitor[QueryExpression]):
         return visited_condition_group
 
 
+class MetricIdsResolutionVisitor(QueryExpressionVisitor[QueryExpression]):
+    """
+    Visitor that recursively resolves the id of the metric of all `Timeseries` with the indexer.
+
+    Metrics that can't be resolved are left untouched, so that they are resolved again when the
+    query is executed.
+    """
+
+    def __init__(self, organization_id: int):
+        self._organization_id = organization_id
+
+    def _visit_timeseries(self, timeseries: Timeseries) -> QueryExpression:
+        metric = timeseries.metric
+        if metric.id is not None or metric.mri is None:
+            return timeseries
+
+        parsed_mri = parse_mri(metric.mri)
+        if parsed_mri is None:
+            return timeseries
+
+        metric_id = resolve_weak(
+            string_to_use_case_id(parsed_mri.namespace), self._organization_id, metric.mri
+        )
+        if metric_id < 0:
+            return timeseries
+
+        return timeseries.set_metric(metric.set_id(metric_id))
+
+
 class QueriedMetricsVisitor(QueryExpressionVisitor[set[str]]):
     """
     Visitor that recursively computes all the metrics MRI of the `QueryExpression`.
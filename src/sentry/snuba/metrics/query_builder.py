@@ -41,6 +41,7 @@ from sentry.search.events.types import QueryBuilderConfig, WhereType
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.sentry_metrics.utils import (
     STRING_NOT_FOUND,
+    bulk_reverse_resolve_tag_value,
     resolve_tag_key,
     resolve_tag_value,
     resolve_weak,
@@ -1348,12 +1349,27 @@ class SnubaResultConverter:
             else {}
         )
 
+        # We reverse resolve all the tag values of the result set in bulk, values which are not
+        # found are resolved again one by one, to keep the behavior of missing values unchanged.
+        resolved_tag_values = bulk_reverse_resolve_tag_value(
+            self._use_case_id,
+            self._organization_id,
+            [
+                value
+                for tags in groups
+                for key, value in tags
+                if groupby_alias_to_groupby_column.get(key) not in NON_RESOLVABLE_TAG_VALUES
+            ],
+        )
+
         groups = [
             dict(
                 by=dict(
                     (
                         key,
-                        reverse_resolve_tag_value(
+                        resolved_tag_values[value]
+                        if value in resolved_tag_values
+                        else reverse_resolve_tag_value(
                             self._use_case_id, self._organization_id, value, weak=True
                         ),
                     )
@@ -22,7 +22,12 @@ from snuba_sdk.mql.mql import parse_mql
 
 from sentry.exceptions import InvalidParams
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
-from sentry.sentry_metrics.utils import resolve_weak, reverse_resolve_weak, string_to_use_case_id
+from sentry.sentry_metrics.utils import (
+    bulk_reverse_resolve,
+    resolve_weak,
+    reverse_resolve_weak,
+    string_to_use_case_id,
+)
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.metrics.naming_layer.mapping import get_mri
 from sentry.snuba.metrics.naming_layer.mri import parse_mri
@@ -505,17 +510,32 @@ def convert_snuba_result(
     """
     if dataset == Dataset.PerformanceMetrics.value:
         return snuba_result
+
+    use_case_id = string_to_use_case_id(use_case_id_str)
+    # Reverse mappings are not saved in initial resolve for columns which were only specified in groupby, so we
+    # reverse resolve all of them in bulk.
+    resolved_tag_values = bulk_reverse_resolve(
+        use_case_id,
+        org_id,
+        {
+            int(data_point[key])
+            for data_point in snuba_result["data"]
+            for key in data_point
+            if key in reverse_mappings.tag_keys
+            and data_point[key] not in reverse_mappings.reverse_mappings
+        },
+    )
     for data_point in snuba_result["data"]:
         for key in data_point:
             if key in reverse_mappings.tag_keys:
                 if data_point[key] in reverse_mappings.reverse_mappings:
                     data_point[key] = reverse_mappings.reverse_mappings[data_point[key]]
+                elif int(data_point[key]) in resolved_tag_values:
+                    data_point[key] = resolved_tag_values[int(data_point[key])]
                 else:
-                    # Reverse mapping was not saved in initial resolve, this means column was only specfied in groupby.
-                    # We need to manually do a reverse resolve here.
-                    reverse_resolve = reverse_resolve_weak(
-                        string_to_use_case_id(use_case_id_str), org_id, int(data_point[key])
-                    )
+                    # Values which were not found in bulk are resolved again one by one, to keep the behavior
+                    # of missing values unchanged.
+                    reverse_resolve = reverse_resolve_weak(use_case_id, org_id, int(data_point[key]))
                     if reverse_resolve:
                         data_point[key] = reverse_resolve
     return snuba_result
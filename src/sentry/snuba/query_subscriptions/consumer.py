@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import timezone
 
 import sentry_sdk
@@ -16,8 +16,12 @@ from sentry.utils import metrics
 
 logger = logging.getLogger(__name__)
 TQuerySubscriptionCallable = Callable[[QuerySubscriptionUpdate, QuerySubscription], None]
+TQuerySubscriptionBatchCallable = Callable[
+    [Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]], None
+]
 
 subscriber_registry: dict[str, TQuerySubscriptionCallable] = {}
+batch_subscriber_registry: dict[str, TQuerySubscriptionBatchCallable] = {}
 
 
 def register_subscriber(
@@ -32,6 +36,24 @@ def register_subscriber(
     return inner
 
 
+def register_batch_subscriber(
+    subscriber_key: str,
+) -> Callable[[TQuerySubscriptionBatchCallable], TQuerySubscriptionBatchCallable]:
+    """
+    Registers a handler that processes many updates of the given subscription type at once when
+    the consumer runs in batched mode. A regular subscriber must be registered for the same type,
+    which is used when updates are handled one at a time.
+    """
+
+    def inner(func: TQuerySubscriptionBatchCallable) -> TQuerySubscriptionBatchCallable:
+        if subscriber_key in batch_subscriber_registry:
+            raise Exception("Batch handler already registered for %s" % subscriber_key)
+        batch_subscriber_registry[subscriber_key] = func
+        return func
+
+    return inner
+
+
 def parse_message_value(
     value: bytes, jsoncodec: Codec[SubscriptionResult]
 ) -> QuerySubscriptionUpdate:
@@ -107,34 +129,9 @@ def handle_message(
                     metrics.incr("snuba_query_subscriber.subscription_inactive")
                     return
         except QuerySubscription.DoesNotExist:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset}
+            _handle_missing_subscription(
+                contents, message_value, message_offset, message_partition, topic, dataset
             )
-            logger.warning(
-                "Received subscription update, but subscription does not exist",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
-            try:
-                if topic in topic_to_dataset:
-                    _delete_from_snuba(
-                        topic_to_dataset[topic],
-                        contents["subscription_id"],
-                        EntityKey(contents["entity"]),
-                    )
-                else:
-                    logger.exception(
-                        "Topic not registered with QuerySubscriptionConsumer, can't remove "
-                        "non-existent subscription from Snuba",
-                        extra={"topic": topic, "subscription_id": contents["subscription_id"]},
-                    )
-            except InvalidMessageError as e:
-                logger.exception(str(e))
-            except Exception:
-                logger.exception("Failed to delete unused subscription from snuba.")
             return
 
         if subscription.type not in subscriber_registry:
@@ -173,6 +170,143 @@ def handle_message(
             callback(contents, subscription)
 
 
+def _handle_missing_subscription(
+    contents: QuerySubscriptionUpdate,
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    topic: str,
+    dataset: str,
+) -> None:
+    metrics.incr("snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset})
+    logger.warning(
+        "Received subscription update, but subscription does not exist",
+        extra={
+            "offset": message_offset,
+            "partition": message_partition,
+            "value": message_value,
+        },
+    )
+    try:
+        if topic in topic_to_dataset:
+            _delete_from_snuba(
+                topic_to_dataset[topic],
+                contents["subscription_id"],
+                EntityKey(contents["entity"]),
+            )
+        else:
+            logger.exception(
+                "Topic not registered with QuerySubscriptionConsumer, can't remove "
+                "non-existent subscription from Snuba",
+                extra={"topic": topic, "subscription_id": contents["subscription_id"]},
+            )
+    except InvalidMessageError as e:
+        logger.exception(str(e))
+    except Exception:
+        logger.exception("Failed to delete unused subscription from snuba.")
+
+
+def handle_message_batch(
+    messages: Sequence[tuple[bytes, int, int]],
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> None:
+    """
+    Batched counterpart of `handle_message`. Accepts `(value, offset, partition)` tuples, loads
+    the subscriptions of all of them with a single query and hands the updates of each
+    subscription type to its batch handler, if one is registered. Updates are otherwise passed to
+    the regular handler one at a time, in order.
+    """
+    parsed: list[tuple[QuerySubscriptionUpdate, bytes, int, int]] = []
+    for message_value, message_offset, message_partition in messages:
+        try:
+            with metrics.timer(
+                "snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}
+            ):
+                contents = parse_message_value(message_value, jsoncodec)
+        except InvalidMessageError:
+            logger.exception(
+                "Subscription update could not be parsed",
+                extra={
+                    "offset": message_offset,
+                    "partition": message_partition,
+                    "value": message_value,
+                },
+            )
+            continue
+        parsed.append((contents, message_value, message_offset, message_partition))
+
+    with metrics.timer("snuba_query_subscriber.fetch_subscriptions", tags={"dataset": dataset}):
+        subscriptions = {
+            subscription.subscription_id: subscription
+            for subscription in QuerySubscription.objects.filter(
+                subscription_id__in={contents["subscription_id"] for contents, *_ in parsed}
+            ).select_related("snuba_query")
+        }
+
+    updates_by_type: dict[str, list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = {}
+    for contents, message_value, message_offset, message_partition in parsed:
+        subscription = subscriptions.get(contents["subscription_id"])
+        if subscription is None:
+            _handle_missing_subscription(
+                contents, message_value, message_offset, message_partition, topic, dataset
+            )
+            continue
+        if subscription.status != QuerySubscription.Status.ACTIVE.value:
+            metrics.incr("snuba_query_subscriber.subscription_inactive")
+            continue
+        if subscription.type not in subscriber_registry:
+            metrics.incr(
+                "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
+            )
+            logger.error(
+                "Received subscription update, but no subscription handler registered",
+                extra={
+                    "offset": message_offset,
+                    "partition": message_partition,
+                    "value": message_value,
+                },
+            )
+            continue
+        updates_by_type.setdefault(subscription.type, []).append((contents, subscription))
+
+    for subscription_type, updates in updates_by_type.items():
+        metrics.distribution(
+            "snuba_query_subscriber.batch_size",
+            len(updates),
+            tags={"dataset": dataset, "subscription_type": subscription_type},
+        )
+        if subscription_type in batch_subscriber_registry:
+            try:
+                with metrics.timer(
+                    "snuba_query_subscriber.batch_callback.duration",
+                    instance=subscription_type,
+                    tags={"dataset": dataset},
+                ):
+                    batch_subscriber_registry[subscription_type](updates)
+            except Exception:
+                logger.exception(
+                    "Failed to handle subscription update batch",
+                    extra={"subscription_type": subscription_type},
+                )
+        else:
+            callback = subscriber_registry[subscription_type]
+            for contents, subscription in updates:
+                try:
+                    with metrics.timer(
+                        "snuba_query_subscriber.callback.duration",
+                        instance=subscription_type,
+                        tags={"dataset": dataset},
+                    ):
+                        callback(contents, subscription)
+                except Exception:
+                    logger.exception(
+                        "Failed to handle subscription update",
+                        extra={"subscription_id": contents["subscription_id"]},
+                    )
+
+
 class InvalidMessageError(Exception):
     pass
 
@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Mapping
 from functools import partial
+from typing import Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
@@ -10,6 +11,7 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.types import BrokerValue, Commit, Message, Partition
 from sentry_kafka_schemas import get_codec
 
@@ -33,6 +35,7 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         input_block_size: int | None,
         output_block_size: int | None,
         multi_proc: bool = True,
+        mode: Literal["serial", "batched"] = "serial",
     ):
         self.dataset = Dataset(dataset)
         self.logical_topic = dataset_to_logical_topic[self.dataset]
@@ -42,6 +45,7 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         self.input_block_size = input_block_size
         self.output_block_size = output_block_size
         self.multi_proc = multi_proc
+        self.batched = mode == "batched"
         self.pool = MultiprocessingPool(num_processes)
 
     def create_with_partitions(
@@ -49,6 +53,18 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        if self.batched:
+            # Updates are accumulated into batches, so that everything needed to process them can
+            # be loaded once per batch rather than once per update.
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    partial(process_message_batch, self.dataset, self.topic, self.logical_topic),
+                    CommitOffsets(commit),
+                ),
+            )
+
         callable = partial(process_message, self.dataset, self.topic, self.logical_topic)
         if self.multi_proc:
             return RunTaskWithMultiprocessing(
@@ -104,3 +120,35 @@ def process_message(
                     "value": message_value,
                 },
             )
+
+
+def process_message_batch(
+    dataset: Dataset,
+    topic: str,
+    logical_topic: str,
+    message: Message[ValuesBatch[KafkaPayload]],
+) -> None:
+    from sentry.snuba.query_subscriptions.consumer import handle_message_batch
+    from sentry.utils import metrics
+
+    messages = []
+    for value in message.payload:
+        assert isinstance(value, BrokerValue)
+        messages.append((value.payload.value, value.offset, value.partition.index))
+
+    with sentry_sdk.start_transaction(
+        op="handle_message_batch",
+        name="query_subscription_consumer_process_message_batch",
+        sampled=in_random_rollout("subscriptions-query.sample-rate"),
+    ), metrics.timer(
+        "snuba_query_subscriber.handle_message_batch", tags={"dataset": dataset.value}
+    ):
+        try:
+            handle_message_batch(messages, topic, dataset.value, get_codec(logical_topic))
+        except Exception:
+            # Same failsafe as in `process_message`: a bad batch must not block the consumer.
+            logger.exception(
+                "Unexpected error while handling message batch in QuerySubscriptionStrategy. "
+                "Skipping batch.",
+                extra={"batch_size": len(messages)},
+            )
@@ -48,6 +48,18 @@ def _safe_get_frames(stacktrace) -> Sequence[dict[str, Any]]:
 
 
 class ProcessableFrame:
+    __slots__ = (
+        "frame",
+        "idx",
+        "processor",
+        "stacktrace_info",
+        "data",
+        "cache_key",
+        "cache_value",
+        "processable_frames",
+        "closed",
+    )
+
     def __init__(self, frame, idx, processor, stacktrace_info, processable_frames):
         self.frame = frame
         self.idx = idx
@@ -57,6 +69,7 @@ class ProcessableFrame:
         self.cache_key = None
         self.cache_value = None
         self.processable_frames = processable_frames
+        self.closed = False
 
     def __repr__(self):
         return "<ProcessableFrame {!r} #{!r} at {!r}>".format(
@@ -531,10 +544,14 @@ def get_crash_frame_from_event_data(data, frame_filter=None):
 
 
 def lookup_frame_cache(keys):
-    rv = {}
-    for key in keys:
-        rv[key] = cache.get(key)
-    return rv
+    """Fetches the cached values for all given frame cache keys in a single
+    round trip.  Keys that are not cached map to `None`.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    found = cache.get_many(keys)
+    return {key: found.get(key) for key in keys}
 
 
 def get_stacktrace_processing_task(infos, processors):
@@ -542,7 +559,10 @@ def get_stacktrace_processing_task(infos, processors):
     processors that seem to not handle any frames.
     """
     by_processor: dict[str, list[Any]] = {}
-    to_lookup: dict[str, str] = {}
+    # Identical frames (for instance the same native frame showing up in the
+    # exception and in the crashing thread) share a cache key.  All of them
+    # need the cache value, but the key only has to be fetched once.
+    to_lookup: dict[str, list[ProcessableFrame]] = {}
 
     # by_stacktrace_info requires stable sorting as it is used in
     # StacktraceProcessingTask.iter_processable_stacktraces. This is important
@@ -558,11 +578,13 @@ def get_stacktrace_processing_task(infos, processors):
                 processable_frame
             )
             if processable_frame.cache_key is not None:
-                to_lookup[processable_frame.cache_key] = processable_frame
+                to_lookup.setdefault(processable_frame.cache_key, []).append(processable_frame)
 
     frame_cache = lookup_frame_cache(to_lookup)
-    for cache_key, processable_frame in to_lookup.items():
-        processable_frame.cache_value = frame_cache.get(cache_key)
+    for cache_key, processable_frames_for_key in to_lookup.items():
+        cache_value = frame_cache.get(cache_key)
+        for processable_frame in processable_frames_for_key:
+            processable_frame.cache_value = cache_value
 
     return StacktraceProcessingTask(
         processable_stacktraces=by_stacktrace_info, processors=by_processor
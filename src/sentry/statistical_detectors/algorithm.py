@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping, MutableMapping
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -100,6 +100,13 @@ class DetectorAlgorithm(ABC):
     ) -> tuple[TrendType, float, DetectorState | None]:
         ...
 
+    def bulk_update(
+        self,
+        raw_states: Sequence[Mapping[str | bytes, bytes | float | int | str]],
+        payloads: Sequence[DetectorPayload],
+    ) -> list[tuple[TrendType, float, DetectorState | None]]:
+        return [self.update(raw_state, payload) for raw_state, payload in zip(raw_states, payloads)]
+
 
 class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
     def __init__(
@@ -123,16 +130,48 @@ class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
         raw_state: Mapping[str | bytes, bytes | float | int | str],
         payload: DetectorPayload,
     ) -> tuple[TrendType, float, DetectorState | None]:
+        return self._update(
+            self._load_state(raw_state),
+            payload,
+            self.moving_avg_short_factory(),
+            self.moving_avg_long_factory(),
+        )
+
+    def bulk_update(
+        self,
+        raw_states: Sequence[Mapping[str | bytes, bytes | float | int | str]],
+        payloads: Sequence[DetectorPayload],
+    ) -> list[tuple[TrendType, float, DetectorState | None]]:
+        # The moving averages are stateless, so a single instance of each
+        # can be shared by every payload in the batch.
+        moving_avg_short = self.moving_avg_short_factory()
+        moving_avg_long = self.moving_avg_long_factory()
+
+        return [
+            self._update(self._load_state(raw_state), payload, moving_avg_short, moving_avg_long)
+            for raw_state, payload in zip(raw_states, payloads)
+        ]
+
+    def _load_state(
+        self, raw_state: Mapping[str | bytes, bytes | float | int | str]
+    ) -> MovingAverageDetectorState:
         try:
-            old = MovingAverageDetectorState.from_redis_dict(raw_state)
+            return MovingAverageDetectorState.from_redis_dict(raw_state)
         except Exception as e:
-            old = MovingAverageDetectorState.empty()
-
             if raw_state:
                 # empty raw state implies that there was no
                 # previous state so no need to capture an exception
                 sentry_sdk.capture_exception(e)
 
+            return MovingAverageDetectorState.empty()
+
+    def _update(
+        self,
+        old: MovingAverageDetectorState,
+        payload: DetectorPayload,
+        moving_avg_short: MovingAverage,
+        moving_avg_long: MovingAverage,
+    ) -> tuple[TrendType, float, DetectorState | None]:
         if old.timestamp is not None and old.timestamp > payload.timestamp:
             # In the event that the timestamp is before the payload's timestamps,
             # we do not want to process this payload.
@@ -145,9 +184,6 @@ class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
             )
             return TrendType.Skipped, 0, None
 
-        moving_avg_short = self.moving_avg_short_factory()
-        moving_avg_long = self.moving_avg_long_factory()
-
         new = MovingAverageDetectorState(
             timestamp=payload.timestamp,
             count=old.count + 1,
@@ -116,11 +116,11 @@ class RegressionDetector(ABC):
 
             states = []
 
-            for raw_state, payload in zip(raw_states, payloads):
+            for payload, (trend_type, score, new_state) in zip(
+                payloads, algorithm.bulk_update(raw_states, payloads)
+            ):
                 unique_project_ids.add(payload.project_id)
 
-                trend_type, score, new_state = algorithm.update(raw_state, payload)
-
                 if trend_type == TrendType.Regressed:
                     regressed_count += 1
                 elif trend_type == TrendType.Improved:
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import functools
 import math
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import sentry_sdk
 from celery import Task
 from django.conf import settings
+from django.db import connections
 from django.db.models import Max, Min
 
+from sentry import options
 from sentry.models.outbox import ControlOutboxBase, OutboxBase, OutboxFlushError, RegionOutboxBase
 from sentry.silo.base import SiloMode
 from sentry.tasks.backfill_outboxes import backfill_outboxes_for
@@ -167,33 +173,76 @@ def drain_outbox_shards_control(
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
-    processed_count: int = 0
-    for shard_attributes in outbox_model.find_scheduled_shards(
-        outbox_identifier_low, outbox_identifier_hi
-    ):
-        shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
-        if not shard_outbox:
-            continue
-
-        try:
-            processed_count += 1
-            shard_outbox.drain_shard(flush_all=True)
-        except Exception as e:
-            with sentry_sdk.push_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
+    start = time.monotonic()
+    shards = outbox_model.find_scheduled_shards(outbox_identifier_low, outbox_identifier_hi)
+    worker_threads = options.get("hybridcloud.outbox.drain.worker_threads")
+
+    # Distinct shards are always deliverable in parallel, so they can be drained concurrently.
+    # Each shard is still drained in order by exactly one worker.
+    if worker_threads > 1 and len(shards) > 1:
+        with ThreadPoolExecutor(max_workers=worker_threads) as threadpool:
+            processed_count = sum(
+                threadpool.map(functools.partial(_drain_shard_in_thread, outbox_model), shards)
+            )
+    else:
+        processed_count = sum(
+            _drain_scheduled_shard(outbox_model, shard_attributes) for shard_attributes in shards
+        )
+
+    duration = time.monotonic() - start
+    metrics_tags = dict(outbox_name=outbox_model._meta.label_lower)
+    metrics.distribution(
+        "deliver_from_outbox.scheduled_shards", len(shards), tags=metrics_tags, sample_rate=1.0
+    )
+    metrics.incr("deliver_from_outbox.drained_shards", processed_count, tags=metrics_tags)
+    metrics.timing("deliver_from_outbox.batch_duration", duration, tags=metrics_tags)
+    if duration > 0:
+        metrics.distribution(
+            "deliver_from_outbox.drain_rate",
+            processed_count / duration,
+            tags=metrics_tags,
+            sample_rate=1.0,
+        )
+
     return processed_count
+
+
+def _drain_shard_in_thread(
+    outbox_model: type[OutboxBase], shard_attributes: Mapping[str, Any]
+) -> int:
+    try:
+        return _drain_scheduled_shard(outbox_model, shard_attributes)
+    finally:
+        # Worker threads open their own database connections, which would otherwise outlive them.
+        for connection in connections.all(initialized_only=True):
+            connection.close()
+
+
+def _drain_scheduled_shard(
+    outbox_model: type[OutboxBase], shard_attributes: Mapping[str, Any]
+) -> int:
+    shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
+    if not shard_outbox:
+        return 0
+
+    try:
+        shard_outbox.drain_shard(flush_all=True)
+    except Exception as e:
+        with sentry_sdk.push_scope() as scope:
+            if isinstance(e, OutboxFlushError):
+                scope.set_tag("outbox.category", e.outbox.category)
+                scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+                scope.set_context(
+                    "outbox",
+                    {
+                        "shard_identifier": e.outbox.shard_identifier,
+                        "object_identifier": e.outbox.object_identifier,
+                        "payload": e.outbox.payload,
+                    },
+                )
+            sentry_sdk.capture_exception(e)
+            # In production, it's ok to just continue processing forward, but in tests we aim to surface
+            # problems aggressively.
+            if in_test_environment():
+                raise
+    return 1
@@ -8,7 +8,7 @@ from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
 from sentry.silo import SiloMode
 from sentry.tasks.base import instrumented_task
-from sentry.utils import snuba
+from sentry.utils import metrics, snuba
 
 logger = logging.getLogger(__name__)
 
@@ -25,17 +25,28 @@ def schedule_digests():
 
     # The maximum (but hopefully not typical) expected delay can be roughly
     # calculated by adding together the schedule interval, the # of shards *
-    # schedule timeout (at least until these are able to be processed in
-    # parallel), the expected duration of time an item spends waiting in the
+    # schedule timeout (divided by the backend's schedule concurrency), the
+    # expected duration of time an item spends waiting in the
     # queue to be processed for delivery and the expected duration of time an
     # item takes to be processed for delivery, so this timeout should be
     # relatively high to avoid requeueing items before they even had a chance
     # to be processed.
     timeout = 300
-    digests.maintenance(deadline - timeout)
+    with metrics.timer("digests.maintenance.duration"):
+        digests.maintenance(deadline - timeout)
+
+    scheduled = 0
+    with metrics.timer("digests.schedule.duration"):
+        for entry in digests.schedule(deadline):
+            # How long the timeline waited past its scheduled time before being
+            # picked up, a growing lag means scheduling is falling behind.
+            metrics.distribution(
+                "digests.schedule.lag", max(0.0, deadline - entry.timestamp), unit="second"
+            )
+            deliver_digest.delay(entry.key, entry.timestamp)
+            scheduled += 1
 
-    for entry in digests.schedule(deadline):
-        deliver_digest.delay(entry.key, entry.timestamp)
+    metrics.distribution("digests.schedule.scheduled", scheduled)
 
 
 @instrumented_task(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import re
 import uuid
 from collections.abc import Generator, Mapping
 from contextlib import nullcontext
@@ -142,6 +143,49 @@ def loads(
             return _default_decoder.decode(value)
 
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_array(value: str | bytes) -> Generator[JSONData, None, None]:
+    """
+    Lazily decode the elements of a top-level JSON array, one at a time.
+
+    The input is still decoded to a single `str`, but unlike `loads` the decoded elements are
+    not all held in memory at once, only the one currently being consumed.
+    """
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+
+    idx = _WHITESPACE.match(value).end()
+    if value[idx : idx + 1] != "[":
+        raise JSONDecodeError("Expecting '['", value, idx)
+
+    idx = _WHITESPACE.match(value, idx + 1).end()
+    if value[idx : idx + 1] == "]":
+        _check_end(value, idx + 1)
+        return
+
+    while True:
+        item, idx = _default_decoder.raw_decode(value, idx)
+        yield item
+
+        idx = _WHITESPACE.match(value, idx).end()
+        delimiter = value[idx : idx + 1]
+        if delimiter == "]":
+            _check_end(value, idx + 1)
+            return
+        elif delimiter != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", value, idx)
+        idx = _WHITESPACE.match(value, idx + 1).end()
+
+
+def _check_end(value: str, idx: int) -> None:
+    # Like `loads`, only whitespace may follow the end of the document.
+    idx = _WHITESPACE.match(value, idx).end()
+    if idx != len(value):
+        raise JSONDecodeError("Extra data", value, idx)
+
+
 def dumps_htmlsafe(value: object) -> SafeString:
     return mark_safe(_default_escaped_encoder.encode(value))
 
@@ -1,5 +1,8 @@
-from sentry.api.serializers import Serializer, serialize
+from unittest import mock
+
+from sentry.api.serializers import Lookup, Serializer, run_lookups, serialize
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import control_silo_test
 
 
@@ -33,6 +36,44 @@ class ParentSerializer(Serializer):
         }
 
 
+class LookupChildSerializer(Serializer):
+    def __init__(self, lookup):
+        self.lookup = lookup
+
+    def get_attrs(self, item_list, user, **kwargs):
+        shared, own = run_lookups(
+            [
+                Lookup(key="shared", func=self.lookup),
+                Lookup(key=("own", len(item_list)), func=lambda: len(item_list)),
+            ]
+        )
+        return {item: {"shared": shared, "own": own} for item in item_list}
+
+    def serialize(self, obj, attrs, user, **kwargs):
+        return attrs
+
+
+class LookupParentSerializer(Serializer):
+    def __init__(self, lookup):
+        self.lookup = lookup
+
+    def get_attrs(self, item_list, user, **kwargs):
+        shared, count = run_lookups(
+            [
+                Lookup(key="shared", func=self.lookup),
+                Lookup(key="count", func=lambda: len(item_list)),
+            ]
+        )
+        return {item: {"shared": shared, "count": count} for item in item_list}
+
+    def serialize(self, obj, attrs, user, **kwargs):
+        return {
+            "shared": attrs["shared"],
+            "count": attrs["count"],
+            "children": serialize([Foo(), Foo()], serializer=LookupChildSerializer(self.lookup)),
+        }
+
+
 @control_silo_test
 class BaseSerializerTest(TestCase):
     def test_serialize(self):
@@ -78,3 +119,22 @@ class BaseSerializerTest(TestCase):
         result = serialize(foo, serializer=ParentSerializer())
         assert result["parent"] == "something"
         assert result["child"] is None
+
+    def test_lookups_are_shared_by_nested_serializers(self):
+        for concurrency in (1, 2):
+            lookup = mock.Mock(return_value="value")
+            with override_options({"api.serializers.lookup-concurrency": concurrency}):
+                result = serialize([Foo(), Foo()], serializer=LookupParentSerializer(lookup))
+
+            assert result == [
+                {
+                    "shared": "value",
+                    "count": 2,
+                    "children": [{"shared": "value", "own": 2}, {"shared": "value", "own": 2}],
+                }
+            ] * 2
+            assert lookup.call_count == 1
+
+            # Lookups are not shared between responses
+            serialize(Foo(), serializer=LookupParentSerializer(lookup))
+            assert lookup.call_count == 2
@@ -14,6 +14,7 @@ from sentry.api.event_search import (
     SearchFilter,
     SearchKey,
     SearchValue,
+    _parse_cached_search_tree,
     parse_search_query,
 )
 from sentry.constants import MODULE_ROOT
@@ -224,6 +225,25 @@ class ParseSearchQueryBackendTest(SimpleTestCase):
             ),
         ]
 
+    def test_parse_tree_cache(self):
+        _parse_cached_search_tree.cache_clear()
+        query = "timestamp:-24h user.email:foo@example.com"
+
+        with freeze_time("2018-01-01 12:00:00"):
+            first = parse_search_query(query)
+        with freeze_time("2018-01-02 12:00:00"):
+            second = parse_search_query(query)
+
+        assert _parse_cached_search_tree.cache_info().hits == 1
+        # Relative filters are resolved on every call, only the tree is shared
+        assert first[0].value.raw_value == datetime.datetime(
+            2017, 12, 31, 12, tzinfo=datetime.timezone.utc
+        )
+        assert second[0].value.raw_value == datetime.datetime(
+            2018, 1, 1, 12, tzinfo=datetime.timezone.utc
+        )
+        assert first[1] == second[1]
+
     @patch("sentry.search.events.builder.QueryBuilder.get_field_type")
     def test_size_filter(self, mock_type):
         config = SearchConfig()
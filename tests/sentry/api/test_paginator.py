@@ -26,6 +26,7 @@ from sentry.api.paginator import (
     CombinedQuerysetPaginator,
     DateTimePaginator,
     GenericOffsetPaginator,
+    KeysetPaginator,
     OffsetPaginator,
     Paginator,
     SequencePaginator,
@@ -33,6 +34,7 @@ from sentry.api.paginator import (
 )
 from sentry.incidents.models.alert_rule import AlertRule
 from sentry.incidents.models.incident import Incident
+from sentry.models.group import Group
 from sentry.models.rule import Rule
 from sentry.models.user import User
 from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
@@ -101,6 +103,76 @@ class PaginatorTest(TestCase):
         assert len(result3) == 0, (result3, list(result3))
 
 
+@region_silo_test
+class KeysetPaginatorTest(TestCase):
+    def test_pages_over_duplicate_keys(self):
+        groups = [self.create_group(times_seen=times_seen) for times_seen in (2, 1, 2, 1, 2)]
+        expected = sorted(groups, key=lambda group: (-group.times_seen, -group.id))
+
+        paginator = KeysetPaginator(Group.objects.all(), "-times_seen")
+        result1 = paginator.get_result(limit=2)
+        assert list(result1) == expected[:2]
+        assert result1.next
+        assert not result1.prev
+
+        result2 = paginator.get_result(limit=2, cursor=result1.next)
+        assert list(result2) == expected[2:4]
+        assert result2.next
+        assert result2.prev
+
+        result3 = paginator.get_result(limit=2, cursor=result2.next)
+        assert list(result3) == expected[4:]
+        assert not result3.next
+        assert result3.prev
+
+        result4 = paginator.get_result(limit=2, cursor=result3.prev)
+        assert list(result4) == expected[2:4]
+        assert result4.prev
+
+        result5 = paginator.get_result(limit=2, cursor=result4.prev)
+        assert list(result5) == expected[:2]
+        assert not result5.prev
+        assert result5.next
+
+    def test_empty_page_prev_includes_cursor_row(self):
+        groups = [self.create_group(times_seen=times_seen) for times_seen in (2, 1, 2, 1, 2)]
+
+        for order_by, sort_key in (
+            ("times_seen", lambda group: (group.times_seen, group.id)),
+            ("-times_seen", lambda group: (-group.times_seen, -group.id)),
+        ):
+            expected = sorted(groups, key=sort_key)
+            paginator = KeysetPaginator(Group.objects.all(), order_by)
+
+            result1 = paginator.get_result(limit=5)
+            assert list(result1) == expected
+
+            result2 = paginator.get_result(limit=2, cursor=result1.next)
+            assert list(result2) == []
+            assert result2.prev
+
+            result3 = paginator.get_result(limit=2, cursor=result2.prev)
+            assert list(result3) == expected[3:]
+
+    def test_deep_pages_do_not_offset(self):
+        groups = [self.create_group() for _ in range(3)]
+
+        paginator = KeysetPaginator(Group.objects.all(), "id")
+        result = paginator.get_result(limit=1, cursor=Cursor(groups[1].id, groups[1].id, False))
+        assert list(result) == [groups[2]]
+        assert result.next.offset == groups[2].id
+
+    def test_count_hits_is_cached(self):
+        self.create_group()
+        paginator = KeysetPaginator(Group.objects.filter(project=self.project), "id")
+        assert paginator.get_result(limit=1, count_hits=True).hits == 1
+
+        # New rows are only counted once the cached hits expire
+        self.create_group()
+        with self.assertNumQueries(1):
+            assert paginator.get_result(limit=1, count_hits=True).hits == 1
+
+
 @control_silo_test
 class OffsetPaginatorTest(TestCase):
     # offset paginator does not support dynamic limits on is_prev
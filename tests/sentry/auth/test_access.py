@@ -333,6 +333,46 @@ class FromUserTest(AccessFactoryTestCase):
             assert not result.has_project_scope(project_other, "project:write")
             assert result.has_project_scope(project_other, "project:read")
 
+    @with_feature("organizations:team-roles")
+    def test_has_projects_scope_from_team_role(self):
+        organization = self.create_organization()
+        team = self.create_team(organization=organization)
+        projects = [self.create_project(organization=organization, teams=[team]) for _ in range(3)]
+        team_other = self.create_team(organization=organization)
+        project_other = self.create_project(organization=organization, teams=[team_other])
+
+        user = self.create_user()
+        member = self.create_member(organization=organization, user=user)
+        self.create_team_membership(team, member, role="admin")
+
+        request = self.make_request(user=user)
+        results = [self.from_user(user, organization), self.from_request(request, organization)]
+        for result in results:
+            assert result.has_projects_scope(projects, "project:write")
+            assert not result.has_projects_scope([*projects, project_other], "project:write")
+
+            # The teams of every project are memoized by the first bulk check
+            with self.assertNumQueries(0):
+                for project in projects:
+                    assert result.has_project_scope(project, "project:admin")
+                assert not result.has_project_scope(project_other, "project:admin")
+
+    def test_has_projects_scope_without_team_roles(self):
+        organization = self.create_organization()
+        team = self.create_team(organization=organization)
+        projects = [self.create_project(organization=organization, teams=[team]) for _ in range(3)]
+
+        user = self.create_user()
+        member = self.create_member(organization=organization, user=user)
+        self.create_team_membership(team, member, role="admin")
+
+        request = self.make_request(user=user)
+        results = [self.from_user(user, organization), self.from_request(request, organization)]
+        for result in results:
+            assert not result.has_projects_scope(projects, "project:write")
+            # Project teams are only loaded when team roles can grant scopes
+            assert "_project_team_ids" not in vars(result)
+
     def test_unlinked_sso(self):
         user = self.create_user()
         organization = self.create_organization(owner=user)
@@ -907,8 +947,11 @@ class DefaultAccessTest(TestCase):
         assert not result.has_project_access(Mock())
         assert not result.has_projects_access([Mock()])
         assert not result.has_project_scope(Mock(), "project:read")
+        assert not result.has_projects_scope([Mock()], "project:read")
         assert not result.has_project_membership(Mock())
         assert not result.permissions
+        # The shared instance never loads project teams
+        assert "_project_team_ids" not in vars(result)
 
 
 @no_silo_test
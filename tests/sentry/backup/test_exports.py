@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import io
 import tempfile
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
+
+import pytest
 
 from sentry.backup.comparators import get_default_comparators
 from sentry.backup.dependencies import NormalizedModelName, get_model, get_model_name
+from sentry.backup.exports import ExportingError, _JSONArrayWriter, export_in_global_scope
+from sentry.backup.findings import InstanceID
 from sentry.backup.scopes import ExportScope
 from sentry.backup.validate import validate
 from sentry.db import models
@@ -18,7 +24,10 @@ from sentry.models.useremail import UserEmail
 from sentry.models.userip import UserIP
 from sentry.models.userpermission import UserPermission
 from sentry.models.userrole import UserRole, UserRoleUser
+from sentry.services.hybrid_cloud.import_export.model import RpcExportError
+from sentry.services.hybrid_cloud.import_export.service import ImportExportService
 from sentry.testutils.helpers.backups import (
+    NOOP_PRINTER,
     BackupTestCase,
     ValidationError,
     export_to_encrypted_tarball,
@@ -26,6 +35,7 @@ from sentry.testutils.helpers.backups import (
 )
 from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.silo import region_silo_test
+from sentry.utils import json
 from sentry.utils.json import JSONData
 from tests.sentry.backup import get_matching_exportable_models
 
@@ -52,6 +62,38 @@ class ExportTestCase(BackupTestCase):
         return export_to_encrypted_tarball(tmp_path, scope=scope, filter_by=filter_by)
 
 
+@region_silo_test
+class ExportErrorTests(ExportTestCase):
+    def test_failed_export_writes_nothing(self):
+        self.create_exhaustive_user("user")
+        get_exporter_for_model = ImportExportService.get_exporter_for_model
+        calls = 0
+
+        def get_failing_exporter(model):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return get_exporter_for_model(model)
+
+            def export_by_model(**kwargs):
+                return RpcExportError(
+                    on=InstanceID(model=kwargs["model_name"], ordinal=None), reason="test"
+                )
+
+            return export_by_model
+
+        dest = io.BytesIO()
+        with patch.object(
+            ImportExportService, "get_exporter_for_model", side_effect=get_failing_exporter
+        ):
+            with pytest.raises(ExportingError):
+                export_in_global_scope(dest, printer=NOOP_PRINTER)
+
+        # The models exported before the error are not written to the destination
+        assert calls == 2
+        assert dest.getvalue() == b""
+
+
 @region_silo_test
 class ScopingTests(ExportTestCase):
     """
@@ -322,3 +364,30 @@ class FilteringTests(ExportTestCase):
             assert self.count(data, UserRole) == 1
             assert self.count(data, UserRoleUser) == 1
             assert self.count(data, UserPermission) == 1
+
+
+def test_json_array_writer_splices_batches():
+    out = io.StringIO()
+    writer = _JSONArrayWriter(out)
+    batches = [
+        '[\n  {\n    "model": "sentry.user",\n    "pk": 1\n  }\n]',
+        "[]",
+        '[{"model": "sentry.email", "pk": 1}, {"model": "sentry.email", "pk": 2}]',
+    ]
+    for batch in batches:
+        writer.write_batch(batch)
+    writer.close()
+
+    # The output matches dumping all the models at once
+    assert out.getvalue() == json.dumps(
+        [json_model for batch in batches for json_model in json.loads(batch)]
+    )
+
+
+def test_json_array_writer_empty():
+    out = io.StringIO()
+    writer = _JSONArrayWriter(out)
+    writer.write_batch("[\n]")
+    writer.close()
+
+    assert out.getvalue() == "[]"
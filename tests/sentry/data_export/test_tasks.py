@@ -10,6 +10,7 @@ from sentry.models.files.file import File
 from sentry.search.events.constants import TIMEOUT_ERROR_MESSAGE
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import region_silo_test
 from sentry.utils.samples import load_data
 from sentry.utils.snuba import (
@@ -687,6 +688,36 @@ class AssembleDownloadLargeTest(TestCase, SnubaTestCase):
 
         assert emailer.called
 
+    @patch("sentry.data_export.tasks.MAX_BATCH_SIZE", 200)
+    @patch("sentry.data_export.tasks.connections")
+    @patch("sentry.snuba.discover.query")
+    @patch("sentry.data_export.models.ExportedData.email_success")
+    def test_discover_concurrent_fragments(self, emailer, mock_query, mock_connections):
+        transactions = [f"/event/{i:03d}/" for i in range(50)]
+
+        def query(offset, limit, **kwargs):
+            return {"data": [{"transaction": t} for t in transactions[offset : offset + limit]]}
+
+        mock_query.side_effect = query
+        de = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.org,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={"project": [self.project.id], "field": ["transaction"], "query": ""},
+        )
+        with override_options({"data-export.max-concurrent-fragments": 4}), self.tasks():
+            assemble_download(de.id, batch_size=3)
+        de = ExportedData.objects.get(id=de.id)
+        assert de.date_finished is not None
+        assert emailer.called
+
+        with de._get_file().getfile() as f:
+            header, *rows = f.read().strip().split(b"\r\n")
+        assert header == b"transaction"
+        assert rows == [t.encode() for t in transactions]
+        # The worker threads close their database connections
+        assert mock_connections.close_all.called
+
 
 class MergeExportBlobsTest(TestCase, SnubaTestCase):
     def test_task_persistent_name(self):
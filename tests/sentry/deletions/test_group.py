@@ -1,7 +1,7 @@
 from unittest import mock
 from uuid import uuid4
 
-from sentry import nodestore
+from sentry import deletions, nodestore
 from sentry.deletions.defaults.group import EventDataDeletionTask
 from sentry.eventstore.models import Event
 from sentry.models.eventattachment import EventAttachment
@@ -15,6 +15,7 @@ from sentry.models.userreport import UserReport
 from sentry.tasks.deletion.groups import delete_groups
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import region_silo_test
 
 
@@ -126,6 +127,36 @@ class DeleteGroupTest(TestCase, SnubaTestCase):
         assert Group.objects.filter(id=self.keep_event.group_id).exists()
         assert nodestore.backend.get(keep_node_id)
 
+    @override_options({"deletions.nodestore.batch-size": 1})
+    def test_event_data_resumes_from_checkpoint(self):
+        group = self.event.group
+        task = EventDataDeletionTask(
+            deletions.default_manager, groups=[group], transaction_id=uuid4().hex
+        )
+        task.DEFAULT_CHUNK_SIZE = 1
+        assert task.chunk()
+        assert task.last_event is not None
+        # The most recent event id is removed first.
+        assert nodestore.backend.get(self.node_id)
+        assert not nodestore.backend.get(self.node_id2)
+
+        resumed = EventDataDeletionTask(
+            deletions.default_manager, groups=[group], transaction_id=task.transaction_id
+        )
+        resumed.DEFAULT_CHUNK_SIZE = 1
+        assert resumed.last_event == task.last_event
+        assert resumed.chunk()
+        assert not nodestore.backend.get(self.node_id)
+        assert not EventAttachment.objects.filter(event_id=self.event.event_id).exists()
+
+        assert not resumed.chunk()
+
+        restarted = EventDataDeletionTask(
+            deletions.default_manager, groups=[group], transaction_id=task.transaction_id
+        )
+        assert restarted.last_event is None
+        assert nodestore.backend.get(self.node_id3)
+
     @mock.patch("os.environ.get")
     @mock.patch("sentry.nodestore.delete_multi")
     def test_cleanup(self, nodestore_delete_multi, os_environ):
@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 import pytest
 
@@ -114,6 +115,24 @@ class RedisBackendTestCase(TestCase):
             expected_keys = {f"record:{i}" for i in range(10, 20)}
             assert {record.key for record in records} == expected_keys
 
+    def test_schedule_concurrently(self):
+        backend = RedisBackend(schedule_concurrency=4)
+        for timeline in ("timeline:1", "timeline:2"):
+            backend.add(timeline, Record("record:1", "value", time.time()))
+            with backend.digest(timeline, 0) as records:
+                assert len(records) == 1
+            backend.add(timeline, Record("record:2", "value", time.time()))
+
+        client = backend._get_connection("timeline:1")
+        with mock.patch.object(
+            backend.cluster, "hosts", {host: None for host in range(3)}
+        ), mock.patch.object(backend.cluster, "get_local_client", return_value=client):
+            # Every fake host is backed by the same redis instance, so only the
+            # first host to be scheduled will see the ready timelines.
+            entries = list(backend.schedule(time.time()))
+
+        assert {entry.key for entry in entries} == {"timeline:1", "timeline:2"}
+
     def test_delete(self):
         backend = RedisBackend()
         backend.add("timeline", Record("record:1", "value", time.time()))
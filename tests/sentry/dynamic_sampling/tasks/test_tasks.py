@@ -448,6 +448,36 @@ class TestBoostLowVolumeTransactionsTasks(TasksTestCase):
                     )  # check we have some rate calculated for each transaction
                 assert global_rate == BLENDED_RATE
 
+    @with_feature("organizations:dynamic-sampling")
+    @patch(
+        "sentry.dynamic_sampling.tasks.boost_low_volume_transactions.boost_low_volume_transactions_of_project.delay"
+    )
+    @patch("sentry.quotas.backend.get_blended_sample_rate")
+    def test_boost_low_volume_transactions_batched(
+        self, get_blended_sample_rate, boost_low_volume_transactions_of_project
+    ):
+        """
+        Create orgs projects & transactions and then check that the projects are rebalanced in
+        batches and their rebalancing data is stored in Redis.
+        """
+        BLENDED_RATE = 0.25
+        get_blended_sample_rate.return_value = BLENDED_RATE
+
+        with self.options({"dynamic-sampling.prioritise_transactions.projects_per_task": 2}):
+            with self.tasks():
+                boost_low_volume_transactions()
+
+        boost_low_volume_transactions_of_project.assert_not_called()
+        for org in self.orgs_info:
+            org_id = org["org_id"]
+            for proj_id in org["project_ids"]:
+                tran_rate, global_rate = get_transactions_resampling_rates(
+                    org_id=org_id, proj_id=proj_id, default_rate=0.1
+                )
+                for transaction_name in ["ts1", "ts2", "tm3", "tl4", "tl5"]:
+                    assert transaction_name in tran_rate
+                assert global_rate == BLENDED_RATE
+
     @with_feature("organizations:dynamic-sampling")
     @patch("sentry.quotas.backend.get_blended_sample_rate")
     def test_boost_low_volume_transactions_with_sliding_window_org(self, get_blended_sample_rate):
@@ -1,5 +1,5 @@
 import unittest
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from functools import cached_property
 from random import randint
 from unittest import mock
@@ -34,19 +34,24 @@ from sentry.incidents.models.incident import (
 )
 from sentry.incidents.subscription_processor import (
     SubscriptionProcessor,
+    _run_grouped_comparison_query,
     build_alert_rule_stat_keys,
     build_alert_rule_trigger_stat_key,
+    build_comparison_value_cache_key,
     build_trigger_stat_keys,
+    fetch_comparison_aggregates,
     get_alert_rule_stats,
+    get_comparison_window,
     get_redis_client,
     partition,
+    process_subscription_updates,
     update_alert_rule_stats,
 )
 from sentry.sentry_metrics.configuration import UseCaseKey
 from sentry.sentry_metrics.indexer.postgres.models import MetricsKeyIndexer
 from sentry.sentry_metrics.utils import resolve_tag_key, resolve_tag_value
 from sentry.snuba.dataset import Dataset
-from sentry.snuba.models import QuerySubscription, SnubaQueryEventType
+from sentry.snuba.models import QuerySubscription, SnubaQuery, SnubaQueryEventType
 from sentry.testutils.cases import BaseMetricsTestCase, SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import freeze_time, iso_format
 from sentry.testutils.silo import region_silo_test
@@ -379,6 +384,51 @@ class ProcessUpdateTest(ProcessUpdateBaseClass):
             [(trigger.alert_threshold + 1, IncidentStatus.CRITICAL, uuid)],
         )
 
+    def test_process_subscription_updates(self):
+        rule = self.rule
+        trigger = self.trigger
+        last_update = timezone.now().replace(microsecond=0) - timedelta(minutes=1)
+        updates = [
+            (
+                self.build_subscription_update(
+                    self.sub, value=trigger.alert_threshold - 1, time_delta=timedelta(minutes=-2)
+                ),
+                self.sub,
+            ),
+            (
+                self.build_subscription_update(
+                    self.sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-1)
+                ),
+                self.sub,
+            ),
+            (
+                self.build_subscription_update(
+                    self.other_sub,
+                    value=trigger.alert_threshold - 1,
+                    time_delta=timedelta(minutes=-1),
+                ),
+                self.other_sub,
+            ),
+        ]
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            self.capture_on_commit_callbacks(execute=True),
+        ):
+            process_subscription_updates(updates)
+
+        incident = self.assert_active_incident(rule)
+        self.assert_trigger_exists_with_status(incident, trigger, TriggerStatus.ACTIVE)
+        assert not self.active_incident_exists(rule, subscription=self.other_sub)
+
+        # Stats of both subscriptions are written once the batch has been processed.
+        for subscription in (self.sub, self.other_sub):
+            stats_last_update, alert_counts, resolve_counts = get_alert_rule_stats(
+                rule, subscription, [trigger]
+            )
+            assert stats_last_update == last_update
+            assert alert_counts[trigger.id] == 0
+            assert resolve_counts[trigger.id] == 0
+
     def test_alert_dedupe(self):
         # Verify that an alert rule that only expects a single update to be over the
         # alert threshold triggers correctly
@@ -2047,6 +2097,96 @@ class ProcessUpdateTest(ProcessUpdateBaseClass):
             incident, [self.action], [(50.0, IncidentStatus.CLOSED, mock.ANY)]
         )
 
+    def test_comparison_alert_grouped_query(self):
+        rule = self.comparison_rule_above
+        comparison_date = timezone.now() - timedelta(seconds=rule.comparison_delta)
+        for project, count in ((self.project, 4), (self.other_project, 2)):
+            for i in range(count):
+                self.store_event(
+                    data={"timestamp": iso_format(comparison_date - timedelta(minutes=30 + i))},
+                    project_id=project.id,
+                )
+
+        with mock.patch(
+            "sentry.incidents.subscription_processor._run_grouped_comparison_query",
+            wraps=_run_grouped_comparison_query,
+        ) as grouped_query:
+            # The first update fetches the comparison values of both projects, the second one is
+            # answered from the cache.
+            self.send_update(rule, 2, timedelta(minutes=-9), subscription=self.sub)
+            self.send_update(rule, 2, timedelta(minutes=-9), subscription=self.other_sub)
+            assert grouped_query.call_count == 1
+
+            timestamp = (timezone.now() - timedelta(minutes=9)).replace(microsecond=0)
+            assert fetch_comparison_aggregates(rule, [self.sub, self.other_sub], timestamp) == {
+                self.sub.id: 4,
+                self.other_sub.id: 2,
+            }
+            assert grouped_query.call_count == 1
+
+    def test_comparison_alert_metrics_dataset_not_grouped(self):
+        rule = self.create_alert_rule(
+            projects=[self.project, self.other_project],
+            dataset=Dataset.PerformanceMetrics,
+            query_type=SnubaQuery.Type.PERFORMANCE,
+            query="",
+            aggregate="count()",
+            time_window=60,
+            comparison_delta=60,
+        )
+        subscriptions = list(rule.snuba_query.subscriptions.order_by("id"))
+        assert len(subscriptions) == 2
+
+        with mock.patch(
+            "sentry.incidents.subscription_processor._run_comparison_query",
+            side_effect=lambda snuba_query, subscription, start, end: subscription.project_id,
+        ) as comparison_query, mock.patch(
+            "sentry.incidents.subscription_processor._run_grouped_comparison_query"
+        ) as grouped_query:
+            # Metrics datasets don't support the grouped query, each subscription is queried
+            assert fetch_comparison_aggregates(rule, subscriptions, timezone.now()) == {
+                subscription.id: subscription.project_id for subscription in subscriptions
+            }
+            assert comparison_query.call_count == 2
+            assert grouped_query.call_count == 0
+
+    def test_comparison_value_cache_jittered_timestamps(self):
+        rule = self.comparison_rule_above
+        snuba_query = self.sub.snuba_query
+        comparison_delta = timedelta(seconds=rule.comparison_delta)
+        resolution = snuba_query.resolution
+        bucket_start = datetime.fromtimestamp(
+            int(timezone.now().timestamp()) // resolution * resolution, UTC
+        )
+        # Both updates have their comparison window end within the same resolution bucket
+        timestamps = [
+            bucket_start + comparison_delta + timedelta(seconds=1),
+            bucket_start + comparison_delta + timedelta(seconds=resolution - 1),
+        ]
+        assert (
+            len(
+                {
+                    build_comparison_value_cache_key(
+                        self.sub.id,
+                        snuba_query,
+                        get_comparison_window(rule, snuba_query, timestamp)[1],
+                    )
+                    for timestamp in timestamps
+                }
+            )
+            == 1
+        )
+
+        with mock.patch(
+            "sentry.incidents.subscription_processor._run_comparison_query", return_value=4
+        ) as comparison_query, mock.patch(
+            "sentry.incidents.subscription_processor._run_grouped_comparison_query",
+            return_value={self.sub.id: 4, self.other_sub.id: 2},
+        ) as grouped_query:
+            for timestamp in timestamps:
+                assert fetch_comparison_aggregates(rule, [self.sub], timestamp) == {self.sub.id: 4}
+            assert comparison_query.call_count + grouped_query.call_count == 1
+
     def test_comparison_alert_different_aggregate(self):
         rule = self.comparison_rule_above
         update_alert_rule(rule, aggregate="count_unique(tags[sentry:user])")
@@ -13,6 +13,7 @@ from sentry.issues.escalating import (
     GroupsCountResponse,
     _start_and_end_dates,
     get_group_hourly_count,
+    incr_group_hourly_counts,
     is_escalating,
     query_groups_past_counts,
 )
@@ -25,6 +26,7 @@ from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.testutils.cases import BaseMetricsTestCase, PerformanceIssueTestCase, TestCase
 from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.helpers.features import with_feature
+from sentry.testutils.helpers.options import override_options
 from sentry.types.group import GroupSubStatus
 from sentry.utils.cache import cache
 from sentry.utils.snuba import to_start_of_hour
@@ -327,6 +329,21 @@ class DailyGroupCountsEscalating(BaseGroupCounts):
         # Events are aggregated in the hourly count query by date rather than the last 24hrs
         assert get_group_hourly_count(group) == 1
 
+    @freeze_time(TIME_YESTERDAY)
+    @override_options({"issues.escalating.hourly-counters": True})
+    def test_hourly_counters(self) -> None:
+        """Test the hourly count is read from the Redis counters once reconciled with Snuba"""
+        # Events from before the group was archived are only known to Snuba
+        group = self._create_events_for_group(count=3).group
+        assert group is not None
+        self.archive_until_escalating(group)
+        assert get_group_hourly_count(group) == 3
+
+        incr_group_hourly_counts([(group.id, datetime.now())] * 2)
+        with patch("sentry.issues.escalating.raw_snql_query") as raw_snql_query:
+            assert get_group_hourly_count(group) == 5
+            raw_snql_query.assert_not_called()
+
     @freeze_time(TIME_YESTERDAY)
     def test_is_forecast_out_of_range(self) -> None:
         """
@@ -1,7 +1,14 @@
-from datetime import datetime
+import random
+from datetime import datetime, timedelta
 from typing import Any
 
-from sentry.issues.escalating_issues_alg import generate_issue_forecast
+from sentry.issues.escalating_issues_alg import (
+    generate_issue_forecast,
+    generate_issue_forecasts,
+    looser_version,
+    standard_version,
+    tighter_version,
+)
 from sentry.tasks.weekly_escalating_forecast import GroupCount
 
 START_TIME = datetime.strptime("2022-07-27T00:00:00+00:00", "%Y-%m-%dT%H:%M:%S%f%z")
@@ -695,3 +702,29 @@ def test_output() -> None:
         {"forecasted_date": "2022-08-08", "forecasted_value": 6987},
         {"forecasted_date": "2022-08-09", "forecasted_value": 6987},
     ], "output is formatted incorrectly"
+
+
+def test_batch_forecasts_match_single_group_forecasts() -> None:
+    rng = random.Random(1234)
+    intervals = [
+        (START_TIME - timedelta(hours=hour)).strftime("%Y-%m-%dT%H:%M:%S%z")
+        for hour in range(168, 0, -1)
+    ]
+    group_counts: dict[int, GroupCount] = {
+        1: {"intervals": SEVEN_DAY_INPUT_INTERVALS, "data": SEVEN_DAY_ERROR_EVENTS},
+        2: {"intervals": SIX_DAY_INPUT_INTERVALS, "data": [5] * len(SIX_DAY_INPUT_INTERVALS)},
+        3: {"intervals": [], "data": []},
+    }
+    for group_id in range(4, 54):
+        scale = rng.choice([1, 10, 1000])
+        group_counts[group_id] = {
+            "intervals": intervals,
+            "data": [rng.randint(1, scale) for _ in intervals],
+        }
+
+    for alg_params in (standard_version, looser_version, tighter_version):
+        forecasts = generate_issue_forecasts(group_counts, START_TIME, alg_params)
+        assert forecasts == {
+            group_id: generate_issue_forecast(group_count, START_TIME, alg_params)
+            for group_id, group_count in group_counts.items()
+        }
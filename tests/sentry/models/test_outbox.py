@@ -29,7 +29,7 @@ from sentry.models.outbox import (
 )
 from sentry.models.user import User
 from sentry.silo import SiloMode
-from sentry.tasks.deliver_from_outbox import enqueue_outbox_jobs
+from sentry.tasks.deliver_from_outbox import drain_outbox_shards, enqueue_outbox_jobs
 from sentry.testutils.cases import TestCase, TransactionTestCase
 from sentry.testutils.factories import Factories
 from sentry.testutils.helpers.datetime import freeze_time
@@ -433,6 +433,26 @@ class OutboxDrainTest(TransactionTestCase):
 
         assert mock_process_region_outbox.call_count == 2
 
+    @patch("sentry.models.outbox.process_region_outbox.send")
+    def test_drain_outbox_shards_concurrently(self, mock_send):
+        outboxes = [Organization(id=i).outbox_for_update() for i in range(1, 5)]
+        outboxes.append(Organization(id=1).outbox_for_update())
+
+        with outbox_context(flush=False):
+            for outbox in outboxes:
+                outbox.save()
+
+        with self.options({"hybridcloud.outbox.drain.worker_threads": 3}):
+            drain_outbox_shards(
+                outbox_identifier_low=0,
+                outbox_identifier_hi=max(outbox.id for outbox in outboxes) + 1,
+                outbox_name="sentry.regionoutbox",
+            )
+
+        assert not RegionOutbox.objects.exists()
+        # Messages within the same shard are coalesced.
+        assert mock_send.call_count == 4
+
 
 @region_silo_test
 class RegionOutboxTest(TestCase):
@@ -14,7 +14,11 @@ from sentry.constants import ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    StoreMonitorCheckInStrategyFactory,
+    _prefetch_checkin_groups,
+    process_checkin_group,
+)
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -24,6 +28,7 @@ from sentry.monitors.models import (
     MonitorType,
     ScheduleType,
 )
+from sentry.monitors.types import CheckinItem
 from sentry.testutils.cases import TestCase
 from sentry.utils import json
 from sentry.utils.locking.manager import LockManager
@@ -562,6 +567,89 @@ class MonitorConsumerTest(TestCase):
 
         assert not MonitorCheckIn.objects.filter(guid=self.guid).exists()
 
+    def _make_checkin_item(self, monitor_slug: str, ts: datetime, **overrides: Any) -> CheckinItem:
+        payload = {
+            "monitor_slug": monitor_slug,
+            "status": "ok",
+            "duration": None,
+            "check_in_id": uuid.uuid4().hex,
+            "environment": "production",
+        }
+        payload.update(overrides)
+        return CheckinItem(
+            ts=ts,
+            partition=0,
+            message={
+                "message_type": "check_in",
+                "start_time": ts.timestamp(),
+                "project_id": self.project.id,
+                "payload": json.dumps(payload),
+                "sdk": "test/1.0",
+            },
+            payload=payload,
+        )
+
+    def test_batch_prefetch(self):
+        now = datetime.now()
+        monitor = self._create_monitor(slug="my-monitor")
+        environment = Environment.get_or_create(project=self.project, name="production")
+        monitor_environment = MonitorEnvironment.objects.create(
+            monitor=monitor, environment_id=environment.id
+        )
+
+        existing = [
+            self._make_checkin_item("my-monitor", now),
+            self._make_checkin_item("my-monitor", now),
+        ]
+        new_env = [self._make_checkin_item("my-monitor", now, environment="dev")]
+        missing = [self._make_checkin_item("other-monitor", now)]
+        checkin_mapping = {
+            existing[0].processing_key: existing,
+            new_env[0].processing_key: new_env,
+            missing[0].processing_key: missing,
+        }
+
+        with mock.patch("sentry.monitors.consumers.monitor_consumer.CHECKIN_QUOTA_LIMIT", 1):
+            prefetch = _prefetch_checkin_groups(checkin_mapping)
+
+        existing_prefetch = prefetch[existing[0].processing_key]
+        assert existing_prefetch.ratelimited == [False, True]
+        assert existing_prefetch.monitor_environment == monitor_environment
+        assert existing_prefetch.monitor_environment.monitor == monitor
+
+        assert prefetch[new_env[0].processing_key].ratelimited == [False]
+        assert prefetch[new_env[0].processing_key].monitor_environment is None
+        assert prefetch[missing[0].processing_key].monitor_environment is None
+
+        process_checkin_group(existing, existing_prefetch)
+        process_checkin_group(new_env, prefetch[new_env[0].processing_key])
+
+        checkins = MonitorCheckIn.objects.filter(monitor_id=monitor.id)
+        assert len(checkins) == 2
+        assert {checkin.monitor_environment.get_environment().name for checkin in checkins} == {
+            "production",
+            "dev",
+        }
+
+    def test_batch_prefetch_killswitch(self):
+        now = datetime.now()
+        self._create_monitor(slug="my-monitor")
+        items = [self._make_checkin_item("my-monitor", now)]
+        checkin_mapping = {items[0].processing_key: items}
+
+        opt_val = killswitches.validate_user_input(
+            "crons.organization.disable-check-in", [{"organization_id": self.organization.id}]
+        )
+        with self.options({"crons.organization.disable-check-in": opt_val}), mock.patch(
+            "sentry.monitors.consumers.monitor_consumer.bulk_check_ratelimits",
+            return_value=[],
+        ) as bulk_check_ratelimits:
+            prefetch = _prefetch_checkin_groups(checkin_mapping)
+
+        # Check-ins dropped by the killswitch don't count against the rate limit
+        bulk_check_ratelimits.assert_called_once_with([])
+        assert prefetch[items[0].processing_key].ratelimited == [None]
+
     @override_settings(MAX_MONITORS_PER_ORG=2)
     def test_monitor_limits(self):
         for i in range(settings.MAX_MONITORS_PER_ORG + 2):
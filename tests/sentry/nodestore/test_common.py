@@ -50,6 +50,17 @@ def test_set(ns):
     assert ns.get(node_id) == data
 
 
+@region_silo_test
+def test_set_multi(ns):
+    nodes = {"node_1": {"foo": "a"}, "node_2": {"foo": "b"}}
+    ns.set_subkeys("node_1", {None: {"foo": "old"}, "other": {"foo": "c"}})
+
+    ns.set_multi(nodes)
+    assert ns.get_multi(list(nodes)) == nodes
+    # Like `set`, existing subkeys are replaced
+    assert ns.get("node_1", subkey="other") is None
+
+
 @region_silo_test
 def test_delete(ns):
     node_id = "d2502ebbd7df41ceba8d3275595cac33"
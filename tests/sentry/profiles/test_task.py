@@ -3,6 +3,7 @@ from __future__ import annotations
 from os.path import join
 from tempfile import TemporaryFile
 from typing import Any
+from unittest import mock
 
 import pytest
 
@@ -10,11 +11,15 @@ from sentry.lang.javascript.processing import _handles_frame as is_valid_javascr
 from sentry.models.project import Project
 from sentry.profiles.task import (
     _calculate_profile_duration_ms,
+    _dedupe_sample_frames,
     _deobfuscate,
+    _expand_sample_frames,
     _normalize,
     _process_symbolicator_results_for_sample,
+    run_symbolicate_chunked,
 )
 from sentry.testutils.factories import Factories, get_fixture_path
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import json
 
@@ -583,6 +588,129 @@ def test_process_symbolicator_results_for_sample_js():
     assert profile["profile"]["stacks"] == [[0, 1, 2, 3]]
 
 
+def test_dedupe_and_expand_sample_frames():
+    stacktraces = [
+        {
+            "frames": [
+                {"instruction_addr": "0x3", "adjust_instruction_addr": False},
+                {"instruction_addr": "0x2"},
+                {"instruction_addr": "0x1"},
+            ]
+        },
+        {
+            "frames": [
+                {"instruction_addr": "0x2", "adjust_instruction_addr": False},
+                {"instruction_addr": "0x1"},
+            ]
+        },
+    ]
+
+    deduped, sample_frame_indices = _dedupe_sample_frames(stacktraces)
+
+    assert deduped == [
+        {
+            "frames": [
+                {"instruction_addr": "0x3", "adjust_instruction_addr": False},
+                {"instruction_addr": "0x2", "adjust_instruction_addr": True},
+                {"instruction_addr": "0x1", "adjust_instruction_addr": True},
+                # the leaf of a stack is distinct from the same address as a caller
+                {"instruction_addr": "0x2", "adjust_instruction_addr": False},
+            ]
+        }
+    ]
+    assert sample_frame_indices == [[0, 1, 2], [3, 2]]
+
+    # returned from symbolicator, with an inlined frame for 0x1
+    symbolicated = [
+        {
+            "frames": [
+                {"function": "c", "original_index": 0},
+                {"function": "b", "original_index": 1},
+                {"function": "a_inline", "original_index": 2},
+                {"function": "a", "original_index": 2},
+                {"function": "b", "original_index": 3},
+            ]
+        }
+    ]
+
+    assert _expand_sample_frames(symbolicated, sample_frame_indices) == [
+        {
+            "frames": [
+                {"function": "c", "original_index": 0},
+                {"function": "b", "original_index": 1},
+                {"function": "a_inline", "original_index": 2},
+                {"function": "a", "original_index": 2},
+            ]
+        },
+        {
+            "frames": [
+                {"function": "b", "original_index": 3},
+                {"function": "a_inline", "original_index": 2},
+                {"function": "a", "original_index": 2},
+            ]
+        },
+    ]
+
+
+@mock.patch("sentry.profiles.task.run_symbolicate")
+def test_run_symbolicate_chunked(run_symbolicate):
+    def symbolicate(project, profile, modules, stacktraces, platform):
+        frames = stacktraces[0]["frames"]
+        used = any(frame["instruction_addr"] == "0x4" for frame in frames)
+        return (
+            [{"debug_status": "found" if used else "unused"}],
+            [
+                {
+                    "frames": [
+                        {**frame, "function": f"f{frame['instruction_addr']}", "original_index": i}
+                        for i, frame in enumerate(frames)
+                    ]
+                }
+            ],
+            True,
+        )
+
+    run_symbolicate.side_effect = symbolicate
+    frames = [
+        {"instruction_addr": "0x1", "adjust_instruction_addr": False},
+        {"instruction_addr": "0x2"},
+        {"instruction_addr": "0x3"},
+        {"instruction_addr": "0x4"},
+        {"instruction_addr": "0x5"},
+    ]
+
+    with override_options({"profiling.symbolicate.frames-chunk-size": 2}):
+        modules, stacktraces, success = run_symbolicate_chunked(
+            project=None,
+            profile={},
+            modules=[{"debug_status": "unknown"}],
+            stacktraces=[{"frames": frames}],
+            platform="cocoa",
+        )
+
+    assert success
+    assert run_symbolicate.call_count == 3
+    assert modules == [{"debug_status": "found"}]
+    assert [frame["original_index"] for frame in stacktraces[0]["frames"]] == [0, 1, 2, 3, 4]
+    assert [frame["function"] for frame in stacktraces[0]["frames"]] == [
+        "f0x1",
+        "f0x2",
+        "f0x3",
+        "f0x4",
+        "f0x5",
+    ]
+    # the first frame of every chunk but the first one is explicitly adjusted
+    assert [frame.get("adjust_instruction_addr") for frame in stacktraces[0]["frames"]] == [
+        False,
+        None,
+        True,
+        None,
+        True,
+    ]
+    # the original frames are left untouched
+    assert "adjust_instruction_addr" not in frames[2]
+
+
 @django_db_all
 def test_decode_signature(project, android_profile):
     android_profile.update(
@@ -21,6 +21,18 @@ class RedisRateLimiterTest(TestCase):
             assert not self.backend.is_limited("foo", 1)
             assert self.backend.is_limited("foo", 1)
 
+    def test_bulk_is_limited(self):
+        with freeze_time("2000-01-01"):
+            assert self.backend.bulk_is_limited(["foo", "bar", "foo", "foo"], 2) == [
+                False,
+                False,
+                False,
+                True,
+            ]
+            assert self.backend.current_value("foo") == 3
+            assert self.backend.bulk_is_limited(["bar"], 2) == [False]
+            assert self.backend.bulk_is_limited([], 2) == []
+
     def test_correct_current_value(self):
         """Ensure that current_value get the correct value after the counter in incremented"""
 
@@ -461,3 +461,27 @@ class RecordingBufferedTestCase(RecordingTestCase):
             max_buffer_size_in_bytes=1000,
             max_buffer_time_in_seconds=1000,
         )
+
+    @patch("sentry.models.OrganizationOnboardingTask.objects.record")
+    @patch("sentry.analytics.record")
+    def test_bounded_upload_pool(self, mock_record, mock_onboarding_task):
+        factory = RecordingBufferedStrategyFactory(
+            max_buffer_message_count=1000,
+            max_buffer_size_in_bytes=1_000_000,
+            max_buffer_time_in_seconds=1000,
+            max_upload_workers=2,
+        )
+
+        with patch.object(self, "processing_factory", return_value=factory):
+            self.submit(
+                [
+                    message
+                    for segment_id in range(5)
+                    for message in self.nonchunked_messages(segment_id=segment_id)
+                ]
+            )
+
+        for segment_id in range(5):
+            assert self.get_recording_data(segment_id) == b'[{"hello":"world"}]'
+
+        factory.shutdown()
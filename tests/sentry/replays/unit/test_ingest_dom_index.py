@@ -12,6 +12,7 @@ from sentry.replays.usecases.ingest.dom_index import (
     _parse_classes,
     encode_as_uuid,
     get_user_actions,
+    iter_rrweb_events,
     log_canvas_size,
     parse_replay_actions,
 )
@@ -197,6 +198,24 @@ def test_get_user_actions_performance_spans():
     get_user_actions(1, uuid.uuid4().hex, events, None)
 
 
+def test_iter_rrweb_events():
+    events = [
+        {"type": 2, "data": {"node": {"type": 5, "textContent": "comment"}}},
+        {"type": 3, "data": {"source": 0, "adds": [{"node": {"type": 5}}]}},
+        {"type": 5, "data": {"tag": "breadcrumb", "payload": {"message": "[{]"}}},
+        {"type": 4, "data": {}},
+        {"data": {"tag": "performanceSpan"}, "type": 5},
+    ]
+    segment = json.dumps(events).encode()
+
+    assert list(iter_rrweb_events(segment, event_types=(5,))) == [events[2], events[4]]
+    assert list(iter_rrweb_events(segment, event_types=(2, 4))) == [events[0], events[3]]
+    assert list(iter_rrweb_events(b"[]", event_types=(5,))) == []
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_rrweb_events(b"[{]", event_types=(5,)))
+
+
 def test_parse_replay_actions():
     events = [
         {
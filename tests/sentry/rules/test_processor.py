@@ -17,7 +17,7 @@ from sentry.notifications.types import ActionTargetType
 from sentry.rules import init_registry
 from sentry.rules.conditions import EventCondition
 from sentry.rules.filters.base import EventFilter
-from sentry.rules.processor import RuleProcessor
+from sentry.rules.processor import RuleProcessor, compile_rule
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers import install_slack
 from sentry.testutils.silo import region_silo_test
@@ -372,6 +372,70 @@ class RuleProcessorTest(TestCase):
         # mock condition first.
         assert passes.call_count == 0
 
+    @patch(
+        "sentry.constants._SENTRY_RULES",
+        [
+            "sentry.mail.actions.NotifyEmailAction",
+            "sentry.rules.conditions.event_frequency.EventFrequencyCondition",
+            "tests.sentry.rules.test_processor.MockConditionTrue",
+        ],
+    )
+    def test_slow_conditions_evaluated_after_all_cheap_rules(self):
+        self.rule.update(
+            data={
+                "conditions": [
+                    {"id": "sentry.rules.conditions.event_frequency.EventFrequencyCondition"},
+                ],
+                "actions": [EMAIL_ACTION_DATA],
+            },
+        )
+        cheap_rule = Rule.objects.create(
+            project=self.group_event.project,
+            data={
+                "conditions": [{"id": "tests.sentry.rules.test_processor.MockConditionTrue"}],
+                "actions": [EMAIL_ACTION_DATA],
+            },
+        )
+        calls = []
+
+        def slow_passes(*args, **kwargs):
+            calls.append("slow")
+            return False
+
+        def fire_rule(processor, rule, *args, **kwargs):
+            calls.append(rule.id)
+
+        with patch("sentry.rules.processor.rules", init_registry()), patch(
+            "sentry.rules.conditions.event_frequency.BaseEventFrequencyCondition.passes",
+            side_effect=slow_passes,
+        ), patch.object(RuleProcessor, "fire_rule", autospec=True, side_effect=fire_rule):
+            rp = RuleProcessor(
+                self.group_event,
+                is_new=True,
+                is_regression=True,
+                is_new_group_environment=True,
+                has_reappeared=True,
+            )
+            rp.apply()
+
+        assert calls == [cheap_rule.id, "slow"]
+
+    def test_compile_rule(self):
+        rp = RuleProcessor(
+            self.group_event,
+            is_new=True,
+            is_regression=True,
+            is_new_group_environment=True,
+            has_reappeared=True,
+        )
+        compiled = compile_rule(self.rule, rp.get_rule_type)
+        assert compiled.condition_list == (EVERY_EVENT_COND_DATA,)
+        assert compiled.filter_list == ()
+        assert not compiled.has_slow_conditions
+
+        self.rule.update(data={**self.rule.data, "frequency": 60})
+        assert compile_rule(self.rule, rp.get_rule_type).frequency == 60
+
 
 class MockFilterTrue(EventFilter):
     id = "tests.sentry.rules.test_processor.MockFilterTrue"
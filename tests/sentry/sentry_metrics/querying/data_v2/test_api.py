@@ -14,6 +14,7 @@ from sentry.sentry_metrics.querying.data_v2 import (
     MetricsQueriesPlan,
     run_metrics_queries_plan,
 )
+from sentry.sentry_metrics.querying.data_v2.parsing import QueryParser
 from sentry.sentry_metrics.querying.errors import (
     InvalidMetricsQueryError,
     MetricsQueryExecutionError,
@@ -30,6 +31,7 @@ from sentry.snuba.metrics.naming_layer import TransactionMRI
 from sentry.testutils.cases import BaseMetricsTestCase, TestCase
 from sentry.testutils.helpers import with_feature
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 
 pytestmark = pytest.mark.sentry_metrics
 
@@ -220,6 +222,45 @@ class MetricsAPITestCase(TestCase, BaseMetricsTestCase):
         assert meta[0][1]["unit"] is not None
         assert meta[0][1]["scaling_factor"] is not None
 
+    @with_feature("organizations:ddm-metrics-api-unit-normalization")
+    def test_query_with_cached_query_plan(self) -> None:
+        query_1 = self.mql("sum", TransactionMRI.DURATION.value)
+
+        with override_options({"ddm.metrics-api.query-plan-cache-ttl": 60}):
+            for _ in range(2):
+                with patch(
+                    "sentry.sentry_metrics.querying.data_v2.api.QueryParser",
+                    wraps=QueryParser,
+                ) as query_parser:
+                    plan = (
+                        MetricsQueriesPlan()
+                        .declare_query("query_1", query_1)
+                        .apply_formula("$query_1")
+                    )
+                    results = self.run_query(
+                        metrics_queries_plan=plan,
+                        start=self.now() - timedelta(minutes=30),
+                        end=self.now() + timedelta(hours=1, minutes=30),
+                        interval=3600,
+                        organization=self.project.organization,
+                        projects=[self.project],
+                        environments=[],
+                        referrer="metrics.data.api",
+                    )
+                    data = results["data"]
+                    assert len(data) == 1
+                    assert data[0][0]["series"] == [
+                        None,
+                        self.to_reference_unit(12.0),
+                        self.to_reference_unit(9.0),
+                    ]
+                    assert data[0][0]["totals"] == self.to_reference_unit(21.0)
+                    meta = results["meta"]
+                    assert meta[0][1]["unit_family"] == UnitFamily.DURATION.value
+
+            # The second run reuses the plan prepared by the first one.
+            assert query_parser.call_count == 0
+
     @with_feature("organizations:ddm-metrics-api-unit-normalization")
     def test_query_with_one_aggregation_and_only_totals(self) -> None:
         query_1 = self.mql("sum", TransactionMRI.DURATION.value)
@@ -1,4 +1,5 @@
 from collections.abc import Mapping
+from unittest.mock import patch
 
 from sentry.sentry_metrics.configuration import UseCaseKey
 from sentry.sentry_metrics.indexer.base import FetchType, Metadata, UseCaseKeyCollection
@@ -6,6 +7,7 @@ from sentry.sentry_metrics.indexer.cache import CachingIndexer
 from sentry.sentry_metrics.indexer.postgres.postgres_v2 import PGStringIndexerV2, indexer_cache
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.cache import cache
 
 
@@ -41,3 +43,28 @@ class PostgresIndexerV2Test(TestCase):
         )
 
         assert indexer_cache.get("br", key) is None
+
+    def test_bulk_reverse_resolve_cache(self):
+        org_id = self.org2.id
+        results = self.indexer.bulk_record({self.use_case_id: {org_id: self.strings}})
+        ids = {results[self.use_case_id][org_id][string]: string for string in self.strings}
+
+        with override_options({"sentry-metrics.indexer.reverse-resolve-cache": True}):
+            assert self.indexer.bulk_reverse_resolve(self.use_case_id, org_id, ids.keys()) == ids
+
+            with patch.object(
+                self.indexer.indexer, "bulk_reverse_resolve"
+            ) as mock_bulk_reverse_resolve:
+                # Served by the process-local cache.
+                assert (
+                    self.indexer.bulk_reverse_resolve(self.use_case_id, org_id, ids.keys()) == ids
+                )
+                id, string = next(iter(ids.items()))
+                assert self.indexer.reverse_resolve(self.use_case_id, org_id, id) == string
+
+                # Served by the shared cache.
+                self.indexer._reverse_resolve_cache.clear()
+                assert (
+                    self.indexer.bulk_reverse_resolve(self.use_case_id, org_id, ids.keys()) == ids
+                )
+                assert mock_bulk_reverse_resolve.call_count == 0
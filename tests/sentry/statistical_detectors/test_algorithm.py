@@ -324,3 +324,47 @@ def test_moving_average_relative_change_detector(
 
     assert all_regressed == [payloads[i] for i in regressed_indices]
     assert all_improved == [payloads[i] for i in improved_indices]
+
+
+def test_moving_average_relative_change_detector_bulk_update():
+    now = datetime(2023, 8, 31, 11, 28, 52, tzinfo=timezone.utc)
+
+    detector = MovingAverageRelativeChangeDetector(
+        "transaction",
+        "endpoint",
+        min_data_points=6,
+        moving_avg_short_factory=lambda: ExponentialMovingAverage(2 / 21),
+        moving_avg_long_factory=lambda: ExponentialMovingAverage(2 / 41),
+        threshold=0.1,
+    )
+
+    raw_states: list[Mapping[str | bytes, bytes | float | int | str]] = [
+        {},
+        MovingAverageDetectorState(
+            timestamp=now, count=10, moving_avg_short=1, moving_avg_long=1
+        ).to_redis_dict(),
+        MovingAverageDetectorState(
+            timestamp=now + timedelta(hours=2), count=10, moving_avg_short=1, moving_avg_long=1
+        ).to_redis_dict(),
+    ]
+    payloads = [
+        DetectorPayload(
+            project_id=1,
+            group=i,
+            fingerprint=str(i),
+            count=1,
+            value=10,
+            timestamp=now + timedelta(hours=1),
+        )
+        for i in range(len(raw_states))
+    ]
+
+    results = detector.bulk_update(raw_states, payloads)
+    assert results == [
+        detector.update(raw_state, payload) for raw_state, payload in zip(raw_states, payloads)
+    ]
+    assert [trend_type for trend_type, _, _ in results] == [
+        TrendType.Unchanged,
+        TrendType.Regressed,
+        TrendType.Skipped,
+    ]
@@ -4,8 +4,14 @@ from typing import Any
 
 import pytest
 
-from sentry.stacktraces.processing import find_stacktraces_in_data, get_crash_frame_from_event_data
+from sentry.stacktraces.processing import (
+    StacktraceProcessor,
+    find_stacktraces_in_data,
+    get_crash_frame_from_event_data,
+    get_stacktrace_processing_task,
+)
 from sentry.testutils.cases import TestCase
+from sentry.utils.cache import cache
 
 
 class FindStacktracesTest(TestCase):
@@ -156,6 +162,48 @@ class FindStacktracesTest(TestCase):
         assert len(infos[0].stacktrace["frames"]) == 3
 
 
+class _CachingProcessor(StacktraceProcessor):
+    def handles_frame(self, frame, stacktrace_info):
+        return True
+
+    def preprocess_frame(self, processable_frame):
+        processable_frame.set_cache_key_from_values(
+            (processable_frame["instruction_addr"], processable_frame.get("package"))
+        )
+
+
+class GetStacktraceProcessingTaskTest(TestCase):
+    def test_shared_cache_keys(self):
+        frame = {"instruction_addr": "0x1000", "package": "libfoo.so"}
+        data: dict[str, Any] = {
+            "project": self.project.id,
+            "platform": "native",
+            "exception": {"values": [{"stacktrace": {"frames": [dict(frame)]}}]},
+            "threads": {
+                "values": [
+                    {"stacktrace": {"frames": [dict(frame), {"instruction_addr": "0x2000"}]}}
+                ]
+            },
+        }
+        infos = find_stacktraces_in_data(data)
+        processor = _CachingProcessor(data, infos, self.project)
+
+        task = get_stacktrace_processing_task(infos, [processor])
+        frames = list(task.iter_processable_frames())
+        assert len(frames) == 3
+        assert frames[0].cache_key == frames[1].cache_key
+        assert frames[0].cache_key != frames[2].cache_key
+        assert all(f.cache_value is None for f in frames)
+
+        cache.set(frames[0].cache_key, "cached", 3600)
+        task.close()
+
+        task = get_stacktrace_processing_task(infos, [processor])
+        frames = list(task.iter_processable_frames())
+        assert [f.cache_value for f in frames] == ["cached", "cached", None]
+        task.close()
+
+
 @pytest.mark.parametrize(
     "event",
     [
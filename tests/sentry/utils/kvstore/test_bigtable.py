@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import functools
 import os
+from unittest import mock
 
 import pytest
+from google.api_core import exceptions
 
 from sentry.utils.kvstore.bigtable import BigtableKVStorage
 
@@ -80,3 +82,18 @@ def test_compression_compatibility(request, store_factory) -> None:
 
         for reader in stores.values():
             assert reader.get(key) == value
+
+
+def test_set_many_retries_once_with_new_table() -> None:
+    store = BigtableKVStorage(project="test", instance="test", table_name="test")
+    setattr(store, "_BigtableKVStorage__table", mock.sentinel.table)
+    items = [("key", b"value")]
+
+    with mock.patch.object(
+        store, "_set_many", side_effect=[exceptions.ServiceUnavailable("unavailable"), None]
+    ) as set_many:
+        store.set_many(items)
+
+    assert set_many.call_args_list == [mock.call(items, None), mock.call(items, None)]
+    # The cached table is dropped, so the retry uses a new client
+    assert not hasattr(store, "_BigtableKVStorage__table")
@@ -59,3 +59,13 @@ class JSONTest(TestCase):
     def test_loads_without_sdk_trace(self, start_span_mock):
         json.loads('{"test": "message"}', skip_trace=True)
         start_span_mock.assert_not_called()
+
+    def test_iter_array(self):
+        assert list(json.iter_array(b' [1, {"a": [1, 2]} ,"x"] ')) == [1, {"a": [1, 2]}, "x"]
+        assert list(json.iter_array("[]")) == []
+        assert list(json.iter_array(" [ ] ")) == []
+
+    def test_iter_array_invalid(self):
+        for value in ("{}", "[1 2]", "[1,", "[1", "[1]garbage", "[] x"):
+            with self.assertRaises(json.JSONDecodeError):
+                list(json.iter_array(value))
@@ -5,7 +5,7 @@ from uuid import uuid4
 import pytest
 from django.urls import NoReverseMatch, reverse
 
-from sentry import options
+from sentry import eventstore, options
 from sentry.issues.grouptype import NoiseConfig, PerformanceFileIOMainThreadGroupType
 from sentry.testutils.helpers import override_options
 from sentry.testutils.helpers.datetime import before_now, iso_format
@@ -912,6 +912,21 @@ class OrganizationEventsTraceEndpointTest(OrganizationEventsTraceEndpointBase):
         assert "tags" not in trace_transaction
         assert "measurements" not in trace_transaction
 
+    def test_simple_with_batched_prefetch(self):
+        self.load_trace()
+        with self.feature(self.FEATURES), mock.patch(
+            "sentry.api.endpoints.organization_events_trace.NODESTORE_BATCH_SIZE", 2
+        ), mock.patch.object(
+            eventstore.backend, "get_event_by_id", wraps=eventstore.backend.get_event_by_id
+        ) as get_event_by_id:
+            response = self.client_get(
+                data={"project": -1},
+            )
+        assert response.status_code == 200, response.content
+        self.assert_trace_data(response.data["transactions"][0])
+        # Nodestore data is bound in batches rather than fetched event by event
+        assert get_event_by_id.call_count == 0
+
     def test_detailed_trace(self):
         self.load_trace()
         with self.feature(self.FEATURES):
@@ -13,6 +13,7 @@ from sentry.rules.conditions.event_frequency import (
     EventFrequencyCondition,
     EventFrequencyPercentCondition,
     EventUniqueUserFrequencyCondition,
+    FrequencyQueryCache,
 )
 from sentry.testutils.abstract import Abstract
 from sentry.testutils.cases import PerformanceIssueTestCase, RuleTestCase, SnubaTestCase
@@ -241,6 +242,30 @@ class StandardIntervalTestBase(SnubaTestCase, RuleTestCase):
         self.assertDoesNotPass(environment_rule, event, is_new=True)
         assert mock_get_rate.call_count == 0
 
+    def test_query_cache_shared_between_rules(self):
+        query_cache = FrequencyQueryCache()
+        rule = self.get_rule(
+            data={"interval": "1h", "value": 1},
+            rule=Rule(environment_id=None),
+            query_cache=query_cache,
+        )
+        other_rule = self.get_rule(
+            data={"interval": "1h", "value": 5},
+            rule=Rule(environment_id=None),
+            query_cache=query_cache,
+        )
+        event = self.add_event(
+            data={"fingerprint": ["something_random"]},
+            project_id=self.project.id,
+            timestamp=before_now(minutes=1),
+        )
+
+        with patch.object(self.rule_cls, "query_hook", return_value=3) as query_hook:
+            self.assertPasses(rule, event, is_new=False)
+            self.assertDoesNotPass(other_rule, event, is_new=False)
+
+        assert query_hook.call_count == 1
+
 
 class EventFrequencyConditionTestCase(StandardIntervalTestBase):
     __test__ = Abstract(__module__, __qualname__)